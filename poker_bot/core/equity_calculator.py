@@ -104,8 +104,9 @@ def _simulate_hand_vs_range_chunk(
         rng.shuffle(available)
         runout = board + available[:cards_needed]
 
-        eval1 = HandEvaluator.evaluate(list(hand) + runout)
-        eval2 = HandEvaluator.evaluate([opp_card1, opp_card2] + runout)
+        eval1, eval2 = HandEvaluator.evaluate_batch(
+            (hand, (opp_card1, opp_card2)), runout,
+        )
 
         if eval1 > eval2:
             wins += 1
@@ -150,8 +151,7 @@ class EquityCalculator:
             deck = _available_deck(dead_cards)
             runout = board + deck[:cards_needed]
 
-            eval1 = HandEvaluator.evaluate(list(hand1) + runout)
-            eval2 = HandEvaluator.evaluate(list(hand2) + runout)
+            eval1, eval2 = HandEvaluator.evaluate_batch((hand1, hand2), runout)
 
             if eval1 > eval2:
                 wins += 1
@@ -218,8 +218,7 @@ class EquityCalculator:
             deck = _available_deck(dead_cards)
             runout = board + deck[:cards_needed]
 
-            eval1 = HandEvaluator.evaluate(list(hand) + runout)
-            eval2 = HandEvaluator.evaluate(opp_hand + runout)
+            eval1, eval2 = HandEvaluator.evaluate_batch((hand, opp_hand), runout)
 
             if eval1 > eval2:
                 wins += 1
@@ -294,8 +293,9 @@ class EquityCalculator:
             deck = _available_deck(dead_cards)
             runout = board + deck[:cards_needed]
 
-            eval1 = HandEvaluator.evaluate([c1.card1, c1.card2] + runout)
-            eval2 = HandEvaluator.evaluate([c2.card1, c2.card2] + runout)
+            eval1, eval2 = HandEvaluator.evaluate_batch(
+                ((c1.card1, c1.card2), (c2.card1, c2.card2)), runout,
+            )
 
             if eval1 > eval2:
                 wins += 1
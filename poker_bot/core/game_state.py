@@ -8,7 +8,7 @@ from poker_bot.utils.card import Card, Deck
 from poker_bot.utils.constants import Position, Street
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """State of a single player at the table."""
 
@@ -41,6 +41,12 @@ class GameState:
     current_street: Street = Street.PREFLOP
     current_bet: float = 0.0
     dealer_position: int = 0
+    # Running counts and seat-ordered player lists set by reset() and
+    # maintained by the simulation engine as players fold or go all-in.
+    active_count: int = 0
+    active_non_allin_count: int = 0
+    in_hand_players: list[PlayerState] = field(default_factory=list)
+    acting_players: list[PlayerState] = field(default_factory=list)
 
     def deal_hole_cards(self) -> None:
         """Deal 2 hole cards to each active player."""
@@ -89,6 +95,17 @@ class GameState:
 
         return self.current_street
 
+    def run_out_board(self) -> None:
+        """Deal all remaining community cards and move to the river.
+
+        Used once betting is closed (everyone but one player is all-in),
+        so per-street bets are not reset.
+        """
+        missing = 5 - len(self.community_cards)
+        if missing > 0:
+            self.deal_community_cards(missing)
+        self.current_street = Street.RIVER
+
     def reset(self) -> None:
         """Reset the game state for a new hand."""
         self.deck.reset()
@@ -98,6 +115,10 @@ class GameState:
         self.current_bet = 0.0
         for player in self.players:
             player.reset_for_hand()
+        self.in_hand_players = [p for p in self.players if p.is_active]
+        self.acting_players = list(self.in_hand_players)
+        self.active_count = len(self.in_hand_players)
+        self.active_non_allin_count = self.active_count
 
     @property
     def active_players(self) -> list[PlayerState]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 from itertools import combinations
 
@@ -10,7 +11,7 @@ from poker_bot.utils.card import Card
 from poker_bot.utils.constants import RANK_VALUES, HandRanking, Rank
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HandResult:
     """Result of evaluating a poker hand."""
 
@@ -79,7 +80,7 @@ class HandEvaluator:
     """Evaluates poker hands and determines the best 5-card combination."""
 
     @staticmethod
-    def evaluate(cards: list[Card]) -> HandResult:
+    def evaluate(cards: Sequence[Card]) -> HandResult:
         """Evaluate the best 5-card hand from a list of cards.
 
         Args:
@@ -102,6 +103,72 @@ class HandEvaluator:
         assert best is not None
         return best
 
+    @staticmethod
+    def evaluate_with_board(
+        hole_cards: Sequence[Card], board: Sequence[Card],
+    ) -> HandResult:
+        """Evaluate hole cards against a shared board.
+
+        Combinations are drawn from the two sequences directly, so no
+        combined hole + board list is built per call.
+
+        Args:
+            hole_cards: The player's hole cards.
+            board: Community cards (3 to 5).
+
+        Returns:
+            HandResult with the best hand ranking, cards, and kickers.
+
+        Raises:
+            ValueError: If fewer than 5 cards are provided.
+        """
+        return HandEvaluator.evaluate_batch((hole_cards,), board)[0]
+
+    @staticmethod
+    def evaluate_batch(
+        hands: Sequence[Sequence[Card]], board: Sequence[Card],
+    ) -> list[HandResult]:
+        """Evaluate several players' hole cards against one shared board.
+
+        The board-only five-card hand (on a complete board) is scored once
+        for all players; each player then only scores the combinations
+        that use at least one of their hole cards.
+
+        Args:
+            hands: Hole cards per player.
+            board: Community cards (3 to 5).
+
+        Returns:
+            One HandResult per entry in hands, in the same order.
+
+        Raises:
+            ValueError: If a hand plus the board has fewer than 5 cards.
+        """
+        board_only = (
+            HandEvaluator._evaluate_five(list(board)) if len(board) == 5 else None
+        )
+        board_combos = {
+            k: list(combinations(board, 5 - k)) for k in range(1, 3)
+        }
+        results: list[HandResult] = []
+        for hole in hands:
+            if len(hole) + len(board) < 5:
+                raise ValueError(
+                    f"Need at least 5 cards, got {len(hole) + len(board)}"
+                )
+            best = board_only
+            for k in range(1, min(len(hole), 2) + 1):
+                for hole_part in combinations(hole, k):
+                    for board_part in board_combos[k]:
+                        result = HandEvaluator._evaluate_five(
+                            [*hole_part, *board_part]
+                        )
+                        if best is None or result > best:
+                            best = result
+            assert best is not None
+            results.append(best)
+        return results
+
     @staticmethod
     def _evaluate_five(cards: list[Card]) -> HandResult:
         """Evaluate exactly 5 cards."""
@@ -40,7 +40,10 @@ Example session:
 
 from __future__ import annotations
 
+import math
 import sys
+from bisect import bisect_left
+from itertools import takewhile
 
 from poker_bot.core.game_context import (
     BlindLevel,
@@ -51,7 +54,7 @@ from poker_bot.core.game_context import (
 from poker_bot.core.game_state import GameState, PlayerState
 from poker_bot.core.hand_evaluator import HandEvaluator
 from poker_bot.interface.opponent_tracker import OpponentTracker
-from poker_bot.interface.situation_builder import build_game_objects
+from poker_bot.interface.situation_builder import build_postflop, build_preflop
 from poker_bot.solver.engine import SolverEngine
 from poker_bot.strategy.decision_maker import (
     ActionType,
@@ -104,16 +107,16 @@ def _parse_action_history(s: str) -> list[PriorAction]:
     s = s.strip()
     if not s:
         return []
-    actions = []
-    for part in s.split(","):
-        tokens = part.strip().split()
-        if len(tokens) < 2:
-            continue
-        pos = _parse_position(tokens[0])
-        action = Action(tokens[1].strip().upper())
-        amount = float(tokens[2]) if len(tokens) >= 3 else 0.0
-        actions.append(PriorAction(pos, action, amount))
-    return actions
+    entries = (part.split() for part in s.split(","))
+    return [
+        PriorAction(
+            Position(tokens[0].upper()),
+            Action(tokens[1].upper()),
+            float(tokens[2]) if len(tokens) >= 3 else 0.0,
+        )
+        for tokens in entries
+        if len(tokens) >= 2
+    ]
 
 
 def _hand_display(cards: list[Card]) -> str:
@@ -161,13 +164,24 @@ def _prompt_int(msg: str, default: int = 0) -> int:
 # ---------------------------------------------------------------------------
 
 
+_TOURNEY_PREFIXES = frozenset({"t", "T"})
+
+_PHASE_MAP = {
+    "early": TournamentPhase.EARLY,
+    "middle": TournamentPhase.MIDDLE,
+    "bubble": TournamentPhase.BUBBLE,
+    "itm": TournamentPhase.IN_THE_MONEY,
+    "final_table": TournamentPhase.FINAL_TABLE,
+}
+
+
 def _build_situation(big_blind_chips: float = 2.0) -> tuple[GameState, GameContext, int, list[PriorAction]] | None:
     """Interactively collect situation details. Returns None on abort."""
     print()
 
     # Game type
-    game_type = _prompt("Game type (cash/tournament)", "cash").lower()
-    is_tournament = game_type.startswith("t")
+    game_type = _prompt("Game type (cash/tournament)", "cash")
+    is_tournament = game_type[:1] in _TOURNEY_PREFIXES
 
     # Hero hand
     hand_str = _prompt("Your hand (e.g. AhKs)")
@@ -231,32 +245,39 @@ def _build_situation(big_blind_chips: float = 2.0) -> tuple[GameState, GameConte
     players_left = 0
     total_entries = 0
     if is_tournament:
-        phase_str = _prompt("Tournament phase (early/middle/bubble/itm/final_table)", "middle").lower()
-        phase_map = {
-            "early": TournamentPhase.EARLY,
-            "middle": TournamentPhase.MIDDLE,
-            "bubble": TournamentPhase.BUBBLE,
-            "itm": TournamentPhase.IN_THE_MONEY,
-            "final_table": TournamentPhase.FINAL_TABLE,
-        }
-        tournament_phase = phase_map.get(phase_str, TournamentPhase.MIDDLE)
+        phase_str = _prompt("Tournament phase (early/middle/bubble/itm/final_table)", "middle")
+        tournament_phase = _PHASE_MAP.get(phase_str.casefold(), TournamentPhase.MIDDLE)
         players_left = _prompt_int("Players remaining", 50)
         total_entries = _prompt_int("Total entries", 100)
 
-    gs, ctx = build_game_objects(
-        hero_cards=hero_cards,
-        position=position,
-        stack_bb=stack_bb,
-        street=street,
-        pot_bb=pot_bb,
-        current_bet_bb=current_bet_bb,
-        num_opponents=num_opponents,
-        community_cards=community_cards,
-        is_tournament=is_tournament,
-        tournament_phase=tournament_phase,
-        players_remaining=players_left,
-        total_entries=total_entries,
-    )
+    if street == Street.PREFLOP:
+        gs, ctx = build_preflop(
+            hero_cards=hero_cards,
+            position=position,
+            stack_bb=stack_bb,
+            pot_bb=pot_bb,
+            current_bet_bb=current_bet_bb,
+            num_opponents=num_opponents,
+            is_tournament=is_tournament,
+            tournament_phase=tournament_phase,
+            players_remaining=players_left,
+            total_entries=total_entries,
+        )
+    else:
+        gs, ctx = build_postflop(
+            hero_cards=hero_cards,
+            position=position,
+            stack_bb=stack_bb,
+            street=street,
+            pot_bb=pot_bb,
+            current_bet_bb=current_bet_bb,
+            num_opponents=num_opponents,
+            community_cards=community_cards,
+            is_tournament=is_tournament,
+            tournament_phase=tournament_phase,
+            players_remaining=players_left,
+            total_entries=total_entries,
+        )
 
     return gs, ctx, 0, action_history
 
@@ -311,12 +332,18 @@ def _print_recommendation(
         print(f"  Source:     {solver_result.source} (confidence: {solver_result.confidence:.0%})")
         if solver_result.ev != 0:
             print(f"  EV:         {solver_result.ev:+.2f} bb")
-        for af in sorted(solver_result.strategy.actions, key=lambda a: -a.frequency):
-            if af.frequency >= 0.01:
-                if af.amount > 0:
-                    print(f"    {af.action:<8} {af.frequency:5.1%}  ({af.amount:.1f} bb)")
-                else:
-                    print(f"    {af.action:<8} {af.frequency:5.1%}")
+        actions = solver_result.strategy.actions
+        top = max(actions, key=lambda a: a.frequency, default=None)
+        if top is not None and top.frequency > 0.99:
+            # Pure strategy: every other row is below the 1% display threshold
+            actions_sorted = [top]
+        else:
+            actions_sorted = sorted(actions, key=lambda a: -a.frequency)
+        for af in takewhile(lambda a: a.frequency >= 0.01, actions_sorted):
+            if af.amount > 0:
+                print(f"    {af.action:<8} {af.frequency:5.1%}  ({af.amount:.1f} bb)")
+            else:
+                print(f"    {af.action:<8} {af.frequency:5.1%}")
 
     # Analysis section
     if decision.equity > 0 or decision.pot_odds > 0:
@@ -330,7 +357,7 @@ def _print_recommendation(
     # Hand strength for post-flop
     if street != Street.PREFLOP and community_cards and len(hero_cards) >= 2:
         try:
-            hand_result = HandEvaluator.evaluate(hero_cards + community_cards)
+            hand_result = HandEvaluator.evaluate_with_board(hero_cards, community_cards)
             hand_strength = PostflopEngine._hand_strength_score(hand_result, community_cards)
             print(f"  Hand:       {hand_result.ranking.name} (strength: {hand_strength:.2f})")
         except ValueError:
@@ -407,6 +434,33 @@ _ACTION_RANK = {
 }
 
 
+# Sizing accuracy bands for a correct action, as user/optimal amount ratio:
+# [0.8, 1.2] optimal, [0.6, 1.5] slightly off, anything else needs work.
+# Lower bounds are inclusive, so they sit one ulp below the band edge.
+_SIZING_BOUNDS = (
+    math.nextafter(0.6, 0.0),
+    math.nextafter(0.8, 0.0),
+    1.2,
+    1.5,
+)
+_SIZING_BUCKETS = (
+    ("Acceptable", "Right action, but sizing needs work (optimal: {amount:.1f} bb)."),
+    ("Acceptable", "Right action, sizing slightly off (optimal: {amount:.1f} bb)."),
+    ("Optimal", "Correct action and sizing."),
+    ("Acceptable", "Right action, sizing slightly off (optimal: {amount:.1f} bb)."),
+    ("Acceptable", "Right action, but sizing needs work (optimal: {amount:.1f} bb)."),
+)
+
+
+# Grade with color-like emphasis
+_GRADE_MARKS = {
+    "Optimal": "[OK]",
+    "Acceptable": "[~]",
+    "Mistake": "[!]",
+    "Blunder": "[!!]",
+}
+
+
 def _grade_play(
     user_action: ActionType,
     user_amount: float,
@@ -424,13 +478,9 @@ def _grade_play(
             return "Optimal", "Correct play."
         # Check amount accuracy for raise/call
         if optimal.amount > 0:
-            ratio = user_amount / optimal.amount if optimal.amount else 1.0
-            if 0.8 <= ratio <= 1.2:
-                return "Optimal", "Correct action and sizing."
-            elif 0.6 <= ratio <= 1.5:
-                return "Acceptable", f"Right action, sizing slightly off (optimal: {optimal.amount:.1f} bb)."
-            else:
-                return "Acceptable", f"Right action, but sizing needs work (optimal: {optimal.amount:.1f} bb)."
+            ratio = user_amount / optimal.amount
+            grade, template = _SIZING_BUCKETS[bisect_left(_SIZING_BOUNDS, ratio)]
+            return grade, template.format(amount=optimal.amount)
         return "Optimal", "Correct play."
 
     if diff == 1:
@@ -508,15 +558,8 @@ def _hand_review(tracker: OpponentTracker) -> None:
     else:
         print(f"  Optimal play:  {optimal.action.value}")
 
-    # Grade with color-like emphasis
-    grade_marks = {
-        "Optimal": "[OK]",
-        "Acceptable": "[~]",
-        "Mistake": "[!]",
-        "Blunder": "[!!]",
-    }
     print()
-    print(f"  Grade: {grade_marks.get(grade, '')} {grade}")
+    print(f"  Grade: {_GRADE_MARKS.get(grade, '')} {grade}")
     print(f"  {explanation}")
 
     if optimal.equity > 0:
@@ -604,9 +647,20 @@ def _opponent_notes(tracker: OpponentTracker) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _warm_up() -> None:
+    """Run the hand evaluator once so the first post-flop display doesn't stall."""
+    try:
+        board = [Card.from_str(c) for c in ("Qc", "Jh", "Ts")]
+        hand_result = HandEvaluator.evaluate([Card.from_str("As"), Card.from_str("Kd")] + board)
+        PostflopEngine._hand_strength_score(hand_result, board)
+    except (ValueError, TypeError):
+        pass
+
+
 def run() -> None:
     """Main entry point for the poker coach."""
     tracker = OpponentTracker()
+    _warm_up()
 
     print()
     print("=" * 50)
@@ -39,6 +39,8 @@ def build_game_objects(
 ) -> tuple[GameState, GameContext]:
     """Build GameState and GameContext from validated input parameters.
 
+    Dispatches to build_preflop() or build_postflop() based on the street.
+
     Args:
         hero_cards: Exactly 2 cards for the hero.
         position: Hero's table position.
@@ -59,25 +61,133 @@ def build_game_objects(
     Raises:
         ValueError: If hero_cards doesn't contain exactly 2 cards.
     """
+    if street == Street.PREFLOP:
+        return build_preflop(
+            hero_cards=hero_cards,
+            position=position,
+            stack_bb=stack_bb,
+            pot_bb=pot_bb,
+            current_bet_bb=current_bet_bb,
+            num_opponents=num_opponents,
+            is_tournament=is_tournament,
+            tournament_phase=tournament_phase,
+            players_remaining=players_remaining,
+            total_entries=total_entries,
+        )
+    return build_postflop(
+        hero_cards=hero_cards,
+        position=position,
+        stack_bb=stack_bb,
+        street=street,
+        pot_bb=pot_bb,
+        current_bet_bb=current_bet_bb,
+        num_opponents=num_opponents,
+        community_cards=community_cards,
+        is_tournament=is_tournament,
+        tournament_phase=tournament_phase,
+        players_remaining=players_remaining,
+        total_entries=total_entries,
+    )
+
+
+def build_preflop(
+    hero_cards: list[Card],
+    position: Position,
+    stack_bb: float,
+    pot_bb: float,
+    current_bet_bb: float,
+    num_opponents: int,
+    is_tournament: bool = False,
+    tournament_phase: TournamentPhase | None = None,
+    players_remaining: int = 0,
+    total_entries: int = 0,
+) -> tuple[GameState, GameContext]:
+    """Build game objects for a preflop spot.
+
+    The street is fixed to PREFLOP and the board is always empty, so no
+    board-related inputs are accepted. Hero's posted blind is applied.
+
+    Raises:
+        ValueError: If hero_cards doesn't contain exactly 2 cards.
+    """
+    # Hero's posted blind, if any
+    if position == Position.BB and current_bet_bb <= 1.0:
+        hero_bet = 1.0  # Already posted BB
+    elif position == Position.SB:
+        hero_bet = 0.5  # Already posted SB
+    else:
+        hero_bet = 0.0
+
+    gs = GameState(
+        players=_build_players(hero_cards, position, stack_bb, num_opponents, hero_bet),
+        small_blind=0.5,
+        big_blind=1.0,
+        pot=pot_bb,
+        current_bet=current_bet_bb,
+        current_street=Street.PREFLOP,
+        community_cards=[],
+    )
+    ctx = _build_context(
+        stack_bb, num_opponents, is_tournament,
+        tournament_phase, players_remaining, total_entries,
+    )
+    return gs, ctx
+
+
+def build_postflop(
+    hero_cards: list[Card],
+    position: Position,
+    stack_bb: float,
+    street: Street,
+    pot_bb: float,
+    current_bet_bb: float,
+    num_opponents: int,
+    community_cards: list[Card] | None = None,
+    is_tournament: bool = False,
+    tournament_phase: TournamentPhase | None = None,
+    players_remaining: int = 0,
+    total_entries: int = 0,
+) -> tuple[GameState, GameContext]:
+    """Build game objects for a flop, turn or river spot.
+
+    Raises:
+        ValueError: If hero_cards doesn't contain exactly 2 cards.
+    """
+    gs = GameState(
+        players=_build_players(hero_cards, position, stack_bb, num_opponents, 0.0),
+        small_blind=0.5,
+        big_blind=1.0,
+        pot=pot_bb,
+        current_bet=current_bet_bb,
+        current_street=street,
+        community_cards=community_cards if community_cards is not None else [],
+    )
+    ctx = _build_context(
+        stack_bb, num_opponents, is_tournament,
+        tournament_phase, players_remaining, total_entries,
+    )
+    return gs, ctx
+
+
+def _build_players(
+    hero_cards: list[Card],
+    position: Position,
+    stack_bb: float,
+    num_opponents: int,
+    hero_bet: float,
+) -> list[PlayerState]:
+    """Build the hero (index 0) followed by num_opponents villains."""
     if len(hero_cards) != 2:
         raise ValueError(f"Need exactly 2 hero cards, got {len(hero_cards)}")
 
-    if community_cards is None:
-        community_cards = []
-
-    # Build hero player
     hero = PlayerState(
         name="Hero",
         chips=stack_bb,
         position=position,
         hole_cards=hero_cards,
         is_active=True,
+        current_bet=hero_bet,
     )
-    # Set hero's current_bet for blind positions
-    if position == Position.BB and street == Street.PREFLOP and current_bet_bb <= 1.0:
-        hero.current_bet = 1.0  # Already posted BB
-    elif position == Position.SB and street == Street.PREFLOP:
-        hero.current_bet = 0.5  # Already posted SB
 
     # Build villain players
     villain_positions = [p for p in _ALL_POSITIONS if p != position]
@@ -90,18 +200,18 @@ def build_game_objects(
             hole_cards=[],
             is_active=True,
         ))
+    return players
 
-    gs = GameState(
-        players=players,
-        small_blind=0.5,
-        big_blind=1.0,
-        pot=pot_bb,
-        current_bet=current_bet_bb,
-        current_street=street,
-        community_cards=community_cards,
-    )
 
-    # Build context
+def _build_context(
+    stack_bb: float,
+    num_opponents: int,
+    is_tournament: bool,
+    tournament_phase: TournamentPhase | None,
+    players_remaining: int,
+    total_entries: int,
+) -> GameContext:
+    """Build the cash or tournament GameContext."""
     if is_tournament:
         phase = tournament_phase or TournamentPhase.MIDDLE
         payout = PayoutStructure(
@@ -109,17 +219,14 @@ def build_game_objects(
             payouts={1: 0.25, 2: 0.15, 3: 0.10, 4: 0.08, 5: 0.06},
             total_entries=total_entries,
         )
-        ctx = GameContext.tournament(
+        return GameContext.tournament(
             stack_bb=stack_bb,
             phase=phase,
             players_remaining=players_remaining,
             payout_structure=payout,
             num_players=num_opponents + 1,
         )
-    else:
-        ctx = GameContext.cash_game(
-            stack_bb=stack_bb,
-            num_players=num_opponents + 1,
-        )
-
-    return gs, ctx
+    return GameContext.cash_game(
+        stack_bb=stack_bb,
+        num_players=num_opponents + 1,
+    )
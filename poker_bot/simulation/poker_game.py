@@ -9,9 +9,11 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from poker_bot.core.game_context import GameContext
 from poker_bot.core.game_state import GameState, PlayerState
-from poker_bot.core.hand_evaluator import HandEvaluator, HandResult
+from poker_bot.core.hand_evaluator import HandEvaluator
 from poker_bot.strategy.decision_maker import (
     ActionType,
     DecisionMaker,
@@ -28,6 +30,9 @@ from poker_bot.utils.constants import Action, HandRanking, Position, Street
 _PREFLOP_ORDER = [Position.UTG, Position.MP, Position.CO, Position.BTN, Position.SB, Position.BB]
 _POSTFLOP_ORDER = [Position.SB, Position.BB, Position.UTG, Position.MP, Position.CO, Position.BTN]
 
+# Uniforms drawn per refill of the villain random pool
+_RAND_POOL_SIZE = 64
+
 # 6-max seat assignment based on dealer index
 _SEATS_FROM_DEALER: list[Position] = [
     Position.BTN, Position.SB, Position.BB, Position.UTG, Position.MP, Position.CO,
@@ -39,7 +44,7 @@ _SEATS_FROM_DEALER: list[Position] = [
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class HandRecord:
     """Record of a single played hand."""
 
@@ -49,8 +54,39 @@ class HandRecord:
     community_cards: list[str]
     player_hands: dict[str, list[str]]
     winning_hand_ranking: HandRanking | None
-    actions_summary: list[str]
+    actions_log: list[tuple]
     hero_profit: float = 0.0
+    preflop_hero_actions: list[ActionType] = field(default_factory=list)
+
+    @property
+    def actions_summary(self) -> list[str]:
+        """The action log as display lines."""
+        return [_format_log_entry(entry) for entry in self.actions_log]
+
+
+def _format_log_entry(entry: tuple) -> str:
+    """Format one actions_log entry: a kind tag, then the values it shows."""
+    kind = entry[0]
+    if kind == "post":
+        _, name, position, blind, amount = entry
+        return f"{name} ({position}) posts {blind} {amount}"
+    if kind == "street":
+        _, street, board = entry
+        return f"--- {street} --- Board: {' '.join(str(c) for c in board)}"
+    if kind == "preflop":
+        return "--- PREFLOP ---"
+    if kind == "action":
+        _, name, position, action_type, amount = entry
+        return (
+            f"  {name} ({position}): {action_type.value}"
+            + (f" {amount:.0f}" if amount > 0 else "")
+        )
+    if kind == "fold_win":
+        _, name, pot = entry
+        return f"{name} wins pot of {pot:.0f} (everyone else folded)"
+    _, name, pot, ranking = entry  # "showdown"
+    hand_desc = ranking.name if ranking else "unknown"
+    return f"Showdown: {name} wins {pot:.0f} with {hand_desc}"
 
 
 # ---------------------------------------------------------------------------
@@ -66,13 +102,31 @@ class PokerGame:
         players: list[PlayerState],
         small_blind: float,
         big_blind: float,
+        seed: int | None = None,
+        rng: random.Random | None = None,
+        hero_index: int = 0,
     ) -> None:
         self.players = players
+        self.hero_index = hero_index
         self.small_blind = small_blind
         self.big_blind = big_blind
         self.decision_maker = DecisionMaker()
         self.dealer_index = 0
         self.hand_number = 0
+        self._by_pos: dict[Position, PlayerState] = {}
+        # _position_table[d][i]: position of seat i with the button on seat d
+        n = len(players)
+        self._position_table = [
+            [_SEATS_FROM_DEALER[(i - d) % n % len(_SEATS_FROM_DEALER)] for i in range(n)]
+            for d in range(n)
+        ]
+        self._ctx = GameContext.cash_game(stack_bb=0.0, num_players=len(players))
+        # All randomness (deck and villains) derives from one seedable source
+        self._rng = rng if rng is not None else random.Random(seed)
+        self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
+        self._deck = Deck(self._np_rng)
+        self._rand_pool = self._np_rng.random(_RAND_POOL_SIZE)
+        self._rand_idx = 0
 
     def play_hand(self) -> HandRecord:
         """Play a complete hand and return the record."""
@@ -87,17 +141,27 @@ class PokerGame:
             small_blind=self.small_blind,
             big_blind=self.big_blind,
             dealer_position=self.dealer_index,
+            deck=self._deck,
         )
         gs.reset()
 
         # Deal hole cards
         gs.deal_hole_cards()
 
+        # One context per hand; _hero_action refreshes the per-decision fields
+        self._ctx = GameContext.cash_game(
+            stack_bb=self.players[self.hero_index].chips / self.big_blind,
+            num_players=gs.active_count,
+        )
+
         # Track starting chips for profit calc
         starting_chips = {p.name: p.chips for p in self.players}
 
-        actions_summary: list[str] = []
+        # Structured entries; formatting them dominated simulation time, so
+        # lines are only built for the hands that get printed
+        actions_log: list[tuple] = []
         action_history: list[PriorAction] = []
+        preflop_hero_actions: list[ActionType] = []
 
         # Post blinds
         sb_player = self._player_at_position(Position.SB)
@@ -113,85 +177,74 @@ class PokerGame:
         gs.pot = sb_amount + bb_amount
         gs.current_bet = bb_amount
 
-        actions_summary.append(f"{sb_player.name} ({Position.SB}) posts SB {sb_amount}")
-        actions_summary.append(f"{bb_player.name} ({Position.BB}) posts BB {bb_amount}")
+        actions_log.append(("post", sb_player.name, Position.SB, "SB", sb_amount))
+        actions_log.append(("post", bb_player.name, Position.BB, "BB", bb_amount))
 
         # Run betting rounds
         for street in [Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER]:
             if gs.current_street != street:
-                if len([p for p in gs.players if p.is_active and not p.is_all_in]) <= 1:
+                if gs.active_non_allin_count <= 1:
                     # All but one folded or all-in — deal remaining boards
                     break
                 gs.next_street()
-                actions_summary.append(f"--- {street} --- Board: {' '.join(str(c) for c in gs.community_cards)}")
+                actions_log.append(("street", street, tuple(gs.community_cards)))
 
             if street == Street.PREFLOP:
-                actions_summary.append(f"--- PREFLOP ---")
+                actions_log.append(("preflop",))
 
             # Only run betting if 2+ players can still act
-            active_non_allin = [p for p in gs.players if p.is_active and not p.is_all_in]
-            if len(active_non_allin) < 2:
+            if gs.active_non_allin_count < 2:
                 continue
 
             action_history_street: list[PriorAction] = []
             finished = self._run_betting_round(
-                gs, street, action_history_street, actions_summary,
+                gs, street, action_history_street, actions_log,
+                preflop_hero_actions,
             )
             action_history.extend(action_history_street)
 
-            if len([p for p in gs.players if p.is_active]) <= 1:
+            if gs.active_count <= 1:
                 break
 
         # Deal remaining community cards if needed (all-in before board complete)
-        active_count = len([p for p in gs.players if p.is_active])
-        if active_count > 1:
-            while len(gs.community_cards) < 5:
-                if gs.current_street == Street.PREFLOP:
-                    gs.next_street()  # Deals flop (3 cards)
-                elif gs.current_street == Street.FLOP:
-                    gs.next_street()  # Deals turn (1 card)
-                elif gs.current_street == Street.TURN:
-                    gs.next_street()  # Deals river (1 card)
-                else:
-                    break
+        board = gs.community_cards
+        if gs.active_count > 1 and len(board) < 5:
+            gs.run_out_board()
 
         # Showdown or last-man-standing
-        active = [p for p in gs.players if p.is_active]
         winner_name = ""
         winning_ranking: HandRanking | None = None
-        player_hands: dict[str, list[str]] = {}
-
-        for p in gs.players:
-            if p.hole_cards:
-                player_hands[p.name] = [str(c) for c in p.hole_cards]
+        active = gs.in_hand_players
+        player_hands: dict[str, list[str]] = {
+            p.name: [str(c) for c in p.hole_cards]
+            for p in gs.players
+            if p.hole_cards
+        }
 
-        community_strs = [str(c) for c in gs.community_cards]
+        community_strs = [str(c) for c in board]
 
         if len(active) == 1:
             winner = active[0]
             winner_name = winner.name
             winner.chips += gs.pot
-            actions_summary.append(f"{winner.name} wins pot of {gs.pot:.0f} (everyone else folded)")
+            actions_log.append(("fold_win", winner.name, gs.pot))
         else:
-            # Showdown — evaluate hands
-            best_result: HandResult | None = None
+            # Showdown — evaluate each hand once against the shared board
             winner = active[0]
-            for p in active:
-                if len(p.hole_cards) >= 2 and len(gs.community_cards) >= 3:
-                    result = HandEvaluator.evaluate(p.hole_cards + gs.community_cards)
-                    if best_result is None or result > best_result:
-                        best_result = result
-                        winner = p
-                        winning_ranking = result.ranking
+            if len(board) >= 3:
+                results = HandEvaluator.evaluate_batch(
+                    [p.hole_cards for p in active], board,
+                )
+                best = max(range(len(active)), key=results.__getitem__)
+                winner = active[best]
+                winning_ranking = results[best].ranking
 
             winner_name = winner.name
             winner.chips += gs.pot
-            hand_desc = winning_ranking.name if winning_ranking else "unknown"
-            actions_summary.append(
-                f"Showdown: {winner.name} wins {gs.pot:.0f} with {hand_desc}"
-            )
+            actions_log.append(("showdown", winner.name, gs.pot, winning_ranking))
 
-        hero_profit = self.players[0].chips - starting_chips[self.players[0].name]
+        hero = self.players[self.hero_index]
+        hero_profit = hero.chips - starting_chips[hero.name]
 
         # Rotate dealer
         self.dealer_index = (self.dealer_index + 1) % len(self.players)
@@ -203,60 +256,76 @@ class PokerGame:
             community_cards=community_strs,
             player_hands=player_hands,
             winning_hand_ranking=winning_ranking,
-            actions_summary=actions_summary,
+            actions_log=actions_log,
             hero_profit=hero_profit,
+            preflop_hero_actions=preflop_hero_actions,
         )
 
     def _assign_positions(self) -> None:
         """Assign positions to players based on dealer index."""
-        n = len(self.players)
-        for i in range(n):
-            seat = (i - self.dealer_index) % n
-            self.players[i].position = _SEATS_FROM_DEALER[seat % len(_SEATS_FROM_DEALER)]
+        table = self._position_table[self.dealer_index]
+        by_pos = {}
+        for player, pos in zip(self.players, table):
+            player.position = pos
+            by_pos[pos] = player
+        self._by_pos = by_pos
 
     def _player_at_position(self, pos: Position) -> PlayerState:
         """Find the player at a given position."""
-        for p in self.players:
-            if p.position == pos:
-                return p
-        raise ValueError(f"No player at position {pos}")
+        try:
+            return self._by_pos[pos]
+        except KeyError:
+            raise ValueError(f"No player at position {pos}") from None
 
     def _run_betting_round(
         self,
         gs: GameState,
         street: Street,
         action_history: list[PriorAction],
-        actions_summary: list[str],
+        actions_log: list[tuple],
+        preflop_hero_actions: list[ActionType],
     ) -> bool:
         """Run a single betting round. Returns True if hand should end."""
         order = _PREFLOP_ORDER if street == Street.PREFLOP else _POSTFLOP_ORDER
 
         # Build ordered list of players for this round
-        ordered_players = []
-        for pos in order:
-            for p in gs.players:
-                if p.position == pos and p.is_active and not p.is_all_in:
-                    ordered_players.append(p)
+        by_pos = self._by_pos
+        ordered_players = [
+            p for p in (by_pos.get(pos) for pos in order)
+            if p is not None and p.is_active and not p.is_all_in
+        ]
 
         if len(ordered_players) < 2:
             return False
 
-        # Track who has acted and the last raiser
-        last_raiser_name: str | None = None
-        players_to_act = list(ordered_players)
-        acted: set[str] = set()
+        hero = self.players[self.hero_index]
 
-        while players_to_act:
-            player = players_to_act.pop(0)
+        # Bit i of to_act / acted stands for ordered_players[i]. The next
+        # player is the lowest set bit above the last actor, wrapping round.
+        all_mask = (1 << len(ordered_players)) - 1
+        to_act = all_mask
+        acted = 0
+        last_raiser = -1
+        idx = -1
+
+        while to_act:
+            later = to_act >> (idx + 1)
+            if later:
+                idx += (later & -later).bit_length()
+            else:
+                idx = (to_act & -to_act).bit_length() - 1
+            bit = 1 << idx
+            to_act ^= bit
+            player = ordered_players[idx]
 
             if not player.is_active or player.is_all_in:
                 continue
 
             # If player already acted and no new raise to respond to, skip
-            if player.name in acted and (last_raiser_name is None or last_raiser_name == player.name):
+            if acted & bit and (last_raiser < 0 or last_raiser == idx):
                 continue
 
-            is_hero = (player == self.players[0])
+            is_hero = player is hero
             effective_bet = max(0.0, gs.current_bet - player.current_bet)
 
             if is_hero:
@@ -270,25 +339,23 @@ class PokerGame:
 
             # Apply action
             self._apply_action(gs, player, action_type, amount)
-            acted.add(player.name)
+            acted |= bit
+            if is_hero and street == Street.PREFLOP:
+                preflop_hero_actions.append(action_type)
 
             action_str = Action(action_type.value)
             action_history.append(PriorAction(player.position, action_str, amount))
-            actions_summary.append(
-                f"  {player.name} ({player.position}): {action_type.value}"
-                + (f" {amount:.0f}" if amount > 0 else "")
-            )
+            actions_log.append(("action", player.name, player.position, action_type, amount))
 
             # If a raise happened, everyone else needs to act again
             if action_type in (ActionType.RAISE, ActionType.ALL_IN) and amount > effective_bet:
-                last_raiser_name = player.name
-                # Re-add other active non-allin players who haven't responded to this raise
-                for p in ordered_players:
-                    if p != player and p.is_active and not p.is_all_in and p not in players_to_act:
-                        players_to_act.append(p)
+                last_raiser = idx
+                # Everyone else must respond; folded and all-in players are
+                # skipped when their turn comes up
+                to_act = all_mask ^ bit
 
             # Check if only 1 active player remains
-            if len([p for p in gs.players if p.is_active]) <= 1:
+            if gs.active_count <= 1:
                 return True
 
         return False
@@ -300,15 +367,24 @@ class PokerGame:
         action_history: list[PriorAction],
     ) -> tuple[ActionType, float]:
         """Get the bot's decision via DecisionMaker."""
-        hero_index = self.players.index(hero)
-        stack_bb = hero.chips / self.big_blind
-        ctx = GameContext.cash_game(stack_bb=stack_bb, num_players=len([p for p in gs.players if p.is_active]))
+        ctx = self._ctx
+        ctx.stack_depth_bb = hero.chips / self.big_blind
+        ctx.num_players = gs.active_count
 
         decision = self.decision_maker.make_decision(
-            gs, ctx, hero_index=hero_index, action_history=action_history,
+            gs, ctx, hero_index=self.hero_index, action_history=action_history,
         )
         return decision.action, decision.amount
 
+    def _urand(self) -> float:
+        """Next uniform in [0, 1) from the pre-drawn pool, refilling when spent."""
+        if self._rand_idx >= _RAND_POOL_SIZE:
+            self._rand_pool = self._np_rng.random(_RAND_POOL_SIZE)
+            self._rand_idx = 0
+        u = self._rand_pool[self._rand_idx]
+        self._rand_idx += 1
+        return float(u)
+
     def _villain_action(
         self,
         gs: GameState,
@@ -320,7 +396,7 @@ class PokerGame:
 
         if can_check:
             # Never fold when check is free
-            roll = random.random()
+            roll = self._urand()
             if roll < 0.70:
                 return ActionType.CHECK, 0.0
             else:
@@ -331,7 +407,7 @@ class PokerGame:
                     return ActionType.ALL_IN, villain.chips
                 return ActionType.RAISE, bet_size
         else:
-            roll = random.random()
+            roll = self._urand()
             if roll < 0.30:
                 return ActionType.FOLD, 0.0
             elif roll < 0.80:
@@ -341,7 +417,7 @@ class PokerGame:
                 return ActionType.CALL, call_amount
             else:
                 # Raise 2-3x the current bet
-                raise_mult = random.uniform(2.0, 3.0)
+                raise_mult = 2.0 + self._urand()
                 raise_to = gs.current_bet * raise_mult
                 raise_to = max(raise_to, self.big_blind * 2)
                 raise_to = min(raise_to, villain.chips)
@@ -357,37 +433,71 @@ class PokerGame:
         amount: float,
     ) -> None:
         """Apply an action to the game state."""
-        match action_type:
-            case ActionType.FOLD:
-                player.is_active = False
-
-            case ActionType.CHECK:
-                pass
-
-            case ActionType.CALL:
-                call_amount = min(max(0.0, gs.current_bet - player.current_bet), player.chips)
-                player.chips -= call_amount
-                player.current_bet += call_amount
-                gs.pot += call_amount
-                if player.chips <= 0:
-                    player.is_all_in = True
-
-            case ActionType.RAISE:
-                # amount is raise-to
-                raise_diff = max(0.0, amount - player.current_bet)
-                raise_diff = min(raise_diff, player.chips)
-                player.chips -= raise_diff
-                player.current_bet += raise_diff
-                gs.pot += raise_diff
-                gs.current_bet = player.current_bet
-                if player.chips <= 0:
-                    player.is_all_in = True
-
-            case ActionType.ALL_IN:
-                allin_amount = player.chips
-                player.current_bet += allin_amount
-                gs.pot += allin_amount
-                player.chips = 0.0
-                player.is_all_in = True
-                if player.current_bet > gs.current_bet:
-                    gs.current_bet = player.current_bet
+        _APPLY_ACTION[action_type](gs, player, amount)
+
+
+# ---------------------------------------------------------------------------
+# Action handlers
+# ---------------------------------------------------------------------------
+#
+# Only players who are active and not all-in ever act, so each handler can
+# update the running counts on GameState without checking prior state.
+
+
+def _apply_fold(gs: GameState, player: PlayerState, amount: float) -> None:
+    player.is_active = False
+    gs.in_hand_players.remove(player)
+    gs.acting_players.remove(player)
+    gs.active_count -= 1
+    gs.active_non_allin_count -= 1
+
+
+def _apply_check(gs: GameState, player: PlayerState, amount: float) -> None:
+    pass
+
+
+def _apply_call(gs: GameState, player: PlayerState, amount: float) -> None:
+    call_amount = min(max(0.0, gs.current_bet - player.current_bet), player.chips)
+    player.chips -= call_amount
+    player.current_bet += call_amount
+    gs.pot += call_amount
+    if player.chips <= 0:
+        player.is_all_in = True
+        gs.acting_players.remove(player)
+        gs.active_non_allin_count -= 1
+
+
+def _apply_raise(gs: GameState, player: PlayerState, amount: float) -> None:
+    # amount is raise-to
+    raise_diff = max(0.0, amount - player.current_bet)
+    raise_diff = min(raise_diff, player.chips)
+    player.chips -= raise_diff
+    player.current_bet += raise_diff
+    gs.pot += raise_diff
+    gs.current_bet = player.current_bet
+    if player.chips <= 0:
+        player.is_all_in = True
+        gs.acting_players.remove(player)
+        gs.active_non_allin_count -= 1
+
+
+def _apply_all_in(gs: GameState, player: PlayerState, amount: float) -> None:
+    allin_amount = player.chips
+    player.current_bet += allin_amount
+    gs.pot += allin_amount
+    player.chips = 0.0
+    player.is_all_in = True
+    gs.acting_players.remove(player)
+    gs.active_non_allin_count -= 1
+    if player.current_bet > gs.current_bet:
+        gs.current_bet = player.current_bet
+
+
+_APPLY_ACTION = {
+    ActionType.FOLD: _apply_fold,
+    ActionType.CHECK: _apply_check,
+    ActionType.LIMP: _apply_check,
+    ActionType.CALL: _apply_call,
+    ActionType.RAISE: _apply_raise,
+    ActionType.ALL_IN: _apply_all_in,
+}
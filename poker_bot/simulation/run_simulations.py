@@ -6,23 +6,58 @@ summary statistics plus 3 interesting example hands.
 
 from __future__ import annotations
 
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
 from poker_bot.core.game_state import PlayerState
 from poker_bot.simulation.poker_game import HandRecord, PokerGame
-from poker_bot.utils.constants import Action, Position
+from poker_bot.strategy.decision_maker import ActionType
+from poker_bot.utils.constants import Position
+
+# Worker processes for parallel simulation: one core is left for the
+# main process, which only aggregates records.
+_MAX_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Below this many hands, process start-up outweighs the parallel speedup.
+_PARALLEL_MIN_HANDS = 200
+
+_STARTING_CHIPS = 1000.0
+
+# Preflop actions that count towards VPIP / PFR
+_VPIP_ACTIONS = frozenset({ActionType.CALL, ActionType.RAISE, ActionType.ALL_IN})
+_PFR_ACTIONS = frozenset({ActionType.RAISE, ActionType.ALL_IN})
 
 
-def run_simulation(num_hands: int = 1000) -> None:
-    """Run a simulation of num_hands and print results."""
+def _play_hands(first_hand: int, num_hands: int, seed: int) -> list[HandRecord]:
+    """Play a contiguous block of hands in a fresh game. Runs in a worker.
+
+    Each hand resets stacks, so blocks are independent; the dealer button
+    and hand numbers continue from first_hand as in a single long game.
+    A block is fully determined by its arguments.
+    """
+    # The bot's Monte Carlo equity draws from the global generator. Seed it
+    # for the block, then hand the caller's state back: the serial path runs
+    # in the caller's process.
+    saved_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _play_block(first_hand, num_hands, seed)
+    finally:
+        random.setstate(saved_state)
+
+
+def _play_block(first_hand: int, num_hands: int, seed: int) -> list[HandRecord]:
+    """Body of _play_hands, run with the global generator seeded."""
     # Create 6 players: 1 bot + 5 random villains
-    starting_chips = 1000.0
     players = [
-        PlayerState(name="Bot", chips=starting_chips, position=Position.BTN),
+        PlayerState(name="Bot", chips=_STARTING_CHIPS, position=Position.BTN),
     ]
     for i in range(5):
         players.append(
             PlayerState(
                 name=f"Villain{i+1}",
-                chips=starting_chips,
+                chips=_STARTING_CHIPS,
                 position=Position.BTN,  # Will be reassigned each hand
             )
         )
@@ -31,24 +66,71 @@ def run_simulation(num_hands: int = 1000) -> None:
         players=players,
         small_blind=5.0,
         big_blind=10.0,
+        rng=random.Random(seed),
     )
+    game.hand_number = first_hand
+    game.dealer_index = first_hand % len(players)
 
-    # Track stats
     records: list[HandRecord] = []
+    for _ in range(num_hands):
+        # Reset chips each hand to avoid elimination (keep it simple)
+        for p in players:
+            p.chips = _STARTING_CHIPS
+        records.append(game.play_hand())
+    return records
+
+
+def run_simulation(
+    num_hands: int = 1000,
+    max_workers: int | None = None,
+    seed: int | None = None,
+) -> None:
+    """Run a simulation of num_hands and print results.
+
+    Hands are split into blocks played across worker processes. Falls
+    back to a single in-process block for small runs.
+
+    Args:
+        num_hands: Number of hands to play.
+        max_workers: Max worker processes (defaults to _MAX_WORKERS).
+        seed: Base seed for reproducible runs (random if None).
+    """
+    base_seed = seed if seed is not None else random.randint(0, 2**31)
+    workers = max_workers or _MAX_WORKERS
+
+    if num_hands < _PARALLEL_MIN_HANDS or workers == 1:
+        records = _play_hands(0, num_hands, base_seed)
+    else:
+        # Several blocks per worker to even out uneven hand lengths
+        num_blocks = min(num_hands, workers * 4)
+        block_size = num_hands // num_blocks
+        remainder = num_hands % num_blocks
+        starts: list[int] = []
+        sizes: list[int] = []
+        start = 0
+        for i in range(num_blocks):
+            size = block_size + (1 if i < remainder else 0)
+            starts.append(start)
+            sizes.append(size)
+            start += size
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            blocks = executor.map(
+                _play_hands,
+                starts,
+                sizes,
+                [base_seed + i for i in range(num_blocks)],
+            )
+            records = [record for block in blocks for record in block]
+
+    # Track stats
     hands_won = 0
     vpip_count = 0  # Voluntarily Put money In Pot
     pfr_count = 0   # Pre-Flop Raise
     total_pots: list[float] = []
     profits: list[float] = []
 
-    for i in range(num_hands):
-        # Reset chips each hand to avoid elimination (keep it simple)
-        for p in players:
-            p.chips = starting_chips
-
-        record = game.play_hand()
-        records.append(record)
-
+    for record in records:
         hero_profit = record.hero_profit
         profits.append(hero_profit)
         total_pots.append(record.pot_size)
@@ -56,22 +138,11 @@ def run_simulation(num_hands: int = 1000) -> None:
         if record.winner_name == "Bot":
             hands_won += 1
 
-        # Check VPIP and PFR from actions
-        hero_acted_preflop = False
-        hero_raised_preflop = False
-        in_preflop = True
-        for action_line in record.actions_summary:
-            if "---" in action_line and "PREFLOP" not in action_line:
-                in_preflop = False
-            if in_preflop and "Bot" in action_line:
-                if "CALL" in action_line or "RAISE" in action_line or "ALL_IN" in action_line:
-                    hero_acted_preflop = True
-                if "RAISE" in action_line or "ALL_IN" in action_line:
-                    hero_raised_preflop = True
-
-        if hero_acted_preflop:
+        # Check VPIP and PFR from the bot's preflop actions
+        hero_actions = record.preflop_hero_actions
+        if any(a in _VPIP_ACTIONS for a in hero_actions):
             vpip_count += 1
-        if hero_raised_preflop:
+        if any(a in _PFR_ACTIONS for a in hero_actions):
             pfr_count += 1
 
     # Find interesting hands
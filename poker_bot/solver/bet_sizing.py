@@ -9,8 +9,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass(frozen=True)
+from poker_bot.solver.board_bucketing import BUCKET_IDS, TextureBucket
+
+
+@dataclass(frozen=True, slots=True)
 class SizingOption:
     """A bet sizing option with fraction of pot and description."""
 
@@ -77,33 +81,68 @@ _DEFAULT_SIZINGS = [
 ]
 
 
+# 1/n exponents for geometric sizing over n = 1..3 remaining streets
+_STREET_EXPONENTS = (0.0, 1.0, 1.0 / 2.0, 1.0 / 3.0)
+
+
+# Row of the sizing table used for unknown buckets (_DEFAULT_SIZINGS)
+_DEFAULT_ROW = len(TextureBucket)
+
+
+def _build_sizing_fractions() -> np.ndarray:
+    """TEXTURE_SIZINGS fractions as a NaN-padded array indexed by TextureBucket.
+
+    The extra trailing row holds _DEFAULT_SIZINGS.
+    """
+    rows = [(int(BUCKET_IDS[name]), opts) for name, opts in TEXTURE_SIZINGS.items()]
+    rows.append((_DEFAULT_ROW, _DEFAULT_SIZINGS))
+    width = max(len(opts) for _, opts in rows)
+    table = np.full((_DEFAULT_ROW + 1, width), np.nan)
+    for row, opts in rows:
+        table[row, :len(opts)] = [o.fraction for o in opts]
+    table.setflags(write=False)
+    return table
+
+
+_SIZING_FRACTIONS = _build_sizing_fractions()
+
+
+def _sizing_row(board_bucket: str | TextureBucket) -> int:
+    """Row of _SIZING_FRACTIONS for a bucket string or id."""
+    if isinstance(board_bucket, TextureBucket):
+        return int(board_bucket)
+    bucket_id = BUCKET_IDS.get(board_bucket)
+    return _DEFAULT_ROW if bucket_id is None else int(bucket_id)
+
+
 class BetSizingTree:
     """Provides bet sizing recommendations based on board texture and street."""
 
     @staticmethod
-    def get_sizings(board_bucket: str) -> list[SizingOption]:
+    def get_sizings(board_bucket: str | TextureBucket) -> list[SizingOption]:
         """Get recommended sizings for a board texture bucket.
 
         Args:
-            board_bucket: Board texture category string.
+            board_bucket: Board texture category string or id.
 
         Returns:
             List of SizingOption from most preferred to least.
         """
+        if isinstance(board_bucket, TextureBucket):
+            board_bucket = board_bucket.bucket
         return TEXTURE_SIZINGS.get(board_bucket, _DEFAULT_SIZINGS)
 
     @staticmethod
-    def primary_sizing(board_bucket: str) -> float:
+    def primary_sizing(board_bucket: str | TextureBucket) -> float:
         """Get the primary (most common) sizing for a texture.
 
         Args:
-            board_bucket: Board texture category string.
+            board_bucket: Board texture category string or id.
 
         Returns:
             Bet size as fraction of pot.
         """
-        sizings = TEXTURE_SIZINGS.get(board_bucket, _DEFAULT_SIZINGS)
-        return sizings[0].fraction if sizings else 0.5
+        return float(_SIZING_FRACTIONS[_sizing_row(board_bucket), 0])
 
     @staticmethod
     def geometric_sizing(
@@ -130,8 +169,12 @@ class BetSizingTree:
         if pot <= 0 or stack <= 0 or streets_remaining <= 0:
             return 0.0
 
-        ratio = 1.0 + stack / pot
-        per_street = ratio ** (1.0 / streets_remaining) - 1.0
+        exponent = (
+            _STREET_EXPONENTS[streets_remaining]
+            if streets_remaining < len(_STREET_EXPONENTS)
+            else 1.0 / streets_remaining
+        )
+        per_street = (1.0 + stack / pot) ** exponent - 1.0
 
         # Clamp to reasonable range [0.2, 2.0]
         return max(0.2, min(2.0, per_street))
@@ -154,6 +197,26 @@ class BetSizingTree:
         Returns:
             Bet amount clamped to [min_bet, stack].
         """
-        amount = pot * sizing_fraction
-        amount = max(amount, min_bet)
-        return min(amount, stack)
+        return min(max(pot * sizing_fraction, min_bet), stack)
+
+    @staticmethod
+    def compute_bet_amounts(
+        pot: float,
+        stack: float,
+        sizing_fractions: np.ndarray,
+        min_bet: float = 0.0,
+    ) -> np.ndarray:
+        """compute_bet_amount() for an array of sizing fractions at once.
+
+        Args:
+            pot: Current pot size.
+            stack: Hero's remaining stack.
+            sizing_fractions: Bet sizes as fractions of pot.
+            min_bet: Minimum legal bet size.
+
+        Returns:
+            Bet amounts clamped to [min_bet, stack], one per fraction.
+        """
+        return np.minimum(
+            np.maximum(np.asarray(sizing_fractions, float) * pot, min_bet), stack,
+        )
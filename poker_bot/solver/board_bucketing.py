@@ -7,9 +7,41 @@ bucketing for strategy selection.
 
 from __future__ import annotations
 
+from enum import IntEnum
+
 from poker_bot.strategy.decision_maker import BoardTexture
 
 
+class TextureBucket(IntEnum):
+    """Integer ids for the board buckets returned by bucket_board().
+
+    Member names match the bucket strings, so
+    ``TextureBucket[bucket_board(t).upper()]`` maps a bucket to its id.
+    """
+
+    DRY_HIGH_RAINBOW = 0
+    DRY_LOW_RAINBOW = 1
+    DRY_MEDIUM = 2
+    WET_CONNECTED = 3
+    WET_TWO_TONE = 4
+    MONOTONE_HIGH = 5
+    MONOTONE_LOW = 6
+    PAIRED_HIGH = 7
+    PAIRED_LOW = 8
+    BROADWAY_HEAVY = 9
+    CONNECTED_LOW = 10
+    DYNAMIC = 11
+
+    @property
+    def bucket(self) -> str:
+        """The bucket string for this id."""
+        return self.name.lower()
+
+
+# Bucket string -> id, for callers holding bucket_board() output
+BUCKET_IDS: dict[str, TextureBucket] = {t.bucket: t for t in TextureBucket}
+
+
 def bucket_board(texture: BoardTexture) -> str:
     """Classify a board texture into a bucket category.
 
@@ -34,6 +66,22 @@ def bucket_board(texture: BoardTexture) -> str:
     Returns:
         String bucket name.
     """
+    key = (
+        texture.is_monotone << 9
+        | texture.is_paired << 8
+        | texture.has_flush_draw << 7
+        | texture.has_straight_draw << 6
+        | texture.is_connected << 5
+        | texture.is_two_tone << 4
+        | texture.is_rainbow << 3
+        | (texture.num_broadway >= 2) << 2
+        | _HIGH_CLASS[min(texture.high_card_rank, 14)]
+    )
+    return _BOARD_BUCKET_LUT[key]
+
+
+def _bucket_board_cascade(texture: BoardTexture) -> str:
+    """Rule cascade behind bucket_board(), used to build its lookup table."""
     high = texture.high_card_rank
 
     # Monotone boards (all one suit)
@@ -78,6 +126,35 @@ def bucket_board(texture: BoardTexture) -> str:
     return "dry_medium"
 
 
+# bucket_board() packs every feature the cascade reads into a 10-bit key:
+# seven texture flags, num_broadway >= 2, and a 2-bit high-card class that
+# separates the rank thresholds the cascade tests (<8, 8, 9, >=10).
+_HIGH_CLASS = tuple(0 if r < 8 else 1 if r == 8 else 2 if r == 9 else 3 for r in range(15))
+_HIGH_CLASS_RANK = (7, 8, 9, 14)
+
+
+def _build_board_bucket_lut() -> tuple[str, ...]:
+    """Run the cascade once for every feature key."""
+    lut = []
+    for key in range(1 << 10):
+        texture = BoardTexture(
+            is_monotone=bool(key >> 9 & 1),
+            is_paired=bool(key >> 8 & 1),
+            has_flush_draw=bool(key >> 7 & 1),
+            has_straight_draw=bool(key >> 6 & 1),
+            is_connected=bool(key >> 5 & 1),
+            is_two_tone=bool(key >> 4 & 1),
+            is_rainbow=bool(key >> 3 & 1),
+            num_broadway=2 if key >> 2 & 1 else 0,
+            high_card_rank=_HIGH_CLASS_RANK[key & 3],
+        )
+        lut.append(_bucket_board_cascade(texture))
+    return tuple(lut)
+
+
+_BOARD_BUCKET_LUT = _build_board_bucket_lut()
+
+
 def bucket_stack(stack_bb: float) -> str:
     """Classify stack depth into a bucket for strategy lookup.
 
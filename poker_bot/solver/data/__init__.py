@@ -0,0 +1 @@
+"""Generated solver data tables."""
@@ -2,6 +2,7 @@
 
 ActionFrequency: A single action with its frequency, amount, and EV.
 StrategyNode: A collection of action frequencies forming a mixed strategy.
+CompactStrategyNode: The same strategy as parallel numpy arrays.
 SolverResult: Complete solver output with strategy, source, and confidence.
 SpotKey: Hashable identifier for a specific game situation.
 SolverProtocol: Interface that any solver backend must implement.
@@ -10,8 +11,14 @@ SolverProtocol: Interface that any solver backend must implement.
 from __future__ import annotations
 
 import random
+from bisect import bisect_left
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from itertools import accumulate
+from operator import attrgetter
+from typing import TYPE_CHECKING, NamedTuple, Protocol, runtime_checkable
+
+import numpy as np
 
 if TYPE_CHECKING:
     from poker_bot.core.game_context import GameContext
@@ -20,7 +27,7 @@ if TYPE_CHECKING:
     from poker_bot.strategy.preflop_ranges import Range
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionFrequency:
     """A single action in a mixed strategy with its frequency and EV.
 
@@ -37,7 +44,15 @@ class ActionFrequency:
     ev: float = 0.0
 
 
-@dataclass
+_FREQ_KEY = attrgetter("frequency")
+_EV_KEY = attrgetter("ev")
+
+# Strategies with more actions than this sample by bisecting cached
+# cumulative frequencies instead of a linear walk.
+_LINEAR_SAMPLE_MAX = 3
+
+
+@dataclass(slots=True)
 class StrategyNode:
     """A mixed strategy: a collection of weighted actions.
 
@@ -45,13 +60,18 @@ class StrategyNode:
     """
 
     actions: list[ActionFrequency] = field(default_factory=list)
+    # Cumulative frequencies, built on the first bisecting sample_action();
+    # actions are not expected to change once a node is sampled from.
+    _cum: list[float] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     @property
     def recommended_action(self) -> ActionFrequency | None:
         """Return the highest-frequency action."""
         if not self.actions:
             return None
-        return max(self.actions, key=lambda a: a.frequency)
+        return max(self.actions, key=_FREQ_KEY)
 
     def sample_action(self) -> ActionFrequency | None:
         """Randomly sample an action according to the mixed strategy frequencies.
@@ -64,27 +84,38 @@ class StrategyNode:
             return self.actions[0]
 
         r = random.random()
-        cumulative = 0.0
-        for action in self.actions:
-            cumulative += action.frequency
-            if r <= cumulative:
-                return action
-        # Fallback to last action (handles floating-point rounding)
-        return self.actions[-1]
+        if len(self.actions) <= _LINEAR_SAMPLE_MAX:
+            cumulative = 0.0
+            for action in self.actions:
+                cumulative += action.frequency
+                if r <= cumulative:
+                    return action
+            # Fallback to last action (handles floating-point rounding)
+            return self.actions[-1]
+
+        if self._cum is None:
+            self._cum = list(accumulate(a.frequency for a in self.actions))
+        i = bisect_left(self._cum, r)
+        # Past the end only through floating-point rounding: use the last action
+        return self.actions[min(i, len(self.actions) - 1)]
 
     @property
     def is_pure(self) -> bool:
         """Whether this is a pure (non-mixed) strategy."""
-        return len(self.actions) <= 1 or any(
-            a.frequency >= 0.99 for a in self.actions
-        )
+        actions = self.actions
+        if len(actions) <= 1:
+            return True
+        for a in actions:
+            if a.frequency >= 0.99:
+                return True
+        return False
 
     @property
     def best_ev(self) -> float:
         """Highest EV among all actions."""
         if not self.actions:
             return 0.0
-        return max(a.ev for a in self.actions)
+        return max(map(_EV_KEY, self.actions))
 
     @property
     def weighted_ev(self) -> float:
@@ -93,6 +124,25 @@ class StrategyNode:
             return 0.0
         return sum(a.frequency * a.ev for a in self.actions)
 
+    @classmethod
+    def from_weights(
+        cls, rows: Iterable[tuple[str, float, float, float]],
+    ) -> StrategyNode:
+        """Build a normalized node from (action, weight, amount, ev) rows.
+
+        Equivalent to building the node and calling normalized(), without
+        allocating the intermediate actions.
+        """
+        rows = list(rows)
+        total = 0.0
+        for row in rows:
+            total += row[1]
+        scale = total if total > 0 else 1.0
+        return cls(actions=[
+            ActionFrequency(action, weight / scale, amount, ev)
+            for action, weight, amount, ev in rows
+        ])
+
     def normalized(self) -> StrategyNode:
         """Return a copy with frequencies normalized to sum to 1.0."""
         total = sum(a.frequency for a in self.actions)
@@ -111,11 +161,80 @@ class StrategyNode:
         )
 
 
-@dataclass(frozen=True)
-class SpotKey:
+@dataclass(slots=True)
+class CompactStrategyNode:
+    """A mixed strategy stored as parallel arrays instead of objects.
+
+    Same queries as StrategyNode, answered with numpy reductions. Meant
+    for batch work over many nodes; convert with from_node() / to_node()
+    at the boundaries.
+    """
+
+    actions: tuple[str, ...] = ()
+    freqs: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    amounts: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    evs: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    @classmethod
+    def from_node(cls, node: StrategyNode) -> CompactStrategyNode:
+        """Build the array form of a StrategyNode."""
+        acts = node.actions
+        return cls(
+            actions=tuple(a.action for a in acts),
+            freqs=np.fromiter((a.frequency for a in acts), float, len(acts)),
+            amounts=np.fromiter((a.amount for a in acts), float, len(acts)),
+            evs=np.fromiter((a.ev for a in acts), float, len(acts)),
+        )
+
+    def to_node(self) -> StrategyNode:
+        """Convert back to a StrategyNode."""
+        return StrategyNode(actions=[self[i] for i in range(len(self))])
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __getitem__(self, i: int) -> ActionFrequency:
+        """ActionFrequency view of the i-th action."""
+        return ActionFrequency(
+            self.actions[i],
+            float(self.freqs[i]),
+            float(self.amounts[i]),
+            float(self.evs[i]),
+        )
+
+    @property
+    def recommended_action(self) -> ActionFrequency | None:
+        """Return the highest-frequency action."""
+        if not self.actions:
+            return None
+        return self[int(np.argmax(self.freqs))]
+
+    @property
+    def best_ev(self) -> float:
+        """Highest EV among all actions."""
+        if not self.actions:
+            return 0.0
+        return float(self.evs.max())
+
+    @property
+    def weighted_ev(self) -> float:
+        """Frequency-weighted EV of the strategy."""
+        return float(self.freqs @ self.evs)
+
+    def normalized(self) -> CompactStrategyNode:
+        """Return a copy with frequencies normalized to sum to 1.0."""
+        total = self.freqs.sum()
+        freqs = self.freqs / total if total > 0 else self.freqs.copy()
+        return CompactStrategyNode(
+            self.actions, freqs, self.amounts.copy(), self.evs.copy(),
+        )
+
+
+class SpotKey(NamedTuple):
     """Hashable identifier for a specific game situation.
 
-    Used as dictionary key for pre-computed strategy lookups.
+    Used as dictionary key for pre-computed strategy lookups. A NamedTuple
+    so hashing and equality run on the C tuple implementation.
     """
 
     street: str  # "preflop", "flop", "turn", "river"
@@ -128,7 +247,7 @@ class SpotKey:
     hand_category: str = ""  # e.g. "nuts", "strong_made", "medium_draw"
 
 
-@dataclass
+@dataclass(slots=True)
 class SolverResult:
     """Complete output from the solver for a specific spot.
 
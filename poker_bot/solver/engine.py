@@ -11,9 +11,12 @@ from __future__ import annotations
 
 import logging
 import time
+from dataclasses import replace
+from functools import lru_cache
 
 from poker_bot.core.game_context import GameContext
 from poker_bot.core.game_state import GameState
+from poker_bot.core.hand_evaluator import HandEvaluator, HandResult
 from poker_bot.solver.board_bucketing import bucket_stack
 from poker_bot.solver.data_structures import (
     ActionFrequency,
@@ -24,13 +27,15 @@ from poker_bot.solver.icm_adapter import adjust_for_icm
 from poker_bot.solver.postflop_solver import PostflopSolver
 from poker_bot.solver.preflop_solver import PreflopSolver
 from poker_bot.strategy.decision_maker import (
+    BoardTexture,
     PostflopEngine,
     PriorAction,
     analyze_board,
 )
 from poker_bot.strategy.preflop_ranges import Range
 from poker_bot.strategy.tournament_strategy import survival_premium
-from poker_bot.utils.constants import Street
+from poker_bot.utils.card import Card
+from poker_bot.utils.constants import Position, Street
 
 logger = logging.getLogger("poker_bot.solver")
 
@@ -43,6 +48,32 @@ _FALLBACK_RESULT = SolverResult(
     confidence=0.0,
 )
 
+# Postflop acting order keyed by Position member, so the per-player loop
+# in _solve_postflop skips the enum .value lookup.
+_POSITION_ORDER: dict[Position, int] = PostflopSolver._POSTFLOP_ORDER
+
+# Returned when the hero has no hole cards. Shared: callers must not mutate.
+_NO_CARDS_RESULT = SolverResult(
+    strategy=StrategyNode(actions=[
+        ActionFrequency("fold", 1.0, 0.0, 0.0),
+    ]),
+    source="no_cards",
+    confidence=0.0,
+)
+
+
+# Callers often solve the same spot several times per street (explanations,
+# what-ifs); hand and board analysis depend only on the cards, so repeat
+# solves reuse them. Results are shared and must not be mutated.
+@lru_cache(maxsize=512)
+def _cached_eval(hole: tuple[Card, ...], board: tuple[Card, ...]) -> HandResult:
+    return HandEvaluator.evaluate_with_board(hole, board)
+
+
+@lru_cache(maxsize=512)
+def _cached_texture(board: tuple[Card, ...]) -> BoardTexture:
+    return analyze_board(list(board))
+
 
 class SolverEngine:
     """Top-level solver orchestrator.
@@ -98,19 +129,21 @@ class SolverEngine:
             )
             return _FALLBACK_RESULT
 
-        elapsed_ms = (time.perf_counter() - t_start) * 1000
-        rec = result.strategy.recommended_action
-        rec_str = f"{rec.action} {rec.frequency:.0%}" if rec else "none"
-        logger.info(
-            "%s %s → %s (source=%s, confidence=%.0f%%, ev=%.2f, %.1fms)",
-            result.spot_key.street if result.spot_key else "unknown",
-            result.spot_key.position if result.spot_key else "?",
-            rec_str,
-            result.source,
-            result.confidence * 100,
-            result.ev,
-            elapsed_ms,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            elapsed_ms = (time.perf_counter() - t_start) * 1000
+            rec = result.strategy.recommended_action
+            rec_str = f"{rec.action} {rec.frequency:.0%}" if rec else "none"
+            sk = result.spot_key
+            logger.info(
+                "%s %s → %s (source=%s, confidence=%.0f%%, ev=%.2f, %.1fms)",
+                sk.street if sk else "unknown",
+                sk.position if sk else "?",
+                rec_str,
+                result.source,
+                result.confidence * 100,
+                result.ev,
+                elapsed_ms,
+            )
 
         return result
 
@@ -128,13 +161,7 @@ class SolverEngine:
 
         if not hero.hole_cards or len(hero.hole_cards) < 2:
             logger.debug("No hole cards for hero — returning fold")
-            return SolverResult(
-                strategy=StrategyNode(actions=[
-                    ActionFrequency("fold", 1.0, 0.0, 0.0),
-                ]),
-                source="no_cards",
-                confidence=0.0,
-            )
+            return _NO_CARDS_RESULT
 
         # Get ICM premium for tournament adjustment
         premium = survival_premium(context) if context.is_tournament else 1.0
@@ -160,12 +187,10 @@ class SolverEngine:
             logger.debug(
                 "Applying ICM adjustment: premium=%.2f", premium,
             )
-            result = SolverResult(
+            result = replace(
+                result,
                 strategy=adjust_for_icm(result.strategy, premium),
-                source=result.source,
-                confidence=result.confidence,
                 ev=result.ev * premium,
-                spot_key=result.spot_key,
             )
 
         return result
@@ -181,11 +206,12 @@ class SolverEngine:
             stack_bb=context.stack_depth_bb,
             survival_premium=premium,
         )
-        logger.debug(
-            "Preflop lookup: %.1fms (source=%s)",
-            (time.perf_counter() - t0) * 1000,
-            result.source,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Preflop lookup: %.1fms (source=%s)",
+                (time.perf_counter() - t0) * 1000,
+                result.source,
+            )
         return result
 
     def _solve_postflop(
@@ -193,19 +219,16 @@ class SolverEngine:
         opponent_range, premium,
     ):
         """Route to postflop solver."""
-        from poker_bot.core.hand_evaluator import HandEvaluator
-
         t0 = time.perf_counter()
 
-        hand_result = HandEvaluator.evaluate(
-            hero.hole_cards + game_state.community_cards,
-        )
+        board = tuple(game_state.community_cards)
+        hand_result = _cached_eval(tuple(hero.hole_cards), board)
         hand_strength = PostflopEngine._hand_strength_score(
             hand_result, game_state.community_cards,
         )
 
         # Detect draws
-        texture = analyze_board(game_state.community_cards)
+        texture = _cached_texture(board)
         has_draw = texture.has_flush_draw or texture.has_straight_draw
         draw_strength = 0.0
         if has_draw:
@@ -214,24 +237,24 @@ class SolverEngine:
         effective_bet = max(0.0, game_state.current_bet - hero.current_bet)
         pot = game_state.pot
 
-        # Compute positional and multiway info
-        num_opponents = max(1, game_state.players_in_hand - 1)
-        villain_positions = [
-            p.position.value
-            for p in game_state.active_players
-            if p is not hero
-        ]
-        is_ip = PostflopSolver._is_in_position(
-            hero.position.value, villain_positions,
-        )
-
-        # Look up opponent stats for the primary villain (first active opponent)
+        # Compute positional and multiway info, and look up opponent stats
+        # for the primary villain (first active opponent), in one pass.
+        # Hero is in position unless some villain acts after them
+        # (same rule as PostflopSolver._is_in_position).
+        active = game_state.active_players
+        num_opponents = max(1, len(active) - 1)
+        order = _POSITION_ORDER
+        hero_order = order[hero.position]
+        is_ip = True
         villain_stats = None
-        if context.opponent_stats:
-            for p in game_state.active_players:
-                if p is not hero and p.name in context.opponent_stats:
-                    villain_stats = context.opponent_stats[p.name]
-                    break
+        opp_stats = context.opponent_stats
+        for p in active:
+            if p is hero:
+                continue
+            if order[p.position] > hero_order:
+                is_ip = False
+            if villain_stats is None and opp_stats and p.name in opp_stats:
+                villain_stats = opp_stats[p.name]
 
         result = self._postflop.get_strategy(
             hero_cards=hero.hole_cards,
@@ -250,13 +273,15 @@ class SolverEngine:
             opponent_stats=villain_stats,
         )
 
-        logger.debug(
-            "Postflop solve: %.1fms (source=%s, hand_strength=%.2f, "
-            "category=%s, board=%s)",
-            (time.perf_counter() - t0) * 1000,
-            result.source,
-            hand_strength,
-            result.spot_key.hand_category if result.spot_key else "?",
-            result.spot_key.board_bucket if result.spot_key else "?",
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            sk = result.spot_key
+            logger.debug(
+                "Postflop solve: %.1fms (source=%s, hand_strength=%.2f, "
+                "category=%s, board=%s)",
+                (time.perf_counter() - t0) * 1000,
+                result.source,
+                hand_strength,
+                sk.hand_category if sk else "?",
+                sk.board_bucket if sk else "?",
+            )
         return result
@@ -29,6 +29,9 @@ logger = logging.getLogger("poker_bot.solver.external")
 # Configuration
 # ---------------------------------------------------------------------------
 
+_DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
 @dataclass(frozen=True)
 class SolverConfig:
     """Configuration for an external GTO solver binary."""
@@ -40,6 +43,8 @@ class SolverConfig:
     accuracy: float = 0.5  # Convergence target (% of pot)
     max_solve_seconds: int = 120
     extra_options: dict[str, str] = field(default_factory=dict)
+    cache_dir: Path | None = None  # Persist solved spots here across runs
+    max_cache_bytes: int = _DEFAULT_MAX_CACHE_BYTES  # Disk cache size limit
 
 
 def load_solver_config(config_path: Path | None = None) -> SolverConfig | None:
@@ -56,7 +61,8 @@ def load_solver_config(config_path: Path | None = None) -> SolverConfig | None:
             "binary_path": "/path/to/console_solver",
             "thread_count": 8,
             "accuracy": 0.5,
-            "max_solve_seconds": 60
+            "max_solve_seconds": 60,
+            "cache_dir": "/path/to/solver_cache"
         }
     """
     path = config_path or Path.home() / ".poker_coach" / "solver_config.json"
@@ -84,6 +90,8 @@ def load_solver_config(config_path: Path | None = None) -> SolverConfig | None:
         accuracy=data.get("accuracy", 0.5),
         max_solve_seconds=data.get("max_solve_seconds", 120),
         extra_options=data.get("extra_options", {}),
+        cache_dir=Path(data["cache_dir"]) if "cache_dir" in data else None,
+        max_cache_bytes=data.get("max_cache_bytes", _DEFAULT_MAX_CACHE_BYTES),
     )
 
 
@@ -91,7 +99,7 @@ def load_solver_config(config_path: Path | None = None) -> SolverConfig | None:
 # Solver I/O data types
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolverInput:
     """Standardized input for an external solver solve request.
 
@@ -107,9 +115,14 @@ class SolverInput:
     ip_range_str: str  # IP player's range in solver format
     oop_range_str: str  # OOP player's range in solver format
     street: str  # "flop", "turn", "river"
+    # Comma-joined board, e.g. "Qs,Jh,2h"; derived from board
+    board_str: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "board_str", ",".join(map(str, self.board)))
 
-@dataclass
+
+@dataclass(slots=True)
 class SolverOutput:
     """Parsed output from an external solver.
 
@@ -188,6 +201,17 @@ class SolverBridge(ABC):
         """
         ...
 
+    def solve_many(self, solver_inputs: list[SolverInput]) -> list[SolverOutput]:
+        """Solve several independent spots, returning outputs in input order.
+
+        The default solves them one after another; bridges that can run
+        solves concurrently override this.
+
+        Raises:
+            SolverError: If any of the solves fails.
+        """
+        return [self.solve(solver_input) for solver_input in solver_inputs]
+
     @abstractmethod
     def cleanup(self) -> None:
         """Release resources (temp files, running processes)."""
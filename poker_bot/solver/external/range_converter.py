@@ -5,8 +5,41 @@ Pure data transformation — no strategy logic, no heuristics.
 
 from __future__ import annotations
 
+import numpy as np
+
 from poker_bot.strategy.preflop_ranges import Range
 from poker_bot.utils.card import Card
+from poker_bot.utils.constants import Rank, Suit
+
+# PioSolver's canonical 52-card ordering: 2c,2d,2h,2s,...,Ac,Ad,Ah,As
+_RANK_ORDER = (
+    Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE, Rank.SIX,
+    Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN,
+    Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE,
+)
+_SUIT_ORDER = (Suit.CLUBS, Suit.DIAMONDS, Suit.HEARTS, Suit.SPADES)
+_CARD_ORDER: tuple[Card, ...] = tuple(
+    Card(rank, suit) for rank in _RANK_ORDER for suit in _SUIT_ORDER
+)
+_CARD_INDEX: dict[Card, int] = {c: i for i, c in enumerate(_CARD_ORDER)}
+
+
+def _build_tri_index() -> np.ndarray:
+    """Map a card-index pair, in either order, to its slot in the 1326 array.
+
+    Slots follow the triangular order (0,1), (0,2), ..., (50,51); the
+    diagonal is -1 since a combo cannot repeat a card.
+    """
+    table = np.full((52, 52), -1, dtype=np.int16)
+    lo, hi = np.triu_indices(52, k=1)
+    slots = np.arange(lo.size, dtype=np.int16)
+    table[lo, hi] = slots
+    table[hi, lo] = slots
+    table.flags.writeable = False
+    return table
+
+
+_TRI_INDEX = _build_tri_index()
 
 
 class RangeConverter:
@@ -31,11 +64,12 @@ class RangeConverter:
             return ""
 
         # Sort for deterministic output (pairs first, then suited, then offsuit)
-        notations = sorted(str(h) for h in range_obj.hands)
+        notations = [str(h) for h in range_obj.hands]
+        notations.sort()
         return ",".join(notations)
 
     @staticmethod
-    def to_piosolver(range_obj: Range, dead_cards: list[Card] | None = None) -> list[float]:
+    def to_piosolver(range_obj: Range, dead_cards: list[Card] | None = None) -> np.ndarray:
         """Convert Range to PioSolver 1326-float array.
 
         Each float is 0.0 (not in range) or 1.0 (in range).
@@ -50,46 +84,22 @@ class RangeConverter:
             dead_cards: Cards to exclude (hero cards + board).
 
         Returns:
-            List of 1326 floats.
+            float32 array of 1326 weights; bridges can pass
+            ``result.tobytes()`` straight to a solver process.
         """
         dead_set = set(dead_cards) if dead_cards else set()
 
-        # Build the canonical 52-card ordering: 2c,2d,2h,2s,...,Ac,Ad,Ah,As
-        from poker_bot.utils.constants import Rank, Suit
-
-        card_order = []
-        rank_order = [
-            Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE, Rank.SIX,
-            Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN,
-            Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE,
-        ]
-        suit_order = [Suit.CLUBS, Suit.DIAMONDS, Suit.HEARTS, Suit.SPADES]
-        for rank in rank_order:
-            for suit in suit_order:
-                card_order.append(Card(rank, suit))
-
-        card_index = {c: i for i, c in enumerate(card_order)}
-
-        # Build combo set from range
-        combo_set: set[tuple[int, int]] = set()
+        first: list[int] = []
+        second: list[int] = []
         for combo in range_obj.to_combos():
             c1 = combo.card1
             c2 = combo.card2
             if c1 in dead_set or c2 in dead_set:
                 continue
-            i1 = card_index.get(c1)
-            i2 = card_index.get(c2)
-            if i1 is not None and i2 is not None:
-                lo, hi = min(i1, i2), max(i1, i2)
-                combo_set.add((lo, hi))
-
-        # Build 1326-float array using triangular indexing
-        result = [0.0] * 1326
-        idx = 0
-        for i in range(52):
-            for j in range(i + 1, 52):
-                if (i, j) in combo_set:
-                    result[idx] = 1.0
-                idx += 1
+            first.append(_CARD_INDEX[c1])
+            second.append(_CARD_INDEX[c2])
 
+        slots = _TRI_INDEX[first, second]
+        result = np.zeros(1326, dtype=np.float32)
+        result[slots[slots >= 0]] = 1.0
         return result
@@ -10,13 +10,22 @@ Zero interpretation: frequencies come through exactly as the solver computed.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
 
 from poker_bot.solver.external.bridge import (
     SolverBridge,
@@ -26,6 +35,29 @@ from poker_bot.solver.external.bridge import (
     SolverOutput,
 )
 
+# Solver dumps can run to tens of MB; orjson decodes them several times
+# faster than the stdlib when it is installed. Both decoders raise a
+# ValueError subclass on malformed input.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# With ijson installed, only the root node's tables are materialized and
+# the (much larger) child subtrees are streamed past rather than decoded
+# and then dropped.
+try:
+    import ijson
+    _DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _DECODE_ERRORS = (ValueError,)
+
 logger = logging.getLogger("poker_bot.solver.external.texas")
 
 
@@ -54,6 +86,33 @@ _DEFAULT_BET_SIZES: dict[str, list[str]] = {
     ],
 }
 
+# Bet sizing commands for a solve starting on each street: multi-street
+# solves include every street from the current one onward
+_STREET_ORDER = ("flop", "turn", "river")
+_BET_SIZE_BLOCKS: dict[str, str] = {
+    street: "".join(
+        f"{line}\n"
+        for later in _STREET_ORDER[i:]
+        for line in _DEFAULT_BET_SIZES[later]
+    )
+    for i, street in enumerate(_STREET_ORDER)
+}
+
+# Fields of the root decision node that _root_strategy reads
+_ROOT_NODE_FIELDS = frozenset({"actions", "strategy", "ev"})
+_TOP_LEVEL_FIELDS = _ROOT_NODE_FIELDS | {"exploitability"}
+
+# Memory-backed filesystem for solver input files on Linux
+_SHM_DIR = Path("/dev/shm")
+
+# Solved root nodes kept in memory per bridge. Each holds a row for every
+# combo in the ranges, so any hero hand in the spot is answered from it.
+_MEMORY_CACHE_SIZE = 64
+
+# How often to check whether the solver has finished writing its output;
+# the output counts as complete once its size holds across two checks.
+_OUTPUT_POLL_SECONDS = 0.005
+
 # Action name mapping: solver output → our convention
 _ACTION_MAP = {
     "fold": "fold",
@@ -63,12 +122,32 @@ _ACTION_MAP = {
 }
 
 
+@dataclass(slots=True)
+class _RootStrategy:
+    """A solved root node, with the strategy table as a combo x action matrix.
+
+    Built once per solve so that extracting any hand is a row lookup.
+    """
+
+    combo_index: dict[str, int]
+    strategy: np.ndarray  # (combos, solver actions) frequencies
+    action_groups: np.ndarray  # solver action column -> index in action_names
+    action_names: list[str]  # our action names, in first-seen order
+    ev: dict | float
+    exploitability: float
+
+
 class TexasSolverBridge(SolverBridge):
     """File-based I/O adapter for TexasSolver (open-source CFR).
 
     Each solve creates an input file, runs the solver subprocess,
     and parses the JSON output. The solver runs to completion and
     exits — no persistent process.
+
+    Solved spots are cached by their input commands, which do not
+    depend on hero's cards: repeat solves of a spot, for any hero hand,
+    reuse the root node instead of relaunching the solver. With
+    config.cache_dir set, the cache also persists across runs.
     """
 
     def __init__(self, config: SolverConfig) -> None:
@@ -79,11 +158,40 @@ class TexasSolverBridge(SolverBridge):
             else Path(tempfile.mkdtemp(prefix="texassolver_"))
         )
         self._work_dir.mkdir(parents=True, exist_ok=True)
+        self._input_dir = self._work_dir
+        if config.working_dir is None and os.access(_SHM_DIR, os.W_OK):
+            # Input files are small and read once by the solver, so keep
+            # them on tmpfs instead of round-tripping through the disk
+            try:
+                self._input_dir = Path(
+                    tempfile.mkdtemp(prefix="texassolver_in_", dir=_SHM_DIR)
+                )
+            except OSError:
+                pass
+        self._cache: OrderedDict[str, _RootStrategy] = OrderedDict()
+        # Input file commands after the spot's own, the same for every solve
+        self._run_commands = (
+            f"set_thread_num {config.thread_count}\n"
+            "build_tree\n"
+            "start_solve\n"
+        )
+        self._available: bool | None = None  # is_available() result, checked once
 
     def is_available(self) -> bool:
-        """Check if the TexasSolver binary exists and is executable."""
+        """Check if the TexasSolver binary exists and is executable.
+
+        The filesystem is checked on the first call only; use
+        refresh_availability() to check again.
+        """
+        if self._available is None:
+            return self.refresh_availability()
+        return self._available
+
+    def refresh_availability(self) -> bool:
+        """Re-check the binary and update the cached is_available() result."""
         path = self._config.binary_path
-        return path.exists() and os.access(path, os.X_OK)
+        self._available = path.exists() and os.access(path, os.X_OK)
+        return self._available
 
     def solve(self, solver_input: SolverInput) -> SolverOutput:
         """Run TexasSolver and return parsed GTO output.
@@ -97,50 +205,226 @@ class TexasSolverBridge(SolverBridge):
         Raises:
             SolverError: On any failure (timeout, crash, parse error).
         """
-        input_path = self._work_dir / "input.txt"
-        output_path = self._work_dir / "output_result.json"
+        commands = self._spot_commands(solver_input)
+        key = self._cache_key(commands)
+        table = self._cache_get(key)
+        if table is None:
+            data = self._run_solver(commands, self._work_dir)
+            table = self._root_strategy(data)
+            self._cache_put(key, data, table)
+        return self._output_for_hero(table, solver_input)
+
+    def solve_many(self, solver_inputs: list[SolverInput]) -> list[SolverOutput]:
+        """Solve several spots, running solver processes side by side.
+
+        Each solver process uses config.thread_count threads, so up to
+        cpu_count // thread_count run at once, each in its own job
+        directory. Spots already cached, or repeated within the batch,
+        are solved once.
+
+        Raises:
+            SolverError: If any of the solves fails.
+        """
+        all_commands = [self._spot_commands(s) for s in solver_inputs]
+        keys = [self._cache_key(commands) for commands in all_commands]
+        solved: dict[str, _RootStrategy] = {}
+        pending: dict[str, str] = {}
+        for key, commands in zip(keys, all_commands):
+            if key in solved or key in pending:
+                continue
+            table = self._cache_get(key)
+            if table is None:
+                pending[key] = commands
+            else:
+                solved[key] = table
+
+        if pending:
+            workers = max(1, (os.cpu_count() or 1) // self._config.thread_count)
+            with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+                futures = {
+                    key: pool.submit(
+                        self._run_solver, commands, self._work_dir / f"job_{i}",
+                    )
+                    for i, (key, commands) in enumerate(pending.items())
+                }
+                for key, future in futures.items():
+                    data = future.result()
+                    solved[key] = self._root_strategy(data)
+                    self._cache_put(key, data, solved[key])
+
+        return [
+            self._output_for_hero(solved[key], solver_input)
+            for key, solver_input in zip(keys, solver_inputs)
+        ]
+
+    def _run_solver(self, commands: str, job_dir: Path) -> dict:
+        """Run the solver on a spot's commands (see _spot_commands) in job_dir
+        and load its output's root node."""
+        job_dir.mkdir(exist_ok=True)
+        input_dir = self._input_dir / job_dir.relative_to(self._work_dir)
+        input_dir.mkdir(exist_ok=True)
+        input_path = input_dir / "input.txt"
+        output_path = job_dir / "output_result.json"
 
-        # Clean previous output
-        if output_path.exists():
-            output_path.unlink()
+        # Clean previous output so a failed run cannot return stale data
+        output_path.unlink(missing_ok=True)
 
         # 1. Write input file
-        self._write_input_file(input_path, output_path, solver_input)
+        self._write_input_file(input_path, output_path, commands)
 
-        # 2. Run solver subprocess
+        # 2. Start the solver. Progress output is discarded and stderr goes
+        # to a file, so no pipes are drained or decoded on the way.
+        stderr_path = job_dir / "stderr.log"
         try:
-            result = subprocess.run(
-                [str(self._config.binary_path), "-i", str(input_path)],
-                capture_output=True,
-                text=True,
-                timeout=self._config.max_solve_seconds,
-                cwd=str(self._work_dir),
-            )
-        except subprocess.TimeoutExpired as e:
-            raise SolverError(
-                f"TexasSolver timed out after {self._config.max_solve_seconds}s"
-            ) from e
+            with open(stderr_path, "wb") as stderr_f:
+                proc = subprocess.Popen(
+                    [str(self._config.binary_path), "-i", str(input_path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_f,
+                    cwd=str(job_dir),
+                )
         except FileNotFoundError as e:
+            self._available = None  # Re-check on the next is_available()
             raise SolverError(
                 f"TexasSolver binary not found: {self._config.binary_path}"
             ) from e
 
-        if result.returncode != 0:
+        # 3. Wait for the output, parsing it as soon as it is complete
+        # rather than after the solver has also freed its game tree.
+        deadline = time.monotonic() + self._config.max_solve_seconds
+        last_size = 0
+        while (returncode := proc.poll()) is None:
+            try:
+                size = os.stat(output_path).st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size == last_size:
+                try:
+                    data = self._load_output(output_path)
+                except SolverError:
+                    pass  # Still being written
+                else:
+                    threading.Thread(
+                        target=self._reap, args=(proc,), daemon=True,
+                    ).start()
+                    return data
+            last_size = size
+            if time.monotonic() >= deadline:
+                proc.kill()
+                proc.wait()
+                raise SolverError(
+                    f"TexasSolver timed out after {self._config.max_solve_seconds}s"
+                )
+            time.sleep(_OUTPUT_POLL_SECONDS)
+
+        if returncode != 0:
             raise SolverError(
-                f"TexasSolver exited with code {result.returncode}: "
-                f"{result.stderr[:500]}"
+                f"TexasSolver exited with code {returncode}: "
+                f"{self._stderr_tail(stderr_path)}"
             )
 
-        # 3. Parse output
-        if not output_path.exists():
-            raise SolverError("TexasSolver did not produce output_result.json")
+        # 4. Parse output (a missing file surfaces from the open)
+        return self._load_output(output_path)
+
+    def _reap(self, proc: subprocess.Popen) -> None:
+        """Wait out a solver whose output was already parsed."""
+        try:
+            returncode = proc.wait(timeout=self._config.max_solve_seconds)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            returncode = proc.wait()
+        if returncode != 0:
+            logger.warning(
+                "TexasSolver exited with code %d after writing its output",
+                returncode,
+            )
 
-        return self._parse_output(output_path, solver_input)
+    @staticmethod
+    def _stderr_tail(stderr_path: Path, limit: int = 500) -> str:
+        """Return the last `limit` bytes of the solver's stderr log."""
+        try:
+            with open(stderr_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - limit))
+                return f.read().decode(errors="replace")
+        except OSError:
+            return ""
 
     def cleanup(self) -> None:
         """Remove the working directory and all temp files."""
         if self._work_dir.exists():
             shutil.rmtree(self._work_dir, ignore_errors=True)
+        if self._input_dir.exists():
+            shutil.rmtree(self._input_dir, ignore_errors=True)
+
+    # -------------------------------------------------------------------
+    # Result cache
+    # -------------------------------------------------------------------
+
+    @staticmethod
+    def _cache_key(commands: str) -> str:
+        """Key a spot by its commands. Pot and stack are already whole chips."""
+        return hashlib.sha1(commands.encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> _RootStrategy | None:
+        """Look up a solved root node in memory, then on disk."""
+        table = self._cache.get(key)
+        if table is not None:
+            self._cache.move_to_end(key)
+            return table
+
+        cache_dir = self._config.cache_dir
+        if cache_dir is None:
+            return None
+        try:
+            data = _loads((cache_dir / f"{key}.json").read_bytes())
+            table = self._root_strategy(data)
+        except (*_DECODE_ERRORS, OSError, SolverError):
+            return None
+        self._remember(key, table)
+        return table
+
+    def _cache_put(self, key: str, data: dict, table: _RootStrategy) -> None:
+        """Store a solved root node in memory and, if configured, its
+        decoded output on disk."""
+        self._remember(key, table)
+
+        cache_dir = self._config.cache_dir
+        if cache_dir is None:
+            return
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a reader (another thread or process
+            # sharing cache_dir) never sees a partial file
+            fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_dumps(data))
+                os.replace(tmp_name, cache_dir / f"{key}.json")
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            self._trim_disk_cache(cache_dir)
+        except OSError as e:
+            logger.warning("Failed to write solver cache: %s", e)
+
+    def _remember(self, key: str, table: _RootStrategy) -> None:
+        self._cache[key] = table
+        if len(self._cache) > _MEMORY_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _trim_disk_cache(self, cache_dir: Path) -> None:
+        """Delete the oldest cache files until under max_cache_bytes."""
+        files = [(p.stat(), p) for p in cache_dir.glob("*.json")]
+        total = sum(st.st_size for st, _ in files)
+        if total <= self._config.max_cache_bytes:
+            return
+        files.sort(key=lambda f: f[0].st_mtime)
+        for st, path in files:
+            if total <= self._config.max_cache_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
 
     # -------------------------------------------------------------------
     # Input file generation
@@ -150,39 +434,39 @@ class TexasSolverBridge(SolverBridge):
         self,
         input_path: Path,
         output_path: Path,
-        solver_input: SolverInput,
+        commands: str,
     ) -> None:
-        """Generate a deterministic TexasSolver input file."""
-        board_str = ",".join(str(c) for c in solver_input.board)
-
-        lines = [
-            f"set_pot {solver_input.pot:.0f}",
-            f"set_effective_stack {solver_input.effective_stack:.0f}",
-            f"set_board {board_str}",
-            f"set_range_ip {solver_input.ip_range_str}",
-            f"set_range_oop {solver_input.oop_range_str}",
-        ]
-
-        # Bet sizing: for multi-street solves, include all streets
-        # from the current street onward
-        street_order = ["flop", "turn", "river"]
-        start_idx = street_order.index(solver_input.street)
-        for street in street_order[start_idx:]:
-            lines.extend(_DEFAULT_BET_SIZES.get(street, []))
-
-        lines.extend([
-            "set_allin_threshold 0.67",
-            f"set_thread_num {self._config.thread_count}",
-            f"set_accuracy {self._config.accuracy}",
-            "set_use_isomorphism 1",
-            "build_tree",
-            "start_solve",
-            f"dump_result {output_path}",
-        ])
-
-        input_path.write_text("\n".join(lines) + "\n")
+        """Write a deterministic TexasSolver input file for a spot's commands."""
+        payload = (
+            f"{commands}{self._run_commands}dump_result {output_path}\n"
+        ).encode()
+        fd = os.open(input_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
         logger.debug("Wrote TexasSolver input: %s", input_path)
 
+    def _spot_commands(self, solver_input: SolverInput) -> str:
+        """Build the commands that define what is solved.
+
+        Built once per solve and used both as the result cache key and in
+        the input file. Hero's cards are not among them, so every hand in
+        the spot shares the key; the thread count (in _run_commands) is
+        not either, since it changes only how fast the solve runs.
+        """
+        return (
+            f"set_pot {solver_input.pot:.0f}\n"
+            f"set_effective_stack {solver_input.effective_stack:.0f}\n"
+            f"set_board {solver_input.board_str}\n"
+            f"set_range_ip {solver_input.ip_range_str}\n"
+            f"set_range_oop {solver_input.oop_range_str}\n"
+            f"{_BET_SIZE_BLOCKS[solver_input.street]}"
+            "set_allin_threshold 0.67\n"
+            f"set_accuracy {self._config.accuracy}\n"
+            "set_use_isomorphism 1\n"
+        )
+
     # -------------------------------------------------------------------
     # Output parsing
     # -------------------------------------------------------------------
@@ -201,45 +485,107 @@ class TexasSolverBridge(SolverBridge):
         Raises:
             SolverError: If the output cannot be parsed.
         """
-        try:
-            with open(output_path) as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            raise SolverError(f"Failed to parse solver output: {e}") from e
+        table = self._root_strategy(self._load_output(output_path))
+        return self._output_for_hero(table, solver_input)
 
-        hero_key = self._hand_to_solver_key(solver_input.hero_cards)
+    def _load_output(self, output_path: Path) -> dict:
+        """Decode solver output down to its root node (see _load_root_node).
 
+        Raises:
+            SolverError: If the output cannot be parsed.
+        """
         try:
-            strategy, ev = self._extract_strategy(
-                data, hero_key, solver_input.hero_is_ip,
-            )
-        except (KeyError, IndexError, TypeError) as e:
+            with open(output_path, "rb") as f:
+                if ijson is not None:
+                    return self._load_root_node(f)
+                return self._root_node_only(_loads(f.read()))
+        except FileNotFoundError as e:
             raise SolverError(
-                f"Failed to extract strategy for {hero_key}: {e}"
+                f"TexasSolver did not produce {output_path.name}"
             ) from e
+        except (*_DECODE_ERRORS, OSError) as e:
+            raise SolverError(f"Failed to parse solver output: {e}") from e
 
+    def _output_for_hero(
+        self,
+        table: _RootStrategy,
+        solver_input: SolverInput,
+    ) -> SolverOutput:
+        """Extract hero's hand strategy from a solved root node."""
+        hero_key = self._hand_to_solver_key(solver_input.hero_cards)
+        strategy, ev = self._extract_strategy(
+            table, hero_key, solver_input.hero_is_ip,
+        )
         return SolverOutput(
             hero_strategy=strategy,
             hero_ev=ev,
             converged=True,  # If solver completed without error, it converged
-            exploitability=data.get("exploitability", 0.0),
+            exploitability=table.exploitability,
         )
 
-    def _extract_strategy(
-        self,
-        data: dict,
-        hero_hand_key: str,
-        hero_is_ip: bool,
-    ) -> tuple[dict[str, float], float]:
-        """Extract action frequencies for a specific hand from solver output.
+    @staticmethod
+    def _root_node_only(data: dict) -> dict:
+        """Reduce a fully decoded document to what _load_root_node keeps."""
+        node = {k: v for k, v in data.items() if k in _TOP_LEVEL_FIELDS}
+        if "root" in data:
+            node["root"] = {
+                k: v for k, v in data["root"].items() if k in _ROOT_NODE_FIELDS
+            }
+        if "childrens" in data:
+            node["childrens"] = None
+        return node
+
+    @staticmethod
+    def _load_root_node(f: BinaryIO) -> dict:
+        """Stream-parse solver output, keeping only what _root_strategy reads.
+
+        Returns a dict shaped like the full document but holding just the
+        root node's actions/strategy/ev (top level or under "root") and
+        the exploitability. A "childrens" key is kept as a None marker
+        so node navigation behaves as on the full tree.
+        """
+        data: dict = {}
+        dest: tuple[dict, str] | None = None  # where the value being built goes
+        builder = None
+        depth = 0
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is None:
+                if event == "map_key":
+                    if prefix == "":
+                        if value in _TOP_LEVEL_FIELDS:
+                            dest = (data, value)
+                        elif value == "root":
+                            data["root"] = {}
+                        elif value == "childrens":
+                            data["childrens"] = None
+                    elif prefix == "root" and value in _ROOT_NODE_FIELDS:
+                        dest = (data["root"], value)
+                    continue
+                if dest is None:
+                    continue
+                builder = ijson.ObjectBuilder()
+
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                container, key = dest
+                container[key] = builder.value
+                builder = dest = None
+        return data
+
+    def _root_strategy(self, data: dict) -> _RootStrategy:
+        """Locate the root decision node and pack its strategy into arrays.
 
         TexasSolver JSON structure varies by version. We handle the common
         format where the root node contains "strategy" as a dict mapping
         hand combos to action frequency arrays, and "actions" listing the
         available action names.
 
-        Returns:
-            Tuple of (action_freq_dict, ev).
+        Raises:
+            SolverError: If the root node has no usable strategy data.
         """
         # Navigate to the root node
         # TexasSolver typically stores the tree with root at the top
@@ -261,30 +607,77 @@ class TexasSolverBridge(SolverBridge):
         if not actions or not strategy_data:
             raise SolverError("No strategy data in solver output root node")
 
+        # One row per combo, one column per solver action. Rows shorter
+        # than the action list are zero-padded, longer ones truncated.
+        n_actions = len(actions)
+        rows = list(strategy_data.values())
+        try:
+            strategy = np.array(rows, dtype=float)
+        except (TypeError, ValueError):
+            strategy = None
+        if strategy is None or strategy.shape != (len(rows), n_actions):
+            strategy = np.zeros((len(rows), n_actions))
+            try:
+                for i, freqs in enumerate(rows):
+                    row = freqs[:n_actions]
+                    strategy[i, :len(row)] = row
+            except (TypeError, ValueError) as e:
+                raise SolverError(f"Malformed strategy data: {e}") from e
+
+        # Solver actions that map to the same name (e.g. several bet
+        # sizes -> "raise") share a group and are summed together
+        mapped_actions = [self._map_action_name(a) for a in actions]
+        action_names = list(dict.fromkeys(mapped_actions))
+        action_groups = np.array(
+            [action_names.index(m) for m in mapped_actions], dtype=np.intp,
+        )
+
+        return _RootStrategy(
+            combo_index={combo: i for i, combo in enumerate(strategy_data)},
+            strategy=strategy,
+            action_groups=action_groups,
+            action_names=action_names,
+            ev=node.get("ev", {}),
+            exploitability=data.get("exploitability", 0.0),
+        )
+
+    def _extract_strategy(
+        self,
+        table: _RootStrategy,
+        hero_hand_key: str,
+        hero_is_ip: bool,
+    ) -> tuple[dict[str, float], float]:
+        """Extract action frequencies for a specific hand from a solved root node.
+
+        Returns:
+            Tuple of (action_freq_dict, ev).
+        """
         # Look up hero's hand
-        hand_freqs = strategy_data.get(hero_hand_key)
-        if hand_freqs is None:
+        i = table.combo_index.get(hero_hand_key)
+        if i is None:
             # Try lowercase variant
-            hand_freqs = strategy_data.get(hero_hand_key.lower())
-        if hand_freqs is None:
+            i = table.combo_index.get(hero_hand_key.lower())
+        if i is None:
             raise SolverError(
                 f"Hand {hero_hand_key} not found in solver output"
             )
 
-        # Map action names to our convention with frequencies
+        # Sum non-negligible frequencies per action group, listing groups
+        # in the order their first kept column appears
+        row = table.strategy[i]
+        keep = ~(row < 0.001)  # Not "row >= 0.001": NaN rows are kept, as before
+        groups = table.action_groups[keep]
+        totals = np.bincount(
+            groups, weights=row[keep], minlength=len(table.action_names),
+        ).tolist()
+        names = table.action_names
         result: dict[str, float] = {}
-        for i, action_name in enumerate(actions):
-            if i >= len(hand_freqs):
-                break
-            freq = hand_freqs[i]
-            if freq < 0.001:
-                continue  # Skip negligible actions
-            mapped = self._map_action_name(action_name)
-            # Aggregate if multiple solver actions map to the same name
-            result[mapped] = result.get(mapped, 0.0) + freq
+        for g in groups.tolist():
+            if names[g] not in result:
+                result[names[g]] = totals[g]
 
         # Extract EV if available
-        ev_data = node.get("ev", {})
+        ev_data = table.ev
         ev = 0.0
         if isinstance(ev_data, dict):
             ev = ev_data.get(hero_hand_key, ev_data.get(hero_hand_key.lower(), 0.0))
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Sequence
+from dataclasses import replace
 
 from poker_bot.core.game_context import GameContext
 from poker_bot.core.game_state import GameState
@@ -38,10 +40,20 @@ from poker_bot.solver.range_estimator import RangeEstimator
 from poker_bot.strategy.decision_maker import PriorAction
 from poker_bot.strategy.preflop_ranges import OPENING_RANGES, Range
 from poker_bot.strategy.tournament_strategy import survival_premium
-from poker_bot.utils.constants import Street
+from poker_bot.utils.constants import Position, Street
 
 logger = logging.getLogger("poker_bot.solver.external_engine")
 
+# Sent when a range converts to an empty string
+_FALLBACK_RANGE = "AA,KK,QQ,JJ,TT,99,88,77,66,55,44,33,22,AKs,AKo"
+
+# Hero's opening range per position, already in TexasSolver notation
+_OPENING_RANGE_STRS: dict[Position, str] = {
+    pos: RangeConverter.to_texas_solver(OPENING_RANGES.get(pos, Range()))
+    or _FALLBACK_RANGE
+    for pos in Position
+}
+
 
 class ExternalSolverEngine:
     """Pure GTO solver relay. No heuristics. No estimation.
@@ -111,6 +123,59 @@ class ExternalSolverEngine:
         Returns:
             SolverResult with CFR-computed strategy, or GTO_UNAVAILABLE.
         """
+        return self._solve(
+            game_state, context, hero_index, action_history, opponent_range,
+        )
+
+    def solve_batch(self, spots: Sequence[tuple]) -> list[SolverResult]:
+        """Solve several spots, running their external solves concurrently.
+
+        Each spot is the argument tuple for solve(): (game_state, context,
+        hero_index[, action_history[, opponent_range]]). Results match
+        calling solve() on each spot in turn.
+        """
+        outputs: dict[int, SolverOutput] = {}
+        if self._bridge is not None and self._bridge.is_available():
+            # On failure, fall back to one solve per spot so a single bad
+            # spot only costs its own result
+            try:
+                inputs: dict[int, SolverInput] = {}
+                for i, spot in enumerate(spots):
+                    game_state, _, hero_index, *rest = spot
+                    hero = game_state.players[hero_index]
+                    if (
+                        game_state.current_street == Street.PREFLOP
+                        or not hero.hole_cards
+                        or len(hero.hole_cards) < 2
+                    ):
+                        continue
+                    action_history = (rest[0] if rest else None) or []
+                    opponent_range = rest[1] if len(rest) > 1 else None
+                    inputs[i] = self._build_solver_input(
+                        hero, game_state, action_history, opponent_range,
+                    )
+                solved = self._bridge.solve_many(list(inputs.values()))
+                outputs = dict(zip(inputs, solved))
+            except SolverError as e:
+                logger.warning("Batch solve failed, solving spots singly: %s", e)
+            except Exception:
+                logger.exception("Unexpected error in batch solve")
+
+        return [
+            self._solve(*spot, solver_output=outputs.get(i))
+            for i, spot in enumerate(spots)
+        ]
+
+    def _solve(
+        self,
+        game_state: GameState,
+        context: GameContext,
+        hero_index: int,
+        action_history: list[PriorAction] | None = None,
+        opponent_range: Range | None = None,
+        solver_output: SolverOutput | None = None,
+    ) -> SolverResult:
+        """solve(), optionally with the postflop solver output already computed."""
         t_start = time.perf_counter()
         hero = game_state.players[hero_index]
         action_history = action_history or []
@@ -136,6 +201,7 @@ class ExternalSolverEngine:
         else:
             result = self._solve_postflop(
                 hero, game_state, context, action_history, opponent_range,
+                solver_output,
             )
 
         # Apply ICM adjustment for tournaments (mathematically sound, not heuristic)
@@ -145,26 +211,25 @@ class ExternalSolverEngine:
             and result.source != "gto_unavailable"
         ):
             logger.debug("ICM adjustment: premium=%.2f", premium)
-            result = SolverResult(
+            result = replace(
+                result,
                 strategy=adjust_for_icm(result.strategy, premium),
-                source=result.source,
-                confidence=result.confidence,
                 ev=result.ev * premium,
-                spot_key=result.spot_key,
             )
 
-        elapsed_ms = (time.perf_counter() - t_start) * 1000
-        rec = result.strategy.recommended_action
-        rec_str = f"{rec.action} {rec.frequency:.0%}" if rec else "none"
-        logger.info(
-            "%s → %s (source=%s, confidence=%.0f%%, ev=%.2f, %.1fms)",
-            game_state.current_street.value,
-            rec_str,
-            result.source,
-            result.confidence * 100,
-            result.ev,
-            elapsed_ms,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            elapsed_ms = (time.perf_counter() - t_start) * 1000
+            rec = result.strategy.recommended_action
+            rec_str = f"{rec.action} {rec.frequency:.0%}" if rec else "none"
+            logger.info(
+                "%s → %s (source=%s, confidence=%.0f%%, ev=%.2f, %.1fms)",
+                game_state.current_street.value,
+                rec_str,
+                result.source,
+                result.confidence * 100,
+                result.ev,
+                elapsed_ms,
+            )
 
         return result
 
@@ -179,20 +244,23 @@ class ExternalSolverEngine:
             stack_bb=context.stack_depth_bb,
             survival_premium=premium,
         )
-        logger.debug(
-            "Preflop lookup: %.1fms (source=%s)",
-            (time.perf_counter() - t0) * 1000,
-            result.source,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Preflop lookup: %.1fms (source=%s)",
+                (time.perf_counter() - t0) * 1000,
+                result.source,
+            )
         return result
 
     def _solve_postflop(
         self, hero, game_state, context, action_history, opponent_range,
+        solver_output=None,
     ):
         """Route postflop to external CFR solver.
 
         If the solver bridge is unavailable or fails, returns GTO_UNAVAILABLE.
-        No heuristic fallback. No estimation. No guessing.
+        No heuristic fallback. No estimation. No guessing. A solver_output
+        computed by solve_batch() is mapped without calling the bridge.
         """
         # Check bridge availability
         if self._bridge is None:
@@ -208,6 +276,7 @@ class ExternalSolverEngine:
         try:
             return self._run_external_solve(
                 hero, game_state, context, action_history, opponent_range,
+                solver_output,
             )
         except SolverError as e:
             logger.error("External solver failed: %s", e)
@@ -218,48 +287,71 @@ class ExternalSolverEngine:
 
     def _run_external_solve(
         self, hero, game_state, context, action_history, opponent_range,
+        solver_output=None,
     ):
         """Build SolverInput, invoke bridge, map SolverOutput → SolverResult.
 
         This is where we translate between our internal data model and the
         external solver's wire format. Zero interpretation of the results.
         """
+        if solver_output is None:
+            solver_input = self._build_solver_input(
+                hero, game_state, action_history, opponent_range,
+            )
+            street = solver_input.street
+            t0 = time.perf_counter()
+            solver_output = self._bridge.solve(solver_input)
+            solve_ms = (time.perf_counter() - t0) * 1000
+
+            logger.debug(
+                "External solve: %.1fms (converged=%s, exploitability=%.3f%%)",
+                solve_ms,
+                solver_output.converged,
+                solver_output.exploitability,
+            )
+        else:
+            street = PostflopSolver._detect_street(game_state.community_cards)
+
+        return self._map_output(solver_output, hero, game_state, street)
+
+    def _build_solver_input(
+        self, hero, game_state, action_history, opponent_range,
+    ) -> SolverInput:
+        """Translate the game state into the solver's standardized input."""
         board = game_state.community_cards
         street = PostflopSolver._detect_street(board)
 
+        # One pass over the villains: positions, primary villain, and
+        # effective stack (min of hero/villain chips)
+        villain_positions: list[Position] = []
+        villain_pos = None
+        effective_stack = hero.chips
+        for p in game_state.active_players:
+            if p is hero:
+                continue
+            if villain_pos is None:
+                villain_pos = p.position
+            villain_positions.append(p.position)
+            if p.chips < effective_stack:
+                effective_stack = p.chips
+
         # Determine position
-        villain_positions = [
-            p.position.value
-            for p in game_state.active_players
-            if p is not hero
-        ]
         hero_is_ip = PostflopSolver._is_in_position(
-            hero.position.value, villain_positions,
+            hero.position, villain_positions,
         )
 
         # Hero range: position-based opening range
-        hero_range = OPENING_RANGES.get(hero.position, Range())
-        hero_range_str = RangeConverter.to_texas_solver(hero_range)
-        if not hero_range_str:
-            hero_range_str = "AA,KK,QQ,JJ,TT,99,88,77,66,55,44,33,22,AKs,AKo"
+        hero_range_str = _OPENING_RANGE_STRS[hero.position]
 
         # Opponent range: estimate from action history or use provided
         if opponent_range is not None:
             opp_range = opponent_range
         else:
-            # Find primary villain position
-            villain_pos = None
-            for p in game_state.active_players:
-                if p is not hero:
-                    villain_pos = p.position
-                    break
             opp_range = RangeEstimator.estimate_preflop_range(
                 villain_pos, action_history,
             )
 
-        opp_range_str = RangeConverter.to_texas_solver(opp_range)
-        if not opp_range_str:
-            opp_range_str = "AA,KK,QQ,JJ,TT,99,88,77,66,55,44,33,22,AKs,AKo"
+        opp_range_str = RangeConverter.to_texas_solver(opp_range) or _FALLBACK_RANGE
 
         # Assign IP/OOP ranges
         if hero_is_ip:
@@ -269,13 +361,7 @@ class ExternalSolverEngine:
             ip_range_str = opp_range_str
             oop_range_str = hero_range_str
 
-        # Effective stack
-        villain_stacks = [
-            p.chips for p in game_state.active_players if p is not hero
-        ]
-        effective_stack = min(hero.chips, min(villain_stacks)) if villain_stacks else hero.chips
-
-        solver_input = SolverInput(
+        return SolverInput(
             board=board,
             hero_cards=hero.hole_cards,
             pot=game_state.pot,
@@ -286,19 +372,6 @@ class ExternalSolverEngine:
             street=street,
         )
 
-        t0 = time.perf_counter()
-        solver_output = self._bridge.solve(solver_input)
-        solve_ms = (time.perf_counter() - t0) * 1000
-
-        logger.debug(
-            "External solve: %.1fms (converged=%s, exploitability=%.3f%%)",
-            solve_ms,
-            solver_output.converged,
-            solver_output.exploitability,
-        )
-
-        return self._map_output(solver_output, hero, game_state, street)
-
     def _map_output(
         self, output: SolverOutput, hero, game_state, street: str,
     ) -> SolverResult:
@@ -307,22 +380,21 @@ class ExternalSolverEngine:
         The frequencies come through exactly as the CFR solver computed them.
         We only translate action names and pack into our SolverResult type.
         """
-        actions = []
-        for action_name, freq in output.hero_strategy.items():
-            # Map raise to a sizing (use pot-relative sizing)
-            amount = 0.0
-            if action_name == "raise":
-                amount = game_state.pot * 0.75  # Default sizing from solver tree
-            actions.append(
-                ActionFrequency(
-                    action=action_name,
-                    frequency=freq,
-                    amount=amount,
-                    ev=output.hero_ev * freq,
-                )
+        # Normalize while packing rather than through StrategyNode.normalized()
+        freqs = output.hero_strategy
+        total = sum(freqs.values())
+        scale = total if total > 0 else 1.0
+        # Map raise to a sizing (use pot-relative sizing)
+        raise_amount = game_state.pot * 0.75  # Default sizing from solver tree
+        strategy = StrategyNode(actions=[
+            ActionFrequency(
+                action=action_name,
+                frequency=freq / scale,
+                amount=raise_amount if action_name == "raise" else 0.0,
+                ev=output.hero_ev * freq,
             )
-
-        strategy = StrategyNode(actions=actions).normalized()
+            for action_name, freq in freqs.items()
+        ])
 
         return SolverResult(
             strategy=strategy,
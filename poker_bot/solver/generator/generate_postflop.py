@@ -1,5 +1,8 @@
 """Offline generator: builds postflop_strategies.json from heuristic GTO rules.
 
+The same data is also written as the postflop_strategies.py module, which
+PostflopSolver imports (bytecode-cached) instead of parsing the JSON.
+
 Encodes standard GTO postflop strategies including:
 - C-bet frequencies by board texture
 - Check-raise frequencies
@@ -14,6 +17,8 @@ from __future__ import annotations
 
 import json
 import os
+import pprint
+from collections.abc import Callable
 from pathlib import Path
 
 # Board texture buckets
@@ -34,11 +39,75 @@ HAND_CATEGORIES = [
 SPR_BUCKETS = ["low", "medium", "high"]
 
 
-def _strategy(actions: list[tuple[str, float, float, float]]) -> list[dict]:
-    """Build strategy list from (action, freq, amount_frac, ev) tuples."""
+# Strategy templates: (action, frequency, amount as a multiple of the
+# board's c-bet size, ev). Each is defined once and sized per board.
+_Template = tuple[tuple[str, float, float, float], ...]
+
+_NUTS_LOW_SPR: _Template = (("raise", 0.90, 1.5, 3.0), ("call", 0.10, 0.0, 2.0))
+_NUTS_WET: _Template = (("raise", 0.85, 1.0, 2.5), ("call", 0.10, 0.0, 1.5), ("check", 0.05, 0.0, 1.0))
+_NUTS: _Template = (("raise", 0.80, 1.0, 2.0), ("call", 0.12, 0.0, 1.5), ("check", 0.08, 0.0, 1.0))
+
+_STRONG_MADE_LOW_SPR: _Template = (("raise", 0.80, 1.2, 2.0), ("call", 0.15, 0.0, 1.0), ("fold", 0.05, 0.0, 0.0))
+_STRONG_MADE_WET: _Template = (("raise", 0.70, 1.0, 1.5), ("call", 0.20, 0.0, 0.8), ("check", 0.10, 0.0, 0.5))
+_STRONG_MADE: _Template = (("raise", 0.65, 1.0, 1.2), ("call", 0.22, 0.0, 0.7), ("check", 0.13, 0.0, 0.4))
+
+_MEDIUM_MADE_LOW_SPR: _Template = (("raise", 0.40, 1.0, 0.5), ("call", 0.35, 0.0, 0.3), ("check", 0.15, 0.0, 0.1), ("fold", 0.10, 0.0, 0.0))
+_MEDIUM_MADE_MONOTONE: _Template = (("check", 0.40, 0.0, 0.1), ("call", 0.30, 0.0, 0.2), ("raise", 0.20, 1.0, 0.3), ("fold", 0.10, 0.0, 0.0))
+_MEDIUM_MADE: _Template = (("raise", 0.35, 0.8, 0.4), ("call", 0.35, 0.0, 0.3), ("check", 0.25, 0.0, 0.1), ("fold", 0.05, 0.0, 0.0))
+
+_WEAK_MADE_WET: _Template = (("check", 0.45, 0.0, 0.0), ("fold", 0.30, 0.0, 0.0), ("call", 0.20, 0.0, -0.1), ("raise", 0.05, 1.0, -0.2))
+_WEAK_MADE: _Template = (("check", 0.55, 0.0, 0.0), ("call", 0.25, 0.0, -0.1), ("fold", 0.15, 0.0, 0.0), ("raise", 0.05, 0.5, -0.1))
+
+_STRONG_DRAW_LOW_SPR: _Template = (("raise", 0.60, 1.5, 1.0), ("call", 0.30, 0.0, 0.5), ("fold", 0.10, 0.0, 0.0))
+_STRONG_DRAW: _Template = (("raise", 0.50, 1.0, 0.8), ("call", 0.35, 0.0, 0.4), ("check", 0.15, 0.0, 0.1))
+
+_MEDIUM_DRAW_HIGH_SPR: _Template = (("call", 0.40, 0.0, 0.2), ("check", 0.35, 0.0, 0.0), ("raise", 0.25, 1.0, 0.3))
+_MEDIUM_DRAW: _Template = (("check", 0.40, 0.0, 0.0), ("call", 0.35, 0.0, 0.1), ("raise", 0.20, 0.8, 0.1), ("fold", 0.05, 0.0, 0.0))
+
+_WEAK_DRAW: _Template = (("check", 0.50, 0.0, 0.0), ("fold", 0.35, 0.0, 0.0), ("call", 0.15, 0.0, -0.1))
+
+# Bluff more on dry low boards
+_AIR_DRY_LOW: _Template = (("fold", 0.55, 0.0, 0.0), ("raise", 0.20, 1.0, -0.3), ("check", 0.25, 0.0, 0.0))
+_AIR_WET: _Template = (("fold", 0.70, 0.0, 0.0), ("check", 0.20, 0.0, 0.0), ("raise", 0.10, 1.0, -0.5))
+_AIR: _Template = (("fold", 0.60, 0.0, 0.0), ("check", 0.25, 0.0, 0.0), ("raise", 0.15, 1.0, -0.4))
+
+# Per-category template choice from
+# (low_spr, high_spr, is_dry, is_wet, is_monotone, is_high)
+_CATEGORY_TABLE: dict[str, Callable[[bool, bool, bool, bool, bool, bool], _Template]] = {
+    "nuts": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: (
+        _NUTS_LOW_SPR if low_spr else _NUTS_WET if is_wet else _NUTS
+    ),
+    "strong_made": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: (
+        _STRONG_MADE_LOW_SPR if low_spr else _STRONG_MADE_WET if is_wet else _STRONG_MADE
+    ),
+    "medium_made": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: (
+        _MEDIUM_MADE_LOW_SPR if low_spr
+        else _MEDIUM_MADE_MONOTONE if is_monotone
+        else _MEDIUM_MADE
+    ),
+    "weak_made": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: (
+        _WEAK_MADE_WET if is_wet or is_monotone else _WEAK_MADE
+    ),
+    "strong_draw": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: (
+        _STRONG_DRAW_LOW_SPR if low_spr else _STRONG_DRAW
+    ),
+    "medium_draw": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: (
+        _MEDIUM_DRAW_HIGH_SPR if high_spr else _MEDIUM_DRAW
+    ),
+    "weak_draw": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: _WEAK_DRAW,
+    "air": lambda low_spr, high_spr, is_dry, is_wet, is_monotone, is_high: (
+        _AIR_DRY_LOW if is_dry and not is_high
+        else _AIR_WET if is_wet or is_monotone
+        else _AIR
+    ),
+}
+
+
+def _strategy(template: _Template, cbet_size: float) -> list[dict]:
+    """Build strategy list from a template sized to the board's c-bet."""
     return [
-        {"action": a, "frequency": f, "amount": amt, "ev": ev}
-        for a, f, amt, ev in actions
+        {"action": a, "frequency": f, "amount": cbet_size * mult, "ev": ev}
+        for a, f, mult, ev in template
     ]
 
 
@@ -85,55 +154,11 @@ def _category_strategy(
     cbet_size: float,
 ) -> list[dict]:
     """Generate strategy for a specific hand category + texture + SPR."""
-    low_spr = spr_bucket == "low"
-    high_spr = spr_bucket == "high"
-
-    if category == "nuts":
-        if low_spr:
-            return _strategy([("raise", 0.90, cbet_size * 1.5, 3.0), ("call", 0.10, 0.0, 2.0)])
-        if is_wet:
-            return _strategy([("raise", 0.85, cbet_size, 2.5), ("call", 0.10, 0.0, 1.5), ("check", 0.05, 0.0, 1.0)])
-        return _strategy([("raise", 0.80, cbet_size, 2.0), ("call", 0.12, 0.0, 1.5), ("check", 0.08, 0.0, 1.0)])
-
-    if category == "strong_made":
-        if low_spr:
-            return _strategy([("raise", 0.80, cbet_size * 1.2, 2.0), ("call", 0.15, 0.0, 1.0), ("fold", 0.05, 0.0, 0.0)])
-        if is_wet:
-            return _strategy([("raise", 0.70, cbet_size, 1.5), ("call", 0.20, 0.0, 0.8), ("check", 0.10, 0.0, 0.5)])
-        return _strategy([("raise", 0.65, cbet_size, 1.2), ("call", 0.22, 0.0, 0.7), ("check", 0.13, 0.0, 0.4)])
-
-    if category == "medium_made":
-        if low_spr:
-            return _strategy([("raise", 0.40, cbet_size, 0.5), ("call", 0.35, 0.0, 0.3), ("check", 0.15, 0.0, 0.1), ("fold", 0.10, 0.0, 0.0)])
-        if is_monotone:
-            return _strategy([("check", 0.40, 0.0, 0.1), ("call", 0.30, 0.0, 0.2), ("raise", 0.20, cbet_size, 0.3), ("fold", 0.10, 0.0, 0.0)])
-        return _strategy([("raise", 0.35, cbet_size * 0.8, 0.4), ("call", 0.35, 0.0, 0.3), ("check", 0.25, 0.0, 0.1), ("fold", 0.05, 0.0, 0.0)])
-
-    if category == "weak_made":
-        if is_wet or is_monotone:
-            return _strategy([("check", 0.45, 0.0, 0.0), ("fold", 0.30, 0.0, 0.0), ("call", 0.20, 0.0, -0.1), ("raise", 0.05, cbet_size, -0.2)])
-        return _strategy([("check", 0.55, 0.0, 0.0), ("call", 0.25, 0.0, -0.1), ("fold", 0.15, 0.0, 0.0), ("raise", 0.05, cbet_size * 0.5, -0.1)])
-
-    if category == "strong_draw":
-        if low_spr:
-            return _strategy([("raise", 0.60, cbet_size * 1.5, 1.0), ("call", 0.30, 0.0, 0.5), ("fold", 0.10, 0.0, 0.0)])
-        return _strategy([("raise", 0.50, cbet_size, 0.8), ("call", 0.35, 0.0, 0.4), ("check", 0.15, 0.0, 0.1)])
-
-    if category == "medium_draw":
-        if high_spr:
-            return _strategy([("call", 0.40, 0.0, 0.2), ("check", 0.35, 0.0, 0.0), ("raise", 0.25, cbet_size, 0.3)])
-        return _strategy([("check", 0.40, 0.0, 0.0), ("call", 0.35, 0.0, 0.1), ("raise", 0.20, cbet_size * 0.8, 0.1), ("fold", 0.05, 0.0, 0.0)])
-
-    if category == "weak_draw":
-        return _strategy([("check", 0.50, 0.0, 0.0), ("fold", 0.35, 0.0, 0.0), ("call", 0.15, 0.0, -0.1)])
-
-    # air
-    if is_dry and not is_high:
-        # Bluff more on dry low boards
-        return _strategy([("fold", 0.55, 0.0, 0.0), ("raise", 0.20, cbet_size, -0.3), ("check", 0.25, 0.0, 0.0)])
-    if is_wet or is_monotone:
-        return _strategy([("fold", 0.70, 0.0, 0.0), ("check", 0.20, 0.0, 0.0), ("raise", 0.10, cbet_size, -0.5)])
-    return _strategy([("fold", 0.60, 0.0, 0.0), ("check", 0.25, 0.0, 0.0), ("raise", 0.15, cbet_size, -0.4)])
+    template = _CATEGORY_TABLE[category](
+        spr_bucket == "low", spr_bucket == "high",
+        is_dry, is_wet, is_monotone, is_high,
+    )
+    return _strategy(template, cbet_size)
 
 
 def generate_postflop_data() -> dict:
@@ -144,15 +169,36 @@ def generate_postflop_data() -> dict:
     return data
 
 
+def _round_floats(obj, ndigits: int = 3):
+    """Round every float in a nested dict/list structure to ndigits places."""
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    if isinstance(obj, dict):
+        return {k: _round_floats(v, ndigits) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_round_floats(v, ndigits) for v in obj]
+    return obj
+
+
 def main() -> None:
-    """Generate and save postflop_strategies.json."""
-    data = generate_postflop_data()
+    """Generate and save postflop_strategies.json and postflop_strategies.py."""
+    # Products like 0.33 * 1.5 carry float noise (0.49500000000000005);
+    # three places is well past what any strategy frequency or sizing means.
+    data = _round_floats(generate_postflop_data())
     out_path = Path(__file__).parent.parent / "data" / "postflop_strategies.json"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Compact: the file is a load-time asset, not something read by hand
+    out_path.write_text(json.dumps(data, separators=(",", ":")))
     print(f"Generated {out_path} ({os.path.getsize(out_path)} bytes)")
 
+    py_path = out_path.with_suffix(".py")
+    py_path.write_text(
+        '"""Postflop strategy table. Generated by generate_postflop.py; do not edit."""\n'
+        "\n"
+        f"STRATEGIES = {pprint.pformat(data, width=100, sort_dicts=False)}\n"
+    )
+    print(f"Generated {py_path} ({os.path.getsize(py_path)} bytes)")
+
 
 if __name__ == "__main__":
     main()
@@ -14,6 +14,13 @@ import json
 import os
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from poker_bot.strategy.preflop_ranges import (
     CALL_VS_RAISE_RANGES,
     FOUR_BET_RANGES,
@@ -25,33 +32,64 @@ from poker_bot.strategy.preflop_ranges import (
     _RANK_INDEX,
     _RANKS_DESCENDING,
 )
-from poker_bot.strategy.tournament_strategy import _hand_strength_key
 from poker_bot.utils.constants import Position
 
 
-def _hand_strength_score(hand: HandNotation) -> float:
-    """Score a hand 0-1 for determining core vs border status."""
-    r1_val = 13 - _RANK_INDEX[hand.rank1]
-    r2_val = 13 - _RANK_INDEX[hand.rank2]
+# Hand type codes for the arrays below; lower sorts stronger
+_TYPE_CODES = (HandType.PAIR, HandType.SUITED, HandType.OFFSUIT)
 
-    if hand.hand_type == HandType.PAIR:
-        return 0.5 + (r1_val / 13) * 0.5
-    if hand.hand_type == HandType.SUITED:
-        return (r1_val + r2_val) / 26 * 0.8
-    return (r1_val + r2_val) / 26 * 0.6
 
+def _build_hand_tables() -> tuple[tuple[HandNotation, ...], np.ndarray]:
+    """Enumerate all 169 starting hands, strongest first, with their scores.
 
-def _classify_hands_in_range(
-    hand_range: Range,
-) -> tuple[list[HandNotation], list[HandNotation]]:
-    """Split range into core (top 60%) and border (bottom 40%) hands."""
-    sorted_hands = sorted(
-        hand_range.hands,
-        key=_hand_strength_key,
-        reverse=True,
+    Hands are laid out as parallel rank/type arrays so the strength order
+    (pairs, then suited, then offsuit, higher ranks first; the order of
+    _hand_strength_key) is one lexsort and the scores one vectorized pass.
+    """
+    hands: list[HandNotation] = []
+    for i, r1 in enumerate(_RANKS_DESCENDING):
+        hands.append(HandNotation(r1, r1, HandType.PAIR))
+        for r2 in _RANKS_DESCENDING[i + 1:]:
+            hands.append(HandNotation(r1, r2, HandType.SUITED))
+            hands.append(HandNotation(r1, r2, HandType.OFFSUIT))
+
+    rank1 = np.array([_RANK_INDEX[h.rank1] for h in hands], dtype=np.int8)
+    rank2 = np.array([_RANK_INDEX[h.rank2] for h in hands], dtype=np.int8)
+    htype = np.array([_TYPE_CODES.index(h.hand_type) for h in hands], dtype=np.uint8)
+
+    order = np.lexsort((rank2, rank1, htype))
+    rank1, rank2, htype = rank1[order], rank2[order], htype[order]
+
+    r1_val = 13 - rank1.astype(np.float64)
+    r2_val = 13 - rank2.astype(np.float64)
+    scores = np.where(
+        htype == 0,
+        0.5 + (r1_val / 13) * 0.5,
+        (r1_val + r2_val) / 26 * np.where(htype == 1, 0.8, 0.6),
     )
-    split = max(1, int(len(sorted_hands) * 0.6))
-    return sorted_hands[:split], sorted_hands[split:]
+    return tuple(hands[i] for i in order), scores
+
+
+# All starting hands, strongest first; a hand's index is its strength rank
+_ALL_HANDS, _STRENGTH_SCORES = _build_hand_tables()
+_STRENGTH_RANK: dict[HandNotation, int] = {h: i for i, h in enumerate(_ALL_HANDS)}
+
+# Lookups by strength rank for the strategy builders: the 0-1 score that
+# sets a border hand's mixing frequency, and the hand's strategy key
+# ("AKs"). The builders work on ranks because hashing a HandNotation runs
+# the dataclass __hash__ and __eq__ in Python.
+_STRENGTH_SCORE: tuple[float, ...] = tuple(_STRENGTH_SCORES.tolist())
+_HAND_KEY: tuple[str, ...] = tuple(str(h) for h in _ALL_HANDS)
+
+
+def _classify_hands_in_range(hand_range: Range) -> tuple[list[int], list[int]]:
+    """Split range into core (top 60%) and border (bottom 40%) hands.
+
+    Hands are returned as strength ranks, strongest first.
+    """
+    ranks = sorted(map(_STRENGTH_RANK.__getitem__, hand_range.hands))
+    split = max(1, int(len(ranks) * 0.6))
+    return ranks[:split], ranks[split:]
 
 
 def _generate_open_strategies(
@@ -63,16 +101,16 @@ def _generate_open_strategies(
     strategies: dict[str, list[dict]] = {}
 
     # Core hands: pure raise
-    for hand in core:
-        strategies[str(hand)] = [
+    for rank in core:
+        strategies[_HAND_KEY[rank]] = [
             {"action": "raise", "frequency": 1.0, "amount": 2.5, "ev": 0.5},
         ]
 
     # Border hands: mixed raise/fold
-    for hand in border:
-        strength = _hand_strength_score(hand)
+    for rank in border:
+        strength = _STRENGTH_SCORE[rank]
         raise_freq = max(0.3, min(0.7, strength))
-        strategies[str(hand)] = [
+        strategies[_HAND_KEY[rank]] = [
             {"action": "raise", "frequency": raise_freq, "amount": 2.5, "ev": 0.2},
             {"action": "fold", "frequency": 1.0 - raise_freq, "amount": 0.0, "ev": 0.0},
         ]
@@ -91,15 +129,15 @@ def _generate_3bet_strategies(
     # 3-bet range: core pure 3-bet, border mixed
     core_3b, border_3b = _classify_hands_in_range(three_bet_range)
 
-    for hand in core_3b:
-        strategies[str(hand)] = [
+    for rank in core_3b:
+        strategies[_HAND_KEY[rank]] = [
             {"action": "raise", "frequency": 1.0, "amount": 7.5, "ev": 1.0},
         ]
 
-    for hand in border_3b:
-        strength = _hand_strength_score(hand)
+    for rank in border_3b:
+        strength = _STRENGTH_SCORE[rank]
         raise_freq = max(0.3, min(0.7, strength))
-        strategies[str(hand)] = [
+        strategies[_HAND_KEY[rank]] = [
             {"action": "raise", "frequency": raise_freq, "amount": 7.5, "ev": 0.5},
             {"action": "call", "frequency": 1.0 - raise_freq, "amount": 2.5, "ev": 0.2},
         ]
@@ -107,12 +145,9 @@ def _generate_3bet_strategies(
     # Call range (hands not in 3-bet range)
     if call_range:
         for hand in call_range.hands:
-            key = str(hand)
+            key = _HAND_KEY[_STRENGTH_RANK[hand]]
             if key in strategies:
                 continue  # Already covered by 3-bet range
-            core_call, border_call = _classify_hands_in_range(
-                Range(hands={hand})
-            )
             strategies[key] = [
                 {"action": "call", "frequency": 0.9, "amount": 2.5, "ev": 0.1},
                 {"action": "fold", "frequency": 0.1, "amount": 0.0, "ev": 0.0},
@@ -130,15 +165,15 @@ def _generate_4bet_strategies(
 
     core, border = _classify_hands_in_range(four_bet_range)
 
-    for hand in core:
-        strategies[str(hand)] = [
+    for rank in core:
+        strategies[_HAND_KEY[rank]] = [
             {"action": "raise", "frequency": 1.0, "amount": 22.0, "ev": 2.0},
         ]
 
-    for hand in border:
-        strength = _hand_strength_score(hand)
+    for rank in border:
+        strength = _STRENGTH_SCORE[rank]
         raise_freq = max(0.4, min(0.8, strength))
-        strategies[str(hand)] = [
+        strategies[_HAND_KEY[rank]] = [
             {"action": "raise", "frequency": raise_freq, "amount": 22.0, "ev": 1.0},
             {"action": "call", "frequency": 1.0 - raise_freq, "amount": 7.5, "ev": 0.3},
         ]
@@ -196,8 +231,12 @@ def main() -> None:
     data = generate_preflop_data()
     out_path = Path(__file__).parent.parent / "data" / "preflop_strategies.json"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # orjson writes the same bytes as json.dump(indent=2), much faster
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out_path, "w") as f:
+            json.dump(data, f, indent=2)
     print(f"Generated {out_path} ({os.path.getsize(out_path)} bytes)")
 
 
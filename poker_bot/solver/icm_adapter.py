@@ -7,7 +7,35 @@ and decreases aggressive actions.
 
 from __future__ import annotations
 
-from poker_bot.solver.data_structures import ActionFrequency, StrategyNode
+from functools import lru_cache
+
+from poker_bot.solver.data_structures import StrategyNode
+
+# Actions whose frequency or EV the ICM adjustment changes; checks pass
+# through untouched
+_ADJUSTED_ACTIONS = frozenset(("fold", "raise", "all_in", "call"))
+
+# (frequency multiplier, frequency bonus, EV multiplier) for an action
+_Factors = tuple[float, float, float]
+_NO_CHANGE: _Factors = (1.0, 0.0, 1.0)
+
+
+@lru_cache(maxsize=64)
+def _icm_factors(survival_premium: float) -> dict[str, _Factors]:
+    """Per-action ICM adjustment for one survival premium.
+
+    Premiums come from a handful of tournament situations, so the table is
+    built once per premium. Shared: callers must not mutate.
+    """
+    icm_factor = 1.0 - survival_premium  # 0.0 to 0.7
+    # Aggressive actions shrink more than calls; both lose EV to the ICM tax
+    raise_factors = (1.0 - icm_factor * 0.5, 0.0, survival_premium)
+    return {
+        "fold": (1.0, icm_factor * 0.3, 1.0),
+        "raise": raise_factors,
+        "all_in": raise_factors,
+        "call": (1.0 - icm_factor * 0.3, 0.0, survival_premium),
+    }
 
 
 def adjust_for_icm(
@@ -27,37 +55,28 @@ def adjust_for_icm(
             1.0 = chip-EV (no adjustment), lower = more ICM pressure.
 
     Returns:
-        ICM-adjusted StrategyNode with normalized frequencies.
+        ICM-adjusted StrategyNode with normalized frequencies. A strategy
+        with nothing to adjust (no actions, or only checks) is returned
+        as is.
     """
-    if survival_premium >= 0.95 or not strategy.actions:
+    if survival_premium >= 0.95 or not any(
+        af.action in _ADJUSTED_ACTIONS for af in strategy.actions
+    ):
         return strategy
 
-    icm_factor = 1.0 - survival_premium  # 0.0 to 0.7
+    factors = _icm_factors(survival_premium)
 
+    # Adjust frequencies and EVs first, then build each ActionFrequency once,
+    # already normalized
     adjusted = []
     for af in strategy.actions:
-        if af.action == "fold":
-            # Increase fold frequency
-            new_freq = af.frequency + icm_factor * 0.3
-            adjusted.append(ActionFrequency(
-                af.action, new_freq, af.amount, af.ev,
-            ))
-        elif af.action in ("raise", "all_in"):
-            # Decrease aggressive actions more
-            new_freq = max(0.0, af.frequency * (1.0 - icm_factor * 0.5))
-            adjusted.append(ActionFrequency(
-                af.action, new_freq, af.amount,
-                af.ev * survival_premium,  # EV reduced by ICM tax
-            ))
-        elif af.action == "call":
-            # Decrease calling somewhat less
-            new_freq = max(0.0, af.frequency * (1.0 - icm_factor * 0.3))
-            adjusted.append(ActionFrequency(
-                af.action, new_freq, af.amount,
-                af.ev * survival_premium,
-            ))
-        else:
-            # Check — no adjustment
-            adjusted.append(af)
-
-    return StrategyNode(actions=adjusted).normalized()
+        action = af.action
+        freq_mult, freq_bonus, ev_mult = factors.get(action, _NO_CHANGE)
+        adjusted.append((
+            action,
+            max(0.0, af.frequency * freq_mult + freq_bonus),
+            af.amount,
+            af.ev * ev_mult,
+        ))
+
+    return StrategyNode.from_weights(adjusted)
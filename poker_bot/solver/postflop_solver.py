@@ -7,13 +7,21 @@ textures with real-time equity-based fallback for unusual spots.
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from poker_bot.core.equity_calculator import EquityCalculator
 from poker_bot.solver.bet_sizing import BetSizingTree
-from poker_bot.solver.board_bucketing import bucket_board, bucket_spr, bucket_stack
+from poker_bot.solver.board_bucketing import (
+    BUCKET_IDS,
+    bucket_board,
+    bucket_spr,
+    bucket_stack,
+)
 from poker_bot.solver.data_structures import (
-    ActionFrequency,
     SolverResult,
     SpotKey,
     StrategyNode,
@@ -51,10 +59,23 @@ _FULL_CONFIDENCE_MULT = 3
 
 _DATA_PATH = Path(__file__).parent / "data" / "postflop_strategies.json"
 
+# orjson decodes strategy files passed as data_path a few times faster
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# The same table as generated Python, loaded from cached bytecode instead
+# of parsing the JSON on every start-up
+try:
+    from poker_bot.solver.data.postflop_strategies import STRATEGIES as _STRATEGIES
+except ImportError:
+    _STRATEGIES = None
+
 
 # Heuristic strategy tables: hand_category -> board_bucket_type -> strategy
 # Board bucket types: "dry", "wet", "monotone", "paired"
-def _board_bucket_type(bucket: str) -> str:
+def _classify_bucket_type(bucket: str) -> str:
     if "monotone" in bucket:
         return "monotone"
     if "paired" in bucket:
@@ -64,6 +85,17 @@ def _board_bucket_type(bucket: str) -> str:
     return "dry"
 
 
+# Texture type of every bucket bucket_board() can return
+_BUCKET_TYPES: dict[str, str] = {b: _classify_bucket_type(b) for b in BUCKET_IDS}
+
+
+def _board_bucket_type(bucket: str) -> str:
+    texture_type = _BUCKET_TYPES.get(bucket)
+    if texture_type is None:
+        texture_type = _classify_bucket_type(bucket)
+    return texture_type
+
+
 # Heuristic strategies by hand category and general texture type
 # Format: {hand_category: {texture_type: [(action, freq, sizing_frac)]}}
 _HEURISTIC_STRATEGIES: dict[str, dict[str, list[tuple[str, float, float]]]] = {
@@ -117,20 +149,154 @@ _HEURISTIC_STRATEGIES: dict[str, dict[str, list[tuple[str, float, float]]]] = {
     },
 }
 
+# An action as (action, frequency, amount, ev) while a strategy is being
+# built and adjusted; ActionFrequency objects are only created for the
+# returned node.
+_Row = tuple[str, float, float, float]
+
+# _HEURISTIC_STRATEGIES flattened to (hand_category, texture_type) keys.
+# Only raises keep their sizing fraction, resolved per call.
+_HEURISTIC_TABLE: dict[tuple[str, str], tuple[tuple[str, float, float], ...]] = {
+    (category, texture): tuple(
+        (action, freq, sizing_frac if action == "raise" else 0.0)
+        for action, freq, sizing_frac in spec
+    )
+    for category, textures in _HEURISTIC_STRATEGIES.items()
+    for texture, spec in textures.items()
+}
+
+# Ultimate fallback for categories/textures outside the table
+_HEURISTIC_FALLBACK: tuple[tuple[str, float, float], ...] = (
+    ("check", 0.50, 0.0),
+    ("fold", 0.50, 0.0),
+)
+
+
+# Pre-computed strategies keyed by (board_bucket, hand_category, spr_bucket)
+_LookupTable = dict[tuple[str, str, str], tuple[_Row, ...]]
+
+
+def _build_lookup_table(data: dict) -> _LookupTable:
+    """Flatten postflop strategy data into prebuilt, shareable rows."""
+    return {
+        (board_bucket, hand_category, spr_bucket): tuple(
+            (a["action"], a["frequency"], a.get("amount", 0.0), a.get("ev", 0.0))
+            for a in actions_data
+        )
+        for board_bucket, bucket_data in data.items()
+        for hand_category, category_data in bucket_data.items()
+        for spr_bucket, actions_data in category_data.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _default_lookup_table() -> _LookupTable:
+    """The lookup table for the bundled strategies, built once per process."""
+    return _build_lookup_table(_STRATEGIES)
+
+
+# Per-action (frequency, amount) multipliers for one strategy adjustment;
+# actions not listed are left unchanged
+_Factors = dict[str, tuple[float, float]]
+_NO_CHANGE = (1.0, 1.0)
+
+
+def _compose_factors(first: _Factors, second: _Factors) -> _Factors:
+    """Multipliers for applying `first` and then `second`."""
+    composed = dict(first)
+    for action, (freq, amount) in second.items():
+        f, a = composed.get(action, _NO_CHANGE)
+        composed[action] = (f * freq, a * amount)
+    return composed
+
+
+def _stat_bin(value: float, low: float, high: float) -> int:
+    """0 below `low`, 2 above `high`, 1 in between (or NaN)."""
+    if value < low:
+        return 0
+    if value > high:
+        return 2
+    return 1
+
+
+# Hand categories the exploit adjustment treats differently; every other
+# category behaves like "other"
+_EXPLOIT_CLASSES = {
+    "air": "air", "weak_draw": "weak_draw",
+    "nuts": "value", "strong_made": "value",
+}
+
+
+def _build_exploit_table() -> dict[tuple[str, int, int], _Factors]:
+    """Exploit multipliers for every (hand class, fold-to-cbet bin,
+    aggression bin).
+
+    The adjustment only depends on the opponent stats through their side of
+    the fold-to-cbet 30/60 and aggression 1.0/3.0 thresholds.
+    """
+    table = {}
+    for hand_class in ("air", "weak_draw", "value", "other"):
+        for fold_bin in range(3):
+            for agg_bin in range(3):
+                raise_freq = 1.0
+                if hand_class == "air":
+                    # Bluff more vs high folders, less vs low folders
+                    if fold_bin == 2:
+                        raise_freq *= 1.30
+                    elif fold_bin == 0:
+                        raise_freq *= 0.50
+                elif fold_bin == 0:
+                    # Thin value bet more vs stations
+                    raise_freq *= 1.20
+                # vs passive opponents, bluff more (they won't raise back)
+                if agg_bin == 0 and hand_class in ("air", "weak_draw"):
+                    raise_freq *= 1.15
+                # Size down vs high folders (don't need big bets)
+                raise_amount = 0.85 if fold_bin == 2 else 1.0
+                # Trap more vs hyper-aggressive opponents
+                check_freq = 1.25 if agg_bin == 2 and hand_class == "value" else 1.0
+                # Fold less vs passive opponents (they don't bluff)
+                fold_freq = 0.85 if agg_bin == 0 else 1.0
+
+                table[hand_class, fold_bin, agg_bin] = {
+                    "raise": (raise_freq, raise_amount),
+                    "check": (check_freq, 1.0),
+                    "fold": (fold_freq, 1.0),
+                }
+    return table
+
+
+# Shared between calls; never modified
+_EXPLOIT_TABLE = _build_exploit_table()
+
+# Actions counted as raises when summarizing the action sequence
+_RAISE_ACTIONS = frozenset((Action.RAISE, Action.ALL_IN))
+
+# Number of recently solved spots PostflopSolver keeps in memory
+_RESULT_CACHE_SIZE = 4096
+
 
 class PostflopSolver:
     """Postflop strategy solver with lookup and Monte Carlo fallback."""
 
     def __init__(self, data_path: Path | str | None = None) -> None:
-        self._data: dict = {}
+        self._table: _LookupTable = {}
+        # Deterministic results by spot; shared and must not be mutated
+        self._results: OrderedDict[tuple, SolverResult] = OrderedDict()
+        if data_path is None and _STRATEGIES is not None:
+            self._table = _default_lookup_table()
+            return
         path = Path(data_path) if data_path else _DATA_PATH
         if path.exists():
-            with open(path) as f:
-                self._data = json.load(f)
+            self._table = _build_lookup_table(_loads(path.read_bytes()))
 
-    # Postflop action order: SB, BB act first; then UTG, MP, CO, BTN last
+    # Postflop action order: SB, BB act first; then UTG, MP, CO, BTN last.
+    # Keyed by Position member; StrEnum members hash and compare equal to
+    # their values, so plain position strings look up the same entries
+    # while members skip the enum .value access.
     _POSTFLOP_ORDER: dict[str, int] = {
-        "SB": 0, "BB": 1, "UTG": 2, "MP": 3, "CO": 4, "BTN": 5,
+        Position.SB: 0, Position.BB: 1, Position.UTG: 2,
+        Position.MP: 3, Position.CO: 4, Position.BTN: 5,
     }
 
     def get_strategy(
@@ -171,8 +337,54 @@ class PostflopSolver:
         Returns:
             SolverResult with mixed strategy.
         """
-        texture = analyze_board(community_cards)
-        board_bucket = bucket_board(texture)
+        return self._get_strategy(
+            bucket_board(analyze_board(community_cards)),
+            hero_cards, community_cards, position, pot, hero_stack, big_blind,
+            action_history, hand_strength, has_draw, draw_strength,
+            opponent_range, num_opponents, is_ip, opponent_stats,
+        )
+
+    def get_strategy_batch(
+        self, spots: Sequence[Mapping[str, Any]],
+    ) -> list[SolverResult]:
+        """Get mixed strategies for several postflop spots.
+
+        Each spot holds get_strategy() keyword arguments. The board is
+        analyzed once per distinct board, so sweeps over many hands on the
+        same few boards skip most of that work. Results match calling
+        get_strategy() on each spot in turn.
+        """
+        buckets: dict[tuple[Card, ...], str] = {}
+        results = []
+        for spot in spots:
+            community_cards = spot["community_cards"]
+            board = tuple(community_cards)
+            board_bucket = buckets.get(board)
+            if board_bucket is None:
+                board_bucket = bucket_board(analyze_board(community_cards))
+                buckets[board] = board_bucket
+            results.append(self._get_strategy(board_bucket, **spot))
+        return results
+
+    def _get_strategy(
+        self,
+        board_bucket: str,
+        hero_cards: list[Card],
+        community_cards: list[Card],
+        position: Position,
+        pot: float,
+        hero_stack: float,
+        big_blind: float,
+        action_history: list[PriorAction],
+        hand_strength: float,
+        has_draw: bool = False,
+        draw_strength: float = 0.0,
+        opponent_range: Range | None = None,
+        num_opponents: int = 1,
+        is_ip: bool = True,
+        opponent_stats: OpponentStats | None = None,
+    ) -> SolverResult:
+        """get_strategy() for a board already bucketed by bucket_board()."""
         spr = hero_stack / pot if pot > 0 else float("inf")
         spr_bucket = bucket_spr(spr)
         stack_bucket = bucket_stack(hero_stack)
@@ -182,11 +394,30 @@ class PostflopSolver:
         )
 
         street = self._detect_street(community_cards)
+        action_seq = self._action_seq(action_history)
+        exploit_key = (
+            None if opponent_stats is None
+            else self._exploit_key(opponent_stats, hand_category)
+        )
+
+        # Monte Carlo refinement samples, so only the other spots are
+        # cached. The key holds everything the result depends on.
+        wants_equity = bool(opponent_range) and 0.30 <= hand_strength <= 0.75
+        cache_key = None
+        if not wants_equity:
+            cache_key = (
+                board_bucket, street, position, action_seq, hand_category,
+                pot, hero_stack, big_blind, is_ip, num_opponents, exploit_key,
+            )
+            cached = self._results.get(cache_key)
+            if cached is not None:
+                self._results.move_to_end(cache_key)
+                return cached
 
         spot_key = SpotKey(
             street=street,
             position=position.value,
-            action_sequence=self._action_seq(action_history),
+            action_sequence=action_seq,
             stack_bucket=stack_bucket,
             board_bucket=board_bucket,
             spr_bucket=spr_bucket,
@@ -194,62 +425,64 @@ class PostflopSolver:
         )
 
         texture_type = _board_bucket_type(board_bucket)
-        action_seq = self._action_seq(action_history)
 
         # Try pre-computed lookup
-        node = self._lookup(board_bucket, position.value, hand_category, spr_bucket)
-        if node is not None:
+        rows = self._lookup(board_bucket, position.value, hand_category, spr_bucket)
+        if rows is not None:
             # Convert sizing fractions to actual amounts
-            node = self._resolve_amounts(node, pot, hero_stack, big_blind, board_bucket)
-            node = self._apply_position_adjustment(node, is_ip, hand_category)
-            node = self._apply_bluff_trap_adjustment(
-                node, hand_category, texture_type, street, is_ip, action_seq,
+            rows = self._resolve_amounts(rows, pot, hero_stack, big_blind)
+            node = self._apply_adjustments(
+                rows, hand_category, texture_type, street, is_ip, action_seq,
+                num_opponents, exploit_key,
             )
-            if num_opponents >= 2:
-                node = self._apply_multiway_adjustment(node, num_opponents, hand_category)
-            if opponent_stats is not None:
-                node = self._apply_exploit_adjustment(node, opponent_stats, hand_category)
-            return SolverResult(
+            result = SolverResult(
                 strategy=node,
                 source="postflop_lookup",
                 confidence=0.75,
                 ev=node.weighted_ev,
                 spot_key=spot_key,
             )
+            if cache_key is not None:
+                self._remember(cache_key, result)
+            return result
 
         # Heuristic fallback based on hand category and texture
-        node = self._heuristic_strategy(
+        rows = self._heuristic_strategy(
             hand_category, board_bucket, pot, hero_stack, big_blind, spr,
         )
         confidence = 0.6
 
         # Monte Carlo refinement for close decisions
-        if opponent_range and 0.30 <= hand_strength <= 0.75:
+        if wants_equity:
             try:
                 mc_equity = self._monte_carlo_equity(
                     hero_cards, community_cards, opponent_range,
                 )
-                node = self._refine_with_equity(node, mc_equity, spr)
+                rows = self._refine_with_equity(rows, mc_equity, spr)
                 confidence = 0.70
             except ValueError:
                 pass
 
-        node = self._apply_position_adjustment(node, is_ip, hand_category)
-        node = self._apply_bluff_trap_adjustment(
-            node, hand_category, texture_type, street, is_ip, action_seq,
+        node = self._apply_adjustments(
+            rows, hand_category, texture_type, street, is_ip, action_seq,
+            num_opponents, exploit_key,
         )
-        if num_opponents >= 2:
-            node = self._apply_multiway_adjustment(node, num_opponents, hand_category)
-        if opponent_stats is not None:
-            node = self._apply_exploit_adjustment(node, opponent_stats, hand_category)
 
-        return SolverResult(
+        result = SolverResult(
             strategy=node,
             source="heuristic" if confidence < 0.65 else "monte_carlo",
             confidence=confidence,
             ev=node.weighted_ev,
             spot_key=spot_key,
         )
+        if cache_key is not None:
+            self._remember(cache_key, result)
+        return result
+
+    def _remember(self, key: tuple, result: SolverResult) -> None:
+        self._results[key] = result
+        if len(self._results) > _RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
 
     def _lookup(
         self,
@@ -257,26 +490,14 @@ class PostflopSolver:
         position: str,
         hand_category: str,
         spr_bucket: str,
-    ) -> StrategyNode | None:
+    ) -> tuple[_Row, ...] | None:
         """Look up pre-computed postflop strategy."""
-        bucket_data = self._data.get(board_bucket, {})
-        category_data = bucket_data.get(hand_category, {})
-
         # Try exact SPR match, then "any"
-        actions_data = category_data.get(spr_bucket) or category_data.get("any")
-        if actions_data is None:
-            return None
-
-        actions = [
-            ActionFrequency(
-                action=a["action"],
-                frequency=a["frequency"],
-                amount=a.get("amount", 0.0),
-                ev=a.get("ev", 0.0),
-            )
-            for a in actions_data
-        ]
-        return StrategyNode(actions=actions)
+        table = self._table
+        return (
+            table.get((board_bucket, hand_category, spr_bucket))
+            or table.get((board_bucket, hand_category, "any"))
+        )
 
     def _heuristic_strategy(
         self,
@@ -286,60 +507,57 @@ class PostflopSolver:
         hero_stack: float,
         big_blind: float,
         spr: float,
-    ) -> StrategyNode:
+    ) -> list[_Row]:
         """Build a heuristic strategy from the hand category and texture."""
         texture_type = _board_bucket_type(board_bucket)
 
-        category_strategies = _HEURISTIC_STRATEGIES.get(hand_category, {})
-        action_spec = category_strategies.get(texture_type)
-
-        if action_spec is None:
-            # Ultimate fallback
-            action_spec = [("check", 0.50, 0.0), ("fold", 0.50, 0.0)]
-
-        actions = []
-        for action, freq, sizing_frac in action_spec:
-            if action == "raise" and sizing_frac > 0:
-                amount = BetSizingTree.compute_bet_amount(
-                    pot, hero_stack, sizing_frac, big_blind * 2,
-                )
-            elif action == "call":
-                amount = 0.0  # Will be set by caller based on actual bet
-            else:
-                amount = 0.0
-            actions.append(ActionFrequency(action, freq, amount, 0.0))
+        action_spec = _HEURISTIC_TABLE.get(
+            (hand_category, texture_type), _HEURISTIC_FALLBACK,
+        )
 
-        return StrategyNode(actions=actions)
+        # Calls are left at 0.0; the caller sets them from the actual bet
+        min_bet = big_blind * 2
+        return [
+            (
+                action,
+                freq,
+                BetSizingTree.compute_bet_amount(pot, hero_stack, sizing_frac, min_bet)
+                if sizing_frac > 0 else 0.0,
+                0.0,
+            )
+            for action, freq, sizing_frac in action_spec
+        ]
 
     @staticmethod
     def _resolve_amounts(
-        node: StrategyNode,
+        rows: Iterable[_Row],
         pot: float,
         hero_stack: float,
         big_blind: float,
-        board_bucket: str,
-    ) -> StrategyNode:
+    ) -> list[_Row]:
         """Convert sizing fractions in pre-computed data to actual amounts."""
         resolved = []
-        for af in node.actions:
-            if af.action == "raise" and af.amount > 0 and af.amount <= 2.0:
+        for row in rows:
+            action, freq, amount, ev = row
+            if action == "raise" and 0 < amount <= 2.0:
                 # Amount stored as pot fraction
                 actual = BetSizingTree.compute_bet_amount(
-                    pot, hero_stack, af.amount, big_blind * 2,
+                    pot, hero_stack, amount, big_blind * 2,
                 )
-                resolved.append(ActionFrequency(
-                    af.action, af.frequency, actual, af.ev,
-                ))
+                resolved.append((action, freq, actual, ev))
             else:
-                resolved.append(af)
-        return StrategyNode(actions=resolved)
+                resolved.append(row)
+        return resolved
 
     @staticmethod
-    def _is_in_position(hero_position: str, villain_positions: list[str]) -> bool:
+    def _is_in_position(hero_position: str, villain_positions: Iterable[str]) -> bool:
         """Determine if hero acts last (is in position) among active players.
 
         Postflop action order: SB(0), BB(1), UTG(2), MP(3), CO(4), BTN(5).
         Hero is IP if their order value is the highest among all active players.
+        Positions may be Position members or their string values.
+        villain_positions may be a generator; it is consumed only up to the
+        first villain acting after hero.
         """
         order = PostflopSolver._POSTFLOP_ORDER
         hero_order = order.get(hero_position, 0)
@@ -349,59 +567,117 @@ class PostflopSolver:
         return True
 
     @staticmethod
-    def _apply_position_adjustment(
-        node: StrategyNode, is_ip: bool, hand_category: str,
+    def _apply_adjustments(
+        rows: Iterable[_Row],
+        hand_category: str,
+        texture_type: str,
+        street: str,
+        is_ip: bool,
+        action_seq: str,
+        num_opponents: int,
+        exploit_key: tuple[str, int, int] | None,
     ) -> StrategyNode:
-        """Apply IP/OOP multipliers to strategy frequencies and sizing."""
-        adjusted = []
-        for af in node.actions:
-            freq = af.frequency
-            amount = af.amount
+        """Apply the position, bluff/trap, multiway and exploit adjustments.
 
-            if is_ip:
-                if af.action == "raise":
-                    freq *= 1.15
-                    amount *= 0.85
-                    if hand_category == "air":
-                        freq *= 1.20
-                elif af.action == "check":
-                    freq *= 0.80
-                # call and fold unchanged IP
-            else:
-                # OOP
-                if af.action == "check":
-                    freq *= 1.20
-                elif af.action == "raise":
-                    freq *= 0.85
-                    amount *= 1.15
-                elif af.action == "fold":
-                    freq *= 1.10
+        Each adjustment scales an action's frequency and sizing by factors
+        that depend only on the action, so the factors are composed up front
+        and the node is built and normalized once. Normalizing between
+        adjustments is a uniform rescale, so the result is the same as
+        applying them one after another.
+        """
+        position, later, trap_transfer = PostflopSolver._spot_factors(
+            hand_category, texture_type, street, is_ip, action_seq,
+            num_opponents,
+        )
+        if exploit_key is not None:
+            later = _compose_factors(later, _EXPLOIT_TABLE[exploit_key])
 
-            adjusted.append(ActionFrequency(af.action, freq, amount, af.ev))
+        # Trapping moves a share of the (position-adjusted) raise frequency
+        # to check before the later factors apply
+        check_bonus = 0.0
+        if trap_transfer > 0:
+            raise_freq = sum(row[1] for row in rows if row[0] == "raise")
+            check_bonus = raise_freq * position.get("raise", _NO_CHANGE)[0] * trap_transfer
 
-        return StrategyNode(actions=adjusted).normalized()
+        adjusted = []
+        for action, freq, amount, ev in rows:
+            pos_freq, pos_amount = position.get(action, _NO_CHANGE)
+            freq_mult, amount_mult = later.get(action, _NO_CHANGE)
+            freq *= pos_freq
+            if action == "check":
+                freq += check_bonus
+            adjusted.append((
+                action, freq * freq_mult, amount * pos_amount * amount_mult, ev,
+            ))
+        return StrategyNode.from_weights(adjusted)
 
     @staticmethod
-    def _apply_bluff_trap_adjustment(
-        node: StrategyNode,
+    @lru_cache(maxsize=1024)
+    def _spot_factors(
         hand_category: str,
         texture_type: str,
         street: str,
         is_ip: bool,
         action_seq: str,
-    ) -> StrategyNode:
-        """Apply bluffing, trapping, and check-raise adjustments.
+        num_opponents: int,
+    ) -> tuple[_Factors, _Factors, float]:
+        """Position factors, composed bluff/trap and multiway factors, and
+        the trap transfer for a spot.
+
+        These depend only on discrete spot features, so they are computed
+        once per combination; the returned dicts are shared and must not be
+        modified.
+        """
+        position = PostflopSolver._position_factors(is_ip, hand_category)
+        later, trap_transfer = PostflopSolver._bluff_trap_factors(
+            hand_category, texture_type, street, is_ip, action_seq,
+        )
+        if num_opponents >= 2:
+            later = _compose_factors(
+                later,
+                PostflopSolver._multiway_factors(num_opponents, hand_category),
+            )
+        return position, later, trap_transfer
+
+    @staticmethod
+    def _position_factors(is_ip: bool, hand_category: str) -> _Factors:
+        """IP/OOP multipliers for strategy frequencies and sizing."""
+        if is_ip:
+            raise_freq = 1.15
+            if hand_category == "air":
+                raise_freq *= 1.20
+            # call and fold unchanged IP
+            return {"raise": (raise_freq, 0.85), "check": (0.80, 1.0)}
+        # OOP
+        return {
+            "check": (1.20, 1.0),
+            "raise": (0.85, 1.15),
+            "fold": (1.10, 1.0),
+        }
+
+    @staticmethod
+    def _bluff_trap_factors(
+        hand_category: str,
+        texture_type: str,
+        street: str,
+        is_ip: bool,
+        action_seq: str,
+    ) -> tuple[_Factors, float]:
+        """Bluffing, trapping, and check-raise multipliers.
 
         Modulates raise/check frequencies to create balanced bluff lines,
         slow-play traps on static boards, and polarized OOP check-raises.
 
         Args:
-            node: Current strategy node.
             hand_category: Hero's hand category.
             texture_type: Board texture ("dry", "wet", "monotone", "paired").
             street: Current street ("flop", "turn", "river").
             is_ip: Whether hero is in position.
             action_seq: Action sequence ("first_to_act", "checked", "bet", etc.).
+
+        Returns:
+            The raise multiplier, and the share of raise frequency that
+            trapping transfers to check.
         """
         # Street-based bluff scaling: bluffs decrease as pot grows
         street_bluff_scale = {"flop": 1.0, "turn": 0.85, "river": 0.70}.get(street, 1.0)
@@ -429,69 +705,38 @@ class PostflopSolver:
             base_transfer = 0.20 if hand_category == "nuts" else 0.15
             trap_transfer = base_transfer * street_trap_scale
 
-        adjusted = []
-        for af in node.actions:
-            freq = af.frequency
-            amount = af.amount
-
-            if af.action == "raise":
-                if hand_category in ("air", "weak_draw"):
-                    # --- Bluffing adjustments ---
-                    freq *= texture_bluff_mult * street_bluff_scale
-                    # Extra bluff bonus IP (info advantage for barrel selection)
-                    if is_ip:
-                        freq *= 1.10
-                    # OOP check-raise bluff: boost raise when facing a bet
-                    if not is_ip and facing_bet and is_static:
-                        freq *= 1.30
-                elif hand_category in ("nuts", "strong_made"):
-                    # --- Trapping: reduce raise, shift to check ---
-                    if trap_transfer > 0:
-                        freq *= (1.0 - trap_transfer)
-                    # OOP check-raise for value: boost raise when facing a bet
-                    if not is_ip and facing_bet:
-                        freq *= 1.25
-
-            elif af.action == "check":
-                if hand_category in ("nuts", "strong_made") and trap_transfer > 0:
-                    # Receive the transferred frequency from raise
-                    # Find current raise freq to compute absolute transfer
-                    raise_freq = sum(
-                        a.frequency for a in node.actions if a.action == "raise"
-                    )
-                    freq += raise_freq * trap_transfer
-
-            adjusted.append(ActionFrequency(af.action, freq, amount, af.ev))
-
-        return StrategyNode(actions=adjusted).normalized()
+        raise_freq = 1.0
+        if hand_category in ("air", "weak_draw"):
+            # --- Bluffing adjustments ---
+            raise_freq *= texture_bluff_mult * street_bluff_scale
+            # Extra bluff bonus IP (info advantage for barrel selection)
+            if is_ip:
+                raise_freq *= 1.10
+            # OOP check-raise bluff: boost raise when facing a bet
+            if not is_ip and facing_bet and is_static:
+                raise_freq *= 1.30
+        elif hand_category in ("nuts", "strong_made"):
+            # --- Trapping: reduce raise, shift to check ---
+            if trap_transfer > 0:
+                raise_freq *= (1.0 - trap_transfer)
+            # OOP check-raise for value: boost raise when facing a bet
+            if not is_ip and facing_bet:
+                raise_freq *= 1.25
+
+        return {"raise": (raise_freq, 1.0)}, trap_transfer
 
     @staticmethod
-    def _apply_multiway_adjustment(
-        node: StrategyNode, num_opponents: int, hand_category: str,
-    ) -> StrategyNode:
-        """Apply multiway pot multipliers (num_opponents >= 2)."""
-        raise_mult = 1.0 / (num_opponents ** 0.3)
-        fold_mult = 1.0 + 0.15 * (num_opponents - 1)
-        bluff_raise_mult = 1.0 / (num_opponents ** 0.5)
-
-        adjusted = []
-        for af in node.actions:
-            freq = af.frequency
-            amount = af.amount
-
-            if af.action == "raise":
-                if hand_category == "air":
-                    freq *= bluff_raise_mult
-                else:
-                    freq *= raise_mult
-                amount *= 0.85
-            elif af.action == "fold":
-                freq *= fold_mult
-            # call unchanged
-
-            adjusted.append(ActionFrequency(af.action, freq, amount, af.ev))
-
-        return StrategyNode(actions=adjusted).normalized()
+    def _multiway_factors(num_opponents: int, hand_category: str) -> _Factors:
+        """Multiway pot multipliers (num_opponents >= 2)."""
+        if hand_category == "air":
+            raise_freq = 1.0 / (num_opponents ** 0.5)
+        else:
+            raise_freq = 1.0 / (num_opponents ** 0.3)
+        # call unchanged
+        return {
+            "raise": (raise_freq, 0.85),
+            "fold": (1.0 + 0.15 * (num_opponents - 1), 1.0),
+        }
 
     @staticmethod
     def _effective_stat(
@@ -523,15 +768,13 @@ class PostflopSolver:
         return gto_default + weight * (observed - gto_default)
 
     @staticmethod
-    def _apply_exploit_adjustment(
-        node: StrategyNode,
-        stats: OpponentStats,
-        hand_category: str,
-    ) -> StrategyNode:
-        """Apply exploitative frequency shifts based on opponent tendencies.
+    def _exploit_key(
+        stats: OpponentStats, hand_category: str,
+    ) -> tuple[str, int, int]:
+        """Bin opponent tendencies into an _EXPLOIT_TABLE key.
 
-        Adjusts bluff/value frequencies based on fold-to-cbet and aggression
-        factor, with confidence gating via _effective_stat().
+        Fold-to-cbet and aggression factor are confidence gated via
+        _effective_stat() before binning.
         """
         fold_cbet = PostflopSolver._effective_stat(
             stats.fold_to_cbet_pct, "fold_to_cbet", stats.cbet_faced,
@@ -542,40 +785,11 @@ class PostflopSolver:
             agg_raw, "vpip", agg_sample,  # reuse vpip threshold (30) for AF
         )
 
-        adjusted = []
-        for af in node.actions:
-            freq = af.frequency
-            amount = af.amount
-
-            if af.action == "raise":
-                if hand_category == "air":
-                    # Bluff more vs high folders, less vs low folders
-                    if fold_cbet > 60:
-                        freq *= 1.30
-                    elif fold_cbet < 30:
-                        freq *= 0.50
-                else:
-                    # Thin value bet more vs stations
-                    if fold_cbet < 30:
-                        freq *= 1.20
-                # vs passive opponents, bluff more (they won't raise back)
-                if agg < 1.0 and hand_category in ("air", "weak_draw"):
-                    freq *= 1.15
-                # Size down vs high folders (don't need big bets)
-                if fold_cbet > 60 and amount > 0:
-                    amount *= 0.85
-            elif af.action == "check":
-                # Trap more vs hyper-aggressive opponents
-                if agg > 3.0 and hand_category in ("nuts", "strong_made"):
-                    freq *= 1.25
-            elif af.action == "fold":
-                # Fold less vs passive opponents (they don't bluff)
-                if agg < 1.0:
-                    freq *= 0.85
-
-            adjusted.append(ActionFrequency(af.action, freq, amount, af.ev))
-
-        return StrategyNode(actions=adjusted).normalized()
+        return (
+            _EXPLOIT_CLASSES.get(hand_category, "other"),
+            _stat_bin(fold_cbet, 30, 60),
+            _stat_bin(agg, 1.0, 3.0),
+        )
 
     @staticmethod
     def _monte_carlo_equity(
@@ -597,31 +811,32 @@ class PostflopSolver:
 
     @staticmethod
     def _refine_with_equity(
-        node: StrategyNode,
+        rows: Iterable[_Row],
         equity: float,
         spr: float,
-    ) -> StrategyNode:
+    ) -> list[_Row]:
         """Refine a heuristic strategy based on Monte Carlo equity."""
         adjusted = []
-        for af in node.actions:
-            if af.action in ("raise", "call"):
+        total = 0.0
+        for row in rows:
+            action, freq, amount, ev = row
+            if action in ("raise", "call"):
                 # Boost aggressive actions if equity is high
                 factor = 1.0 + (equity - 0.5) * 0.5
-                new_freq = af.frequency * max(0.1, factor)
-                adjusted.append(ActionFrequency(
-                    af.action, new_freq, af.amount, equity * spr,
-                ))
-            elif af.action == "fold":
+                row = (action, freq * max(0.1, factor), amount, equity * spr)
+            elif action == "fold":
                 # Reduce fold frequency if equity is decent
                 factor = 1.0 - (equity - 0.3) * 0.3
-                new_freq = af.frequency * max(0.05, factor)
-                adjusted.append(ActionFrequency(
-                    af.action, new_freq, af.amount, 0.0,
-                ))
-            else:
-                adjusted.append(af)
-
-        return StrategyNode(actions=adjusted).normalized()
+                row = (action, freq * max(0.05, factor), amount, 0.0)
+            adjusted.append(row)
+            total += row[1]
+
+        if total <= 0:
+            return adjusted
+        return [
+            (action, freq / total, amount, ev)
+            for action, freq, amount, ev in adjusted
+        ]
 
     @staticmethod
     def _detect_street(community_cards: list[Card]) -> str:
@@ -637,8 +852,16 @@ class PostflopSolver:
     @staticmethod
     def _action_seq(history: list[PriorAction]) -> str:
         """Summarize action sequence for spot key."""
-        raises = sum(1 for a in history if a.action in (Action.RAISE, Action.ALL_IN))
-        checks = sum(1 for a in history if a.action == Action.CHECK)
+        raises = checks = 0
+        for a in history:
+            action = a.action
+            if action in _RAISE_ACTIONS:
+                raises += 1
+                if raises == 2:
+                    # raise_raise whatever follows
+                    break
+            elif action == Action.CHECK:
+                checks += 1
         if raises >= 2:
             return "raise_raise"
         if raises == 1:
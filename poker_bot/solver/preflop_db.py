@@ -16,6 +16,10 @@ Usage:
 from __future__ import annotations
 
 import sqlite3
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 
 _DEFAULT_DB_PATH = Path(__file__).parent / "data" / "preflop.db"
@@ -38,6 +42,18 @@ CREATE INDEX IF NOT EXISTS idx_spot
     ON preflop_strategies(position, action_sequence, stack_bucket);
 """
 
+# Connection tuning, applied after switching to WAL. Under WAL,
+# synchronous=NORMAL only syncs at checkpoints and stays crash-safe; the
+# larger page cache (64 MiB) and memory map keep lookups off read() calls.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=1073741824;",
+    "PRAGMA cache_size=-65536;",
+    "PRAGMA busy_timeout=5000;",
+    "PRAGMA journal_size_limit=67108864;",
+)
+
 _LOOKUP_SQL = """\
 SELECT action, frequency, ev
 FROM preflop_strategies
@@ -51,6 +67,13 @@ INSERT OR REPLACE INTO preflop_strategies
 VALUES (?, ?, ?, ?, ?, ?, ?);
 """
 
+# insert_batch commits every this many rows, bounding the WAL file
+_BATCH_COMMIT_ROWS = 10_000
+
+# Number of looked-up spots PreflopDB keeps in memory; about the size of a
+# full import (positions x sequences x stack buckets x 169 hands)
+_LOOKUP_CACHE_SIZE = 16384
+
 # Supported stack buckets (sorted ascending). Solvers export at these depths.
 STACK_BUCKETS = ["10bb", "15bb", "20bb", "25bb", "30bb", "40bb", "50bb", "75bb", "100bb", "150bb", "200bb"]
 
@@ -84,7 +107,17 @@ class PreflopDB:
         self._path = Path(db_path) if db_path else _DEFAULT_DB_PATH
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(self._path))
+        # lookup() results by spot, cleared on every write through this
+        # object; writes from other connections are not seen until then
+        self._lookups: OrderedDict[
+            tuple[str, str, str, str], tuple[tuple[str, float, float], ...]
+        ] = OrderedDict()
+        # Nesting depth of transaction() blocks; insert_batch leaves commits
+        # to the outermost block while one is open
+        self._transaction_depth = 0
         self._conn.execute("PRAGMA journal_mode=WAL;")
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
         self._conn.execute(_CREATE_TABLE)
         self._conn.execute(_CREATE_INDEX)
         self._conn.commit()
@@ -106,10 +139,19 @@ class PreflopDB:
             List of (action, frequency, ev) tuples sorted by frequency desc.
             Empty list if no data found.
         """
-        rows = self._conn.execute(
-            _LOOKUP_SQL, (position, action_sequence, stack_bucket, hand),
-        ).fetchall()
-        return [(r[0], r[1], r[2]) for r in rows]
+        key = (position, action_sequence, stack_bucket, hand)
+        rows = self._lookups.get(key)
+        if rows is not None:
+            self._lookups.move_to_end(key)
+            return list(rows)
+
+        # Rows already come back as tuples; the connection's statement cache
+        # reuses the compiled query across calls
+        fetched = self._conn.execute(_LOOKUP_SQL, key).fetchall()
+        self._lookups[key] = tuple(fetched)
+        if len(self._lookups) > _LOOKUP_CACHE_SIZE:
+            self._lookups.popitem(last=False)
+        return fetched
 
     def insert(
         self,
@@ -121,7 +163,11 @@ class PreflopDB:
         frequency: float,
         ev: float = 0.0,
     ) -> None:
-        """Insert or replace a single strategy row."""
+        """Insert or replace a single strategy row.
+
+        Not committed; use commit() or group the writes in transaction().
+        """
+        self._lookups.clear()
         self._conn.execute(
             _INSERT_SQL,
             (position, action_sequence, stack_bucket, hand, action, frequency, ev),
@@ -129,11 +175,59 @@ class PreflopDB:
 
     def insert_batch(
         self,
-        rows: list[tuple[str, str, str, str, str, float, float]],
+        rows: Iterable[tuple[str, str, str, str, str, float, float]],
     ) -> None:
-        """Batch insert rows: [(position, action_seq, stack, hand, action, freq, ev)]."""
-        self._conn.executemany(_INSERT_SQL, rows)
-        self._conn.commit()
+        """Batch insert rows: [(position, action_seq, stack, hand, action, freq, ev)].
+
+        Rows may come from any iterable. Each chunk of _BATCH_COMMIT_ROWS
+        rows is written in one explicit transaction and committed. Inside a
+        transaction() block the rows join the open transaction instead, and
+        are committed or rolled back with it.
+        """
+        self._lookups.clear()
+        conn = self._conn
+        it = iter(rows)
+        if self._transaction_depth:
+            while chunk := list(islice(it, _BATCH_COMMIT_ROWS)):
+                conn.executemany(_INSERT_SQL, chunk)
+            return
+        while True:
+            chunk = list(islice(it, _BATCH_COMMIT_ROWS))
+            if chunk:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(_INSERT_SQL, chunk)
+            conn.commit()
+            if len(chunk) < _BATCH_COMMIT_ROWS:
+                break
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into one transaction.
+
+        Usage:
+            with db.transaction():
+                db.insert(...)
+                db.insert(...)
+
+        Commits when the block exits normally and rolls back on an exception.
+        A nested block joins the outer one.
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+        self._transaction_depth = 1
+        try:
+            with self._conn:
+                yield
+        finally:
+            self._transaction_depth = 0
+            # Lookups inside the block may have cached rolled-back rows
+            self._lookups.clear()
 
     def commit(self) -> None:
         self._conn.commit()
@@ -148,13 +242,12 @@ class PreflopDB:
         Returns:
             List of (position, action_sequence, stack_bucket, num_hands).
         """
-        rows = self._conn.execute(
+        return self._conn.execute(
             "SELECT position, action_sequence, stack_bucket, COUNT(DISTINCT hand) "
             "FROM preflop_strategies "
             "GROUP BY position, action_sequence, stack_bucket "
             "ORDER BY position, action_sequence, stack_bucket"
         ).fetchall()
-        return [(r[0], r[1], r[2], r[3]) for r in rows]
 
     def close(self) -> None:
         if self._conn:
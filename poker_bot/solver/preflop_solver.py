@@ -42,6 +42,12 @@ logger = logging.getLogger("poker_bot.solver.preflop")
 
 _JSON_DATA_PATH = Path(__file__).parent / "data" / "preflop_strategies.json"
 
+# orjson decodes the strategy file a few times faster when installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 # Regex to extract raise amount from action strings like "raise_2.5"
 _RAISE_AMOUNT_RE = re.compile(r"^raise_(\d+\.?\d*)$")
 
@@ -124,8 +130,7 @@ class PreflopSolver:
         self._json_data: dict = {}
         json_path = Path(data_path) if data_path else _JSON_DATA_PATH
         if json_path.exists():
-            with open(json_path) as f:
-                self._json_data = json.load(f)
+            self._json_data = _loads(json_path.read_bytes())
 
     def _lookup_db(
         self,
@@ -304,13 +309,8 @@ class PreflopSolver:
         for af in node.actions:
             if af.action == "fold":
                 new_freq = af.frequency + icm_factor * 0.3
-                adjusted.append(ActionFrequency(
-                    af.action, new_freq, af.amount, af.ev,
-                ))
             else:
                 new_freq = max(0.0, af.frequency * (1.0 - icm_factor * 0.4))
-                adjusted.append(ActionFrequency(
-                    af.action, new_freq, af.amount, af.ev,
-                ))
+            adjusted.append((af.action, new_freq, af.amount, af.ev))
 
-        return StrategyNode(actions=adjusted).normalized()
+        return StrategyNode.from_weights(adjusted)
@@ -15,6 +15,7 @@ from poker_bot.strategy.preflop_ranges import (
     THREE_BET_RANGES,
     Range,
 )
+from poker_bot.strategy.tournament_strategy import _hand_strength_key
 from poker_bot.utils.constants import Action, Position, Street
 
 
@@ -109,8 +110,6 @@ class RangeEstimator:
         if not base_range.hands:
             return base_range
 
-        from poker_bot.strategy.tournament_strategy import _hand_strength_key
-
         sorted_hands = sorted(
             base_range.hands, key=_hand_strength_key, reverse=True,
         )
@@ -176,8 +175,8 @@ class RangeEstimator:
         Returns:
             Adjusted range (wider for loose players, narrower for tight).
         """
+        # Deferred: postflop_solver imports this module
         from poker_bot.solver.postflop_solver import _GTO_DEFAULTS, _MIN_SAMPLES, _FULL_CONFIDENCE_MULT
-        from poker_bot.strategy.tournament_strategy import _hand_strength_key
 
         if not base_range.hands:
             return base_range
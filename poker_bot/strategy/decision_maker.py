@@ -60,7 +60,7 @@ class ActionType(StrEnum):
     LIMP = "LIMP"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriorAction:
     """A single action in the hand's action history."""
 
@@ -80,7 +80,7 @@ class Decision:
     pot_odds: float = 0.0  # Required equity to call [0, 1]
 
 
-@dataclass
+@dataclass(slots=True)
 class BoardTexture:
     """Analysis of the community card texture."""
 
@@ -592,7 +592,7 @@ class PostflopEngine:
         texture to determine the optimal action.
         """
         board_texture = analyze_board(community_cards)
-        hand_result = HandEvaluator.evaluate(hero_cards + community_cards)
+        hand_result = HandEvaluator.evaluate_with_board(hero_cards, community_cards)
         hand_strength = PostflopEngine._hand_strength_score(
             hand_result, community_cards
         )
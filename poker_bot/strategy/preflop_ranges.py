@@ -47,7 +47,7 @@ class HandCombo:
         return f"{self.card1}{self.card2}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HandNotation:
     """A hand in standard poker notation (e.g. AKs, JJ, T9o)."""
 
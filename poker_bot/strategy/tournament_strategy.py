@@ -7,6 +7,7 @@ and survival premium adjustments for tournament play.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import permutations
 
 import numpy as np
@@ -272,10 +273,30 @@ def survival_premium(context: GameContext) -> float:
     if not context.is_tournament:
         return 1.0
 
+    return _survival_premium(
+        context.tournament_phase,
+        context.stack_depth_bb,
+        context.average_stack_bb,
+        context.is_near_payout_jump,
+    )
+
+
+@lru_cache(maxsize=64)
+def _survival_premium(
+    phase: TournamentPhase | None,
+    stack_depth_bb: float,
+    average_stack_bb: float,
+    near_payout_jump: bool,
+) -> float:
+    """Memoized core of survival_premium.
+
+    The solver and the decision maker each ask for the premium several
+    times per decision with the same tournament state.
+    """
     base = 1.0
 
     # Phase-based adjustments
-    match context.tournament_phase:
+    match phase:
         case TournamentPhase.EARLY:
             base = 1.0  # Play close to chip-EV
         case TournamentPhase.MIDDLE:
@@ -288,8 +309,8 @@ def survival_premium(context: GameContext) -> float:
             base = 0.75  # Pay jumps are large
 
     # Stack-relative adjustments
-    if context.average_stack_bb > 0:
-        stack_ratio = context.stack_depth_bb / context.average_stack_bb
+    if average_stack_bb > 0:
+        stack_ratio = stack_depth_bb / average_stack_bb
         if stack_ratio < 0.5:
             # Short stack relative to field — tighten to survive
             base *= 0.85
@@ -298,7 +319,7 @@ def survival_premium(context: GameContext) -> float:
             base = min(1.0, base * 1.15)
 
     # Near payout jump — extra tightening
-    if context.is_near_payout_jump:
+    if near_payout_jump:
         base *= 0.85
 
     return max(0.3, min(1.0, base))
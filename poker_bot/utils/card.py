@@ -6,11 +6,13 @@ import random
 from dataclasses import dataclass, field
 from functools import total_ordering
 
+import numpy as np
+
 from poker_bot.utils.constants import RANK_VALUES, Rank, Suit
 
 
 @total_ordering
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Card:
     """Represents a single playing card."""
 
@@ -72,22 +74,24 @@ class Card:
 class Deck:
     """Standard 52-card deck with shuffle and deal operations."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: np.random.Generator | None = None) -> None:
+        # Without an explicit generator, seed from the global one so that
+        # random.seed() still makes dealing reproducible.
+        self._rng = rng if rng is not None else np.random.default_rng(
+            random.getrandbits(64)
+        )
         self._cards: list[Card] = []
         self._dealt: list[Card] = []
         self.reset()
 
     def reset(self) -> None:
         """Reset and shuffle the deck."""
-        self._cards = [
-            Card(rank=rank, suit=suit) for suit in Suit for rank in Rank
-        ]
+        self._cards = _FULL_DECK[self._rng.permutation(len(_FULL_DECK))].tolist()
         self._dealt = []
-        self.shuffle()
 
     def shuffle(self) -> None:
         """Shuffle the remaining cards in the deck."""
-        random.shuffle(self._cards)
+        self._rng.shuffle(self._cards)
 
     def deal(self, n: int = 1) -> list[Card]:
         """Deal n cards from the top of the deck.
@@ -133,3 +137,11 @@ class Deck:
                 raise ValueError(f"Card {card} not in deck")
             self._cards.remove(card)
             self._dealt.append(card)
+
+
+# Cards are immutable, so every deck deals from one shared set; a reset
+# only draws a fresh permutation of indices into it.
+_FULL_DECK = np.array(
+    [Card(rank=rank, suit=suit) for suit in Suit for rank in Rank],
+    dtype=object,
+)
@@ -2,7 +2,10 @@
 
 import math
 
-from poker_bot.solver.bet_sizing import BetSizingTree, SizingOption
+import numpy as np
+
+from poker_bot.solver.bet_sizing import TEXTURE_SIZINGS, BetSizingTree, SizingOption
+from poker_bot.solver.board_bucketing import TextureBucket
 
 
 class TestBetSizingTree:
@@ -25,6 +28,15 @@ class TestBetSizingTree:
         assert BetSizingTree.primary_sizing("dry_high_rainbow") == 0.33
         assert BetSizingTree.primary_sizing("dynamic") == 0.75
 
+    def test_primary_sizing_by_bucket_id(self):
+        for name, options in TEXTURE_SIZINGS.items():
+            bucket_id = TextureBucket[name.upper()]
+            assert BetSizingTree.primary_sizing(bucket_id) == options[0].fraction
+            assert BetSizingTree.get_sizings(bucket_id) == options
+
+    def test_primary_sizing_unknown_texture(self):
+        assert BetSizingTree.primary_sizing("nonexistent_texture") == 0.5
+
     def test_geometric_sizing_one_street(self):
         # 100 pot, 100 stack, 1 street: should bet 100% pot
         sizing = BetSizingTree.geometric_sizing(100, 100, 1)
@@ -60,3 +72,11 @@ class TestBetSizingTree:
     def test_compute_bet_amount_min_bet(self):
         amount = BetSizingTree.compute_bet_amount(10, 100, 0.1, min_bet=4.0)
         assert amount == 4.0
+
+    def test_compute_bet_amounts_matches_scalar(self):
+        fracs = [0.1, 0.33, 0.5, 0.75, 1.0, 2.0]
+        for pot, stack, min_bet in ((100, 200, 0.0), (100, 60, 0.0), (10, 100, 4.0)):
+            amounts = BetSizingTree.compute_bet_amounts(pot, stack, np.array(fracs), min_bet)
+            assert amounts.tolist() == [
+                BetSizingTree.compute_bet_amount(pot, stack, f, min_bet) for f in fracs
+            ]
@@ -1,6 +1,13 @@
 """Tests for board bucketing."""
 
-from poker_bot.solver.board_bucketing import bucket_board, bucket_spr, bucket_stack
+import itertools
+
+from poker_bot.solver.board_bucketing import (
+    _bucket_board_cascade,
+    bucket_board,
+    bucket_spr,
+    bucket_stack,
+)
 from poker_bot.strategy.decision_maker import BoardTexture
 
 
@@ -75,6 +82,16 @@ class TestBucketBoard:
         t = BoardTexture(is_rainbow=True, high_card_rank=9)
         assert bucket_board(t) == "dry_medium"
 
+    def test_lookup_matches_cascade(self):
+        for flags in itertools.product((False, True), repeat=7):
+            for high in range(15):
+                for broadway in range(4):
+                    t = BoardTexture(
+                        *flags[:5], high_card_rank=high, num_broadway=broadway,
+                        has_flush_draw=flags[5], has_straight_draw=flags[6],
+                    )
+                    assert bucket_board(t) == _bucket_board_cascade(t)
+
 
 class TestBucketStack:
     def test_critical(self):
@@ -1,7 +1,10 @@
 """Tests for solver data structures."""
 
+from unittest.mock import patch
+
 from poker_bot.solver.data_structures import (
     ActionFrequency,
+    CompactStrategyNode,
     SolverResult,
     SpotKey,
     StrategyNode,
@@ -61,6 +64,20 @@ class TestStrategyNode:
         assert "raise" in actions
         assert "fold" in actions
 
+    def test_sample_action_many_actions(self):
+        node = StrategyNode(actions=[
+            ActionFrequency("fold", 0.1),
+            ActionFrequency("check", 0.2),
+            ActionFrequency("call", 0.3),
+            ActionFrequency("raise", 0.4),
+        ])
+        for r, expected in [
+            (0.05, "fold"), (0.1, "fold"), (0.25, "check"),
+            (0.6, "call"), (0.99, "raise"), (1.0, "raise"),
+        ]:
+            with patch("poker_bot.solver.data_structures.random.random", return_value=r):
+                assert node.sample_action().action == expected
+
     def test_sample_action_empty(self):
         node = StrategyNode()
         assert node.sample_action() is None
@@ -99,6 +116,54 @@ class TestStrategyNode:
         assert abs(normed.actions[0].frequency - 0.75) < 1e-6
         assert abs(normed.actions[1].frequency - 0.25) < 1e-6
 
+    def test_from_weights_matches_normalized(self):
+        rows = [("raise", 3.0, 2.5, 1.0), ("call", 0.5, 0.0, 0.2), ("fold", 1.0, 0.0, 0.0)]
+        node = StrategyNode.from_weights(rows)
+        expected = StrategyNode(
+            actions=[ActionFrequency(*row) for row in rows]
+        ).normalized()
+        assert node == expected
+
+    def test_from_weights_all_zero(self):
+        node = StrategyNode.from_weights([("raise", 0.0, 2.5, 0.0), ("fold", 0.0, 0.0, 0.0)])
+        assert [a.frequency for a in node.actions] == [0.0, 0.0]
+        assert node.actions[0].amount == 2.5
+
+
+class TestCompactStrategyNode:
+    def _node(self):
+        return StrategyNode(actions=[
+            ActionFrequency("raise", 0.5, 6.0, ev=2.0),
+            ActionFrequency("call", 0.3, ev=0.5),
+            ActionFrequency("fold", 0.2, ev=0.0),
+        ])
+
+    def test_round_trip(self):
+        node = self._node()
+        assert CompactStrategyNode.from_node(node).to_node() == node
+
+    def test_queries_match_strategy_node(self):
+        node = self._node()
+        compact = CompactStrategyNode.from_node(node)
+        assert compact.recommended_action == node.recommended_action
+        assert compact.best_ev == node.best_ev
+        assert abs(compact.weighted_ev - node.weighted_ev) < 1e-9
+
+    def test_normalized(self):
+        compact = CompactStrategyNode.from_node(StrategyNode(actions=[
+            ActionFrequency("raise", 3.0),
+            ActionFrequency("fold", 1.0),
+        ])).normalized()
+        assert abs(compact[0].frequency - 0.75) < 1e-6
+        assert abs(compact[1].frequency - 0.25) < 1e-6
+
+    def test_empty(self):
+        compact = CompactStrategyNode.from_node(StrategyNode())
+        assert len(compact) == 0
+        assert compact.recommended_action is None
+        assert compact.best_ev == 0.0
+        assert compact.weighted_ev == 0.0
+
 
 class TestSpotKey:
     def test_hashable(self):
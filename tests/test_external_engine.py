@@ -226,6 +226,52 @@ class TestPostflopRouting:
 # ---------------------------------------------------------------------------
 
 
+class TestSolveBatch:
+    def _spots(self):
+        ctx = GameContext.cash_game(100.0)
+        flop = _make_game_state(
+            _cards("Ah Kh"),
+            street=Street.FLOP,
+            community_cards=_cards("Qs Jh 2h"),
+            pot=10.0,
+        )
+        turn = _make_game_state(
+            _cards("9c 9d"),
+            street=Street.TURN,
+            community_cards=_cards("Qs Jh 2h 7c"),
+            pot=20.0,
+        )
+        preflop = _make_game_state(_cards("Ah Kh"))
+        return [(flop, ctx, 0), (preflop, ctx, 0), (turn, ctx, 0, [])]
+
+    def test_matches_individual_solves(self):
+        engine = ExternalSolverEngine(bridge=MockBridge())
+        spots = self._spots()
+        assert engine.solve_batch(spots) == [engine.solve(*spot) for spot in spots]
+
+    def test_postflop_spots_solved_in_one_batch(self):
+        mock_bridge = MockBridge()
+        mock_bridge.solve_many = MagicMock(wraps=mock_bridge.solve_many)
+        engine = ExternalSolverEngine(bridge=mock_bridge)
+
+        results = engine.solve_batch(self._spots())
+
+        mock_bridge.solve_many.assert_called_once()
+        (inputs,), _ = mock_bridge.solve_many.call_args
+        assert [i.street for i in inputs] == ["flop", "turn"]
+        assert [r.source for r in results] == [
+            "external_solver", "preflop_lookup", "external_solver",
+        ]
+
+    def test_batch_failure_returns_gto_unavailable_per_spot(self):
+        engine = ExternalSolverEngine(
+            bridge=MockBridge(raises=SolverError("Solver timed out")),
+        )
+        results = engine.solve_batch(self._spots())
+        assert results[0] is GTO_UNAVAILABLE
+        assert results[2] is GTO_UNAVAILABLE
+
+
 class TestZeroHeuristic:
     def test_postflop_solver_never_instantiated(self):
         """Verify PostflopSolver is NEVER used by ExternalSolverEngine."""
@@ -98,6 +98,32 @@ class TestSevenCardEvaluation:
         result = HandEvaluator.evaluate(_cards("Js Jh Jd 8s 8h 3c 2d"))
         assert result.ranking == HandRanking.FULL_HOUSE
 
+    def test_evaluate_with_board_matches_evaluate(self) -> None:
+        hole = _cards("Js Jh")
+        board = _cards("Jd 8s 8h 3c 2d")
+        result = HandEvaluator.evaluate_with_board(hole, board)
+        assert result == HandEvaluator.evaluate(hole + board)
+        assert result.ranking == HandRanking.FULL_HOUSE
+
+    def test_evaluate_batch_matches_evaluate(self) -> None:
+        hands = [_cards("Js Jh"), _cards("Ah Kh"), _cards("7c 2s")]
+        for board in (
+            _cards("Jd 8s 8h 3c 2d"),
+            _cards("Qh Th 9h 8h"),
+            _cards("Jd 8s 7h"),
+        ):
+            results = HandEvaluator.evaluate_batch(hands, board)
+            assert results == [
+                HandEvaluator.evaluate(hand + board) for hand in hands
+            ]
+
+    def test_evaluate_batch_plays_the_board(self) -> None:
+        board = _cards("Ah Kh Qh Jh Th")
+        results = HandEvaluator.evaluate_batch(
+            [_cards("2c 3d"), _cards("4s 5s")], board,
+        )
+        assert all(r.ranking == HandRanking.ROYAL_FLUSH for r in results)
+
     def test_too_few_cards_raises(self) -> None:
         import pytest
 
@@ -9,7 +9,8 @@ from poker_bot.solver.postflop_solver import (
     _GTO_DEFAULTS,
     _MIN_SAMPLES,
 )
-from poker_bot.strategy.decision_maker import PriorAction
+from poker_bot.strategy.decision_maker import PriorAction, analyze_board
+from poker_bot.strategy.preflop_ranges import Range
 from poker_bot.utils.card import Card
 from poker_bot.utils.constants import Action, Position, Street
 
@@ -139,6 +140,92 @@ class TestPostflopSolver:
         assert PostflopSolver._detect_street(_cards("Ah Kd 3c 7h 2s")) == "river"
 
 
+class TestGetStrategyBatch:
+    def setup_method(self):
+        self.solver = PostflopSolver()
+
+    def _spots(self):
+        spots = []
+        for board in ("Ad Kh 7c", "9h 8d 2c", "Ad Kh 7c 2s"):
+            for hand, strength in (("Ah As", 0.95), ("Jh Th", 0.40), ("7d 6d", 0.10)):
+                spots.append(dict(
+                    hero_cards=_cards(hand),
+                    community_cards=_cards(board),
+                    position=Position.BTN,
+                    pot=10.0,
+                    hero_stack=100.0,
+                    big_blind=1.0,
+                    action_history=[],
+                    hand_strength=strength,
+                    is_ip=strength > 0.3,
+                ))
+        return spots
+
+    def test_matches_individual_calls(self):
+        spots = self._spots()
+        results = self.solver.get_strategy_batch(spots)
+        assert results == [self.solver.get_strategy(**spot) for spot in spots]
+
+    def test_board_analyzed_once_per_board(self):
+        with patch(
+            "poker_bot.solver.postflop_solver.analyze_board",
+            wraps=analyze_board,
+        ) as mock_analyze:
+            self.solver.get_strategy_batch(self._spots())
+        assert mock_analyze.call_count == 3
+
+
+class TestResultCache:
+    def setup_method(self):
+        self.solver = PostflopSolver()
+        self.spot = dict(
+            hero_cards=_cards("Ah As"),
+            community_cards=_cards("Ad Kh 7c"),
+            position=Position.BTN,
+            pot=10.0,
+            hero_stack=100.0,
+            big_blind=1.0,
+            action_history=[],
+            hand_strength=0.95,
+        )
+
+    def test_repeat_spot_returns_cached_result(self):
+        first = self.solver.get_strategy(**self.spot)
+        with patch.object(self.solver, "_lookup") as mock_lookup:
+            again = self.solver.get_strategy(**self.spot)
+        assert again is first
+        mock_lookup.assert_not_called()
+
+    def test_different_pot_not_shared(self):
+        first = self.solver.get_strategy(**self.spot)
+        other = self.solver.get_strategy(**{**self.spot, "pot": 20.0})
+        assert other is not first
+
+    def test_monte_carlo_spots_not_cached(self):
+        spot = {
+            **self.spot,
+            "hand_strength": 0.5,
+            "opponent_range": Range().add("AA,KK,QQ,AKs"),
+        }
+        first = self.solver.get_strategy(**spot)
+        assert self.solver.get_strategy(**spot) is not first
+
+
+class TestActionSeq:
+    @staticmethod
+    def _history(*actions):
+        return [PriorAction(Position.BB, a) for a in actions]
+
+    def test_summaries(self):
+        seq = PostflopSolver._action_seq
+        assert seq([]) == "first_to_act"
+        assert seq(self._history(Action.CHECK)) == "checked"
+        assert seq(self._history(Action.RAISE)) == "bet"
+        assert seq(self._history(Action.CHECK, Action.ALL_IN)) == "check_raise"
+        assert seq(self._history(Action.RAISE, Action.CALL, Action.RAISE)) == "raise_raise"
+        assert seq(self._history(Action.RAISE, Action.ALL_IN, Action.CHECK)) == "raise_raise"
+
+
 class TestIsInPosition:
     def test_btn_ip_vs_blinds(self):
         assert PostflopSolver._is_in_position("BTN", ["SB", "BB"]) is True
@@ -2,6 +2,7 @@
 
 import csv
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -61,6 +62,18 @@ class TestPreflopDB:
         assert db.list_spots() == []
         db.close()
 
+    def test_connection_tuned(self, tmp_path):
+        db = PreflopDB(db_path=tmp_path / "test.db")
+
+        def pragma(name):
+            return db._conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("cache_size") == -65536
+        assert pragma("busy_timeout") == 5000
+        db.close()
+
     def test_insert_and_lookup(self, tmp_path):
         db = PreflopDB(db_path=tmp_path / "test.db")
         db.insert("SB", "open", "100bb", "AA", "raise_2.5", 1.0, 0.52)
@@ -88,6 +101,79 @@ class TestPreflopDB:
         assert rows[1][0] == "fold"
         db.close()
 
+    def test_insert_batch_commits_in_chunks(self, tmp_path):
+        db = PreflopDB(db_path=tmp_path / "test.db")
+        hands = [f"H{i}" for i in range(25)]
+        with patch("poker_bot.solver.preflop_db._BATCH_COMMIT_ROWS", 10):
+            db.insert_batch(
+                ("SB", "open", "100bb", hand, "fold", 1.0, 0.0) for hand in hands
+            )
+        assert not db._conn.in_transaction
+        assert db.row_count() == 25
+        db.close()
+
+    def test_transaction_commits_and_rolls_back(self, tmp_path):
+        path = tmp_path / "test.db"
+        db = PreflopDB(db_path=path)
+        with db.transaction():
+            db.insert("SB", "open", "100bb", "AA", "raise_2.5", 1.0, 0.52)
+            db.insert("SB", "open", "100bb", "KK", "raise_2.5", 1.0, 0.45)
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.insert("SB", "open", "100bb", "QQ", "raise_2.5", 1.0, 0.40)
+                raise RuntimeError("abort")
+        db.close()
+
+        reopened = PreflopDB(db_path=path)
+        assert reopened.row_count() == 2
+        reopened.close()
+
+    def test_insert_batch_in_transaction_rolls_back(self, tmp_path):
+        path = tmp_path / "test.db"
+        db = PreflopDB(db_path=path)
+        hands = [f"H{i}" for i in range(25)]
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.insert("SB", "open", "100bb", "AA", "raise_2.5", 1.0, 0.52)
+                with patch("poker_bot.solver.preflop_db._BATCH_COMMIT_ROWS", 10):
+                    db.insert_batch(
+                        ("SB", "open", "100bb", hand, "fold", 1.0, 0.0) for hand in hands
+                    )
+                raise RuntimeError("abort")
+        assert db.row_count() == 0
+        db.close()
+
+        reopened = PreflopDB(db_path=path)
+        assert reopened.row_count() == 0
+        reopened.close()
+
+    def test_repeat_lookup_served_from_memory(self, tmp_path):
+        db = PreflopDB(db_path=tmp_path / "test.db")
+        db.insert("SB", "open", "100bb", "AA", "raise_2.5", 1.0, 0.52)
+        first = db.lookup("SB", "open", "100bb", "AA")
+        db._conn.execute("DELETE FROM preflop_strategies")
+        assert db.lookup("SB", "open", "100bb", "AA") == first
+        db.close()
+
+    def test_lookup_cache_cleared_on_write(self, tmp_path):
+        db = PreflopDB(db_path=tmp_path / "test.db")
+        assert db.lookup("SB", "open", "100bb", "AA") == []
+        db.insert("SB", "open", "100bb", "AA", "raise_2.5", 1.0, 0.52)
+        assert db.lookup("SB", "open", "100bb", "AA") == [("raise_2.5", 1.0, 0.52)]
+        db.insert_batch([("SB", "open", "100bb", "AA", "raise_2.5", 0.5, 0.3)])
+        assert db.lookup("SB", "open", "100bb", "AA") == [("raise_2.5", 0.5, 0.3)]
+        db.close()
+
+    def test_lookup_cache_cleared_on_rollback(self, tmp_path):
+        db = PreflopDB(db_path=tmp_path / "test.db")
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.insert("SB", "open", "100bb", "AA", "raise_2.5", 1.0, 0.52)
+                assert db.lookup("SB", "open", "100bb", "AA")
+                raise RuntimeError("abort")
+        assert db.lookup("SB", "open", "100bb", "AA") == []
+        db.close()
+
     def test_lookup_missing(self, tmp_path):
         db = PreflopDB(db_path=tmp_path / "test.db")
         rows = db.lookup("SB", "open", "100bb", "XX")
@@ -0,0 +1,82 @@
+"""Tests for the simulation runner and its per-hand action log."""
+
+import random
+from unittest.mock import patch
+
+from poker_bot.simulation.poker_game import HandRecord, PokerGame
+from poker_bot.simulation.run_simulations import _play_hands, run_simulation
+from poker_bot.strategy.decision_maker import ActionType
+from poker_bot.utils.card import Card
+from poker_bot.utils.constants import HandRanking, Position, Street
+
+
+def _record(actions_log: list[tuple]) -> HandRecord:
+    return HandRecord(
+        hand_number=1,
+        winner_name="Bot",
+        pot_size=15.0,
+        community_cards=[],
+        player_hands={},
+        winning_hand_ranking=None,
+        actions_log=actions_log,
+    )
+
+
+class TestActionsLog:
+    def test_entries_format_as_summary_lines(self):
+        board = (Card.from_str("Ah"), Card.from_str("Kd"), Card.from_str("2c"))
+        record = _record([
+            ("post", "Villain1", Position.SB, "SB", 5.0),
+            ("post", "Villain2", Position.BB, "BB", 10.0),
+            ("preflop",),
+            ("action", "Bot", Position.BTN, ActionType.RAISE, 25.0),
+            ("action", "Villain1", Position.SB, ActionType.FOLD, 0.0),
+            ("street", Street.FLOP, board),
+            ("fold_win", "Bot", 40.0),
+            ("showdown", "Bot", 40.0, HandRanking.ONE_PAIR),
+        ])
+        assert record.actions_summary == [
+            f"Villain1 ({Position.SB}) posts SB 5.0",
+            f"Villain2 ({Position.BB}) posts BB 10.0",
+            "--- PREFLOP ---",
+            f"  Bot ({Position.BTN}): {ActionType.RAISE.value} 25",
+            f"  Villain1 ({Position.SB}): {ActionType.FOLD.value}",
+            f"--- {Street.FLOP} --- Board: {' '.join(str(c) for c in board)}",
+            "Bot wins pot of 40 (everyone else folded)",
+            "Showdown: Bot wins 40 with ONE_PAIR",
+        ]
+
+    def test_played_hand_logs_blinds_first(self):
+        record = _play_hands(0, 1, seed=3)[0]
+        assert record.actions_summary[:3] == [
+            f"{record.actions_log[0][1]} ({Position.SB}) posts SB 5.0",
+            f"{record.actions_log[1][1]} ({Position.BB}) posts BB 10.0",
+            "--- PREFLOP ---",
+        ]
+
+
+class TestPlayHands:
+    def test_block_is_reproducible(self):
+        first = _play_hands(4, 1, seed=11)
+        again = _play_hands(4, 1, seed=11)
+        assert [r.hand_number for r in first] == [5]
+        assert [r.actions_summary for r in again] == [r.actions_summary for r in first]
+        assert [r.hero_profit for r in again] == [r.hero_profit for r in first]
+
+    def test_global_random_state_restored(self):
+        random.seed(123)
+        state = random.getstate()
+        _play_hands(0, 1, seed=5)
+        assert random.getstate() == state
+
+
+class TestRunSimulation:
+    def test_each_hand_played_once(self, capsys):
+        play_hand = PokerGame.play_hand
+        with patch.object(
+            PokerGame, "play_hand", autospec=True, side_effect=play_hand,
+        ) as played:
+            run_simulation(num_hands=3, max_workers=1, seed=7)
+        # Printed hands come from the stored log, not from replays
+        assert played.call_count == 3
+        assert "Actions:" in capsys.readouterr().out
@@ -3,7 +3,11 @@
 import pytest
 
 from poker_bot.core.game_context import GameType, TournamentPhase
-from poker_bot.interface.situation_builder import build_game_objects
+from poker_bot.interface.situation_builder import (
+    build_game_objects,
+    build_postflop,
+    build_preflop,
+)
 from poker_bot.utils.card import Card
 from poker_bot.utils.constants import Position, Street
 
@@ -145,3 +149,48 @@ class TestBuildGameObjects:
             is_tournament=True,
         )
         assert ctx.tournament_phase == TournamentPhase.MIDDLE
+
+
+class TestStreetVariants:
+    """Tests for the build_preflop() / build_postflop() variants."""
+
+    def test_preflop_fixes_street_and_board(self):
+        gs, ctx = build_preflop(
+            hero_cards=_cards("Ah Ks"),
+            position=Position.SB,
+            stack_bb=50.0,
+            pot_bb=1.5,
+            current_bet_bb=1.0,
+            num_opponents=1,
+        )
+        assert gs.current_street == Street.PREFLOP
+        assert gs.community_cards == []
+        assert gs.players[0].current_bet == 0.5
+        assert ctx.num_players == 2
+
+    def test_postflop_ignores_blind_posting(self):
+        gs, _ = build_postflop(
+            hero_cards=_cards("Ah Ks"),
+            position=Position.BB,
+            stack_bb=50.0,
+            street=Street.TURN,
+            pot_bb=10.0,
+            current_bet_bb=0.0,
+            num_opponents=1,
+            community_cards=_cards("Jh 8d 3c 2s"),
+        )
+        assert gs.current_street == Street.TURN
+        assert len(gs.community_cards) == 4
+        assert gs.players[0].current_bet == 0.0
+
+    def test_postflop_requires_two_hero_cards(self):
+        with pytest.raises(ValueError, match="exactly 2"):
+            build_postflop(
+                hero_cards=_cards("Ah"),
+                position=Position.BTN,
+                stack_bb=50.0,
+                street=Street.FLOP,
+                pot_bb=3.0,
+                current_bet_bb=0.0,
+                num_opponents=1,
+            )
@@ -1,6 +1,7 @@
 """Tests for solver bridge types, range conversion, and GTO_UNAVAILABLE sentinel."""
 
 import json
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import patch
@@ -240,6 +241,11 @@ class TestRangeConverterPio:
         # AA has 6 combos (4 choose 2)
         assert sum(result) == 6.0
 
+    def test_returns_float32_array(self):
+        result = RangeConverter.to_piosolver(Range().add("AA"))
+        assert result.dtype == np.float32
+        assert len(result.tobytes()) == 1326 * 4
+
     def test_dead_card_removal(self):
         r = Range().add("AA")
         dead = [Card(Rank.ACE, Suit.HEARTS)]
@@ -160,6 +160,10 @@ class TestICMAdapter:
         total = sum(a.frequency for a in adjusted.actions)
         assert abs(total - 1.0) < 0.01
 
+    def test_check_only_strategy_returned_unchanged(self):
+        node = StrategyNode(actions=[ActionFrequency("check", 1.0)])
+        assert adjust_for_icm(node, 0.5) is node
+
 
 class TestDecisionMakerWithSolver:
     def test_solver_none_works_as_before(self):
@@ -2,6 +2,7 @@
 
 import json
 import pytest
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -81,6 +82,13 @@ class TestIsAvailable:
         b = TexasSolverBridge(config)
         assert b.is_available() is False
 
+    def test_availability_checked_once(self, bridge, config):
+        assert bridge.is_available() is True
+        config.binary_path.unlink()
+        assert bridge.is_available() is True
+        assert bridge.refresh_availability() is False
+        assert bridge.is_available() is False
+
 
 # ---------------------------------------------------------------------------
 # Input file generation
@@ -91,7 +99,9 @@ class TestInputFileGeneration:
     def test_input_file_contains_pot(self, bridge, solver_input, tmp_path):
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, solver_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(solver_input),
+        )
 
         content = input_path.read_text()
         assert "set_pot 50" in content
@@ -99,7 +109,9 @@ class TestInputFileGeneration:
     def test_input_file_contains_stack(self, bridge, solver_input):
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, solver_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(solver_input),
+        )
 
         content = input_path.read_text()
         assert "set_effective_stack 200" in content
@@ -107,7 +119,9 @@ class TestInputFileGeneration:
     def test_input_file_contains_board(self, bridge, solver_input):
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, solver_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(solver_input),
+        )
 
         content = input_path.read_text()
         assert "set_board" in content
@@ -115,7 +129,9 @@ class TestInputFileGeneration:
     def test_input_file_contains_ranges(self, bridge, solver_input):
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, solver_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(solver_input),
+        )
 
         content = input_path.read_text()
         assert "set_range_ip AA,KK,QQ,AKs" in content
@@ -124,7 +140,9 @@ class TestInputFileGeneration:
     def test_input_file_contains_bet_sizes(self, bridge, solver_input):
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, solver_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(solver_input),
+        )
 
         content = input_path.read_text()
         # Flop bet sizes should be present
@@ -135,7 +153,9 @@ class TestInputFileGeneration:
         """Flop input should include flop, turn, and river bet sizes."""
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, solver_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(solver_input),
+        )
 
         content = input_path.read_text()
         assert "flop,bet" in content
@@ -156,7 +176,9 @@ class TestInputFileGeneration:
         )
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, turn_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(turn_input),
+        )
 
         content = input_path.read_text()
         assert "flop,bet" not in content
@@ -166,7 +188,9 @@ class TestInputFileGeneration:
     def test_input_file_contains_solver_commands(self, bridge, solver_input):
         input_path = bridge._work_dir / "input.txt"
         output_path = bridge._work_dir / "output.json"
-        bridge._write_input_file(input_path, output_path, solver_input)
+        bridge._write_input_file(
+            input_path, output_path, bridge._spot_commands(solver_input),
+        )
 
         content = input_path.read_text()
         assert "build_tree" in content
@@ -174,6 +198,7 @@ class TestInputFileGeneration:
         assert "dump_result" in content
         assert "set_allin_threshold 0.67" in content
         assert "set_use_isomorphism 1" in content
+        assert "set_thread_num 4" in content
 
 
 # ---------------------------------------------------------------------------
@@ -258,6 +283,26 @@ class TestOutputParsing:
         assert "raise" in result.hero_strategy
         assert abs(result.hero_ev - 4.0) < 0.001
 
+    def test_child_nodes_do_not_affect_root_strategy(self, bridge, solver_input):
+        output_path = bridge._work_dir / "output_result.json"
+        child = {
+            "actions": ["fold", "call"],
+            "strategy": {"AhKh": [1.0, 0.0]},
+            "ev": {"AhKh": -1.0},
+        }
+        data = {
+            "actions": ["check", "bet 50"],
+            "childrens": {"BET 50": child, "CHECK": {"childrens": {"X": child}}},
+            "strategy": {"AhKh": [0.40, 0.60]},
+            "ev": {"AhKh": 2.5},
+            "exploitability": 0.10,
+        }
+        output_path.write_text(json.dumps(data))
+        result = bridge._parse_output(output_path, solver_input)
+        assert result.hero_strategy == {"check": 0.40, "raise": 0.60}
+        assert abs(result.hero_ev - 2.5) < 0.001
+        assert abs(result.exploitability - 0.10) < 0.001
+
 
 # ---------------------------------------------------------------------------
 # Action name mapping
@@ -311,32 +356,65 @@ class TestHandKey:
 # ---------------------------------------------------------------------------
 
 
-class TestSolveSubprocess:
-    def test_timeout_raises_solver_error(self, bridge, solver_input):
-        import subprocess
+def _popen(returncode=0, write=None):
+    """Stand-in for subprocess.Popen; write(cwd, stderr) runs at spawn."""
+    def fake_popen(*args, cwd, stderr, **kwargs):
+        if write is not None:
+            write(Path(cwd), stderr)
+        return MagicMock(poll=MagicMock(return_value=returncode))
+    return fake_popen
+
+
+def _writes_output(data):
+    def write(cwd, stderr):
+        (cwd / "output_result.json").write_text(json.dumps(data))
+    return write
 
-        with patch("poker_bot.solver.external.texas_solver.subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(
-                cmd="solver", timeout=30,
-            )
+
+class TestSolveSubprocess:
+    def test_timeout_raises_solver_error(self, config, solver_input):
+        bridge = TexasSolverBridge(replace(config, max_solve_seconds=0))
+        proc = MagicMock(poll=MagicMock(return_value=None))
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            return_value=proc,
+        ):
             with pytest.raises(SolverError, match="timed out"):
                 bridge.solve(solver_input)
+        proc.kill.assert_called_once()
 
     def test_nonzero_exit_raises_solver_error(self, bridge, solver_input):
-        with patch("poker_bot.solver.external.texas_solver.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stderr="segfault")
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            side_effect=_popen(returncode=1),
+        ):
             with pytest.raises(SolverError, match="exited with code 1"):
                 bridge.solve(solver_input)
 
+    def test_nonzero_exit_reports_stderr_tail(self, bridge, solver_input):
+        def write(cwd, stderr):
+            stderr.write(b"x" * 1000 + b"segfault")
+
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            side_effect=_popen(returncode=1, write=write),
+        ):
+            with pytest.raises(SolverError) as exc_info:
+                bridge.solve(solver_input)
+        tail = str(exc_info.value).split(": ", 1)[1]
+        assert tail == "x" * 492 + "segfault"
+
     def test_missing_binary_raises_solver_error(self, bridge, solver_input):
-        with patch("poker_bot.solver.external.texas_solver.subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("No such file")
+        with patch("poker_bot.solver.external.texas_solver.subprocess.Popen") as mock_popen:
+            mock_popen.side_effect = FileNotFoundError("No such file")
             with pytest.raises(SolverError, match="binary not found"):
                 bridge.solve(solver_input)
 
     def test_missing_output_raises_solver_error(self, bridge, solver_input):
-        with patch("poker_bot.solver.external.texas_solver.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stderr="")
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            side_effect=_popen(),
+        ):
             # Don't create the output file
             with pytest.raises(SolverError, match="did not produce"):
                 bridge.solve(solver_input)
@@ -350,13 +428,10 @@ class TestSolveSubprocess:
             "exploitability": 0.25,
         }
 
-        def fake_run(*args, **kwargs):
-            # Write the canned output file
-            output_path = bridge._work_dir / "output_result.json"
-            output_path.write_text(json.dumps(output_data))
-            return MagicMock(returncode=0, stderr="")
-
-        with patch("poker_bot.solver.external.texas_solver.subprocess.run", side_effect=fake_run):
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            side_effect=_popen(write=_writes_output(output_data)),
+        ):
             result = bridge.solve(solver_input)
 
         assert result.converged is True
@@ -364,6 +439,109 @@ class TestSolveSubprocess:
         assert abs(result.hero_strategy["raise"] - 0.60) < 0.001
         assert abs(result.hero_ev - 4.5) < 0.001
 
+    def test_output_parsed_before_solver_exits(self, bridge, solver_input):
+        """A finished output is returned while the solver is still tearing down."""
+        output_data = {
+            "actions": ["check", "bet 50"],
+            "strategy": {"AhKh": [0.30, 0.70]},
+            "ev": {"AhKh": 4.0},
+        }
+        output_path = bridge._work_dir / "output_result.json"
+        text = json.dumps(output_data)
+        writes = iter([text[:20], text, text])
+
+        def poll():
+            # Each poll sees the file grow until it is complete; the
+            # process itself never reports an exit
+            output_path.write_text(next(writes, text))
+            return None
+
+        proc = MagicMock(poll=poll)
+        proc.wait.return_value = 0
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            return_value=proc,
+        ):
+            result = bridge.solve(solver_input)
+
+        assert abs(result.hero_strategy["raise"] - 0.70) < 0.001
+        proc.kill.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+class TestResultCache:
+    _OUTPUT = {
+        "actions": ["check", "bet 50"],
+        "strategy": {"AhKh": [0.30, 0.70], "QdQc": [0.90, 0.10]},
+        "ev": {"AhKh": 4.0, "QdQc": 1.5},
+    }
+
+    def _solve(self, bridge, solver_input):
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            side_effect=_popen(write=_writes_output(self._OUTPUT)),
+        ) as mock_popen:
+            result = bridge.solve(solver_input)
+        return result, mock_popen.call_count
+
+    def test_same_spot_other_hand_skips_solver(self, bridge, solver_input):
+        _, calls = self._solve(bridge, solver_input)
+        assert calls == 1
+
+        other = replace(solver_input, hero_cards=_cards("Qd Qc"))
+        result, calls = self._solve(bridge, other)
+        assert calls == 0
+        assert abs(result.hero_strategy["check"] - 0.90) < 0.001
+        assert abs(result.hero_ev - 1.5) < 0.001
+
+    def test_different_spot_resolves(self, bridge, solver_input):
+        self._solve(bridge, solver_input)
+        _, calls = self._solve(bridge, replace(solver_input, pot=80.0))
+        assert calls == 1
+
+    def test_cache_dir_persists_across_bridges(self, config, solver_input, tmp_path):
+        config = replace(config, cache_dir=tmp_path / "cache")
+        _, calls = self._solve(TexasSolverBridge(config), solver_input)
+        assert calls == 1
+
+        result, calls = self._solve(TexasSolverBridge(config), solver_input)
+        assert calls == 0
+        assert abs(result.hero_strategy["raise"] - 0.70) < 0.001
+
+    def test_cache_shared_across_thread_counts(self, config, solver_input, tmp_path):
+        config = replace(config, cache_dir=tmp_path / "cache")
+        _, calls = self._solve(TexasSolverBridge(config), solver_input)
+        assert calls == 1
+
+        other = TexasSolverBridge(replace(config, thread_count=16))
+        _, calls = self._solve(other, solver_input)
+        assert calls == 0
+        assert list((tmp_path / "cache").glob("*.tmp")) == []
+
+    def test_solve_many_runs_each_spot_once(self, bridge, solver_input):
+        other_hand = replace(solver_input, hero_cards=_cards("Qd Qc"))
+        other_spot = replace(solver_input, pot=80.0)
+        with patch(
+            "poker_bot.solver.external.texas_solver.subprocess.Popen",
+            side_effect=_popen(write=_writes_output(self._OUTPUT)),
+        ) as mock_popen:
+            results = bridge.solve_many([solver_input, other_hand, other_spot])
+
+        assert mock_popen.call_count == 2
+        assert abs(results[0].hero_ev - 4.0) < 0.001
+        assert abs(results[1].hero_ev - 1.5) < 0.001
+        assert abs(results[2].hero_ev - 4.0) < 0.001
+
+    def test_disk_cache_trimmed_to_max_bytes(self, config, solver_input, tmp_path):
+        cache_dir = tmp_path / "cache"
+        bridge = TexasSolverBridge(replace(config, cache_dir=cache_dir, max_cache_bytes=1))
+        self._solve(bridge, solver_input)
+        assert list(cache_dir.glob("*.json")) == []
+
 
 # ---------------------------------------------------------------------------
 # Cleanup
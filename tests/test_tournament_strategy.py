@@ -153,6 +153,19 @@ class TestSurvivalPremium:
         )
         assert survival_premium(bubble_big) > survival_premium(bubble_avg)
 
+    def test_tracks_context_changes(self) -> None:
+        ctx = GameContext.tournament(
+            stack_bb=30,
+            phase=TournamentPhase.BUBBLE,
+            players_remaining=10,
+            average_stack_bb=30,
+        )
+        before = survival_premium(ctx)
+        ctx.stack_depth_bb = 10
+        assert survival_premium(ctx) < before
+        ctx.stack_depth_bb = 30
+        assert survival_premium(ctx) == before
+
 
 class TestTournamentRangeAdjustment:
     def test_early_tournament_similar_to_cash(self) -> None: